@@ -64,6 +64,10 @@ class BitMask:
             List of bit descriptions
         max_value (int):
             The maximum valid bitmask value given the number of bits.
+        bit_values (dict):
+            A dictionary with the bit name and the integer value with only
+            that bit turned on, provided with the minimum unsigned type
+            that can hold all the bits (see :func:`minimum_dtype`).
     """
     prefix = 'BIT'
     version = None
@@ -96,6 +100,20 @@ class BitMask:
         self.bits = { k:i for i,k in enumerate(_keys) }
         self.max_value = (1 << self.nbits)-1
         self.descr = _descr
+        # Smallest signed and unsigned integer types that can hold all the
+        # bits; see :func:`minimum_dtype`
+        if self.nbits < 8:
+            self._min_dtype = (numpy.int16, numpy.uint8)
+        elif self.nbits < 16:
+            self._min_dtype = (numpy.int16, numpy.uint16)
+        elif self.nbits < 32:
+            self._min_dtype = (numpy.int32, numpy.uint32)
+        else:
+            self._min_dtype = (numpy.int64, numpy.uint64)
+        # Pre-shifted values of each bit, such that a flag can be turned on
+        # in an array directly; e.g., numpy.bitwise_or(mask,
+        # self.bit_values['BPM'], out=mask, where=indx)
+        self.bit_values = { k:self._min_dtype[1](1 << i) for k,i in self.bits.items() }
         
     def _prep_flags(self, flag):
         """Prep the flags for use."""
@@ -212,14 +230,10 @@ class BitMask:
             uses int16 if the number of bits is less than 8 and
             asuint=False because of issue astropy.io.fits has writing
             int8 values.
+
+        The types are determined when the object is instantiated.
         """
-        if self.nbits < 8:
-            return numpy.uint8 if asuint else numpy.int16
-        if self.nbits < 16:
-            return numpy.uint16 if asuint else numpy.int16
-        if self.nbits < 32:
-            return numpy.uint32 if asuint else numpy.int32
-        return numpy.uint64 if asuint else numpy.int64
+        return self._min_dtype[1] if asuint else self._min_dtype[0]
 
     def flagged(self, value, flag=None):
         """
@@ -785,11 +785,14 @@ class Calibrations:
         """
         Run full the full recipe of calibration steps.
         """
+        # Resolve the methods for all the steps first, such that an invalid
+        # step is caught before any of the calibrations are run
+        step_methods = [(f'get_{step}', getattr(self, f'get_{step}')) for step in self.steps]
         self.success = True
-        for step in self.steps:
-            getattr(self, f'get_{step}')()
+        for name, method in step_methods:
+            method()
             if not self.success:
-                self.failed_step = f'get_{step}'
+                self.failed_step = name
                 return
         msgs.info("Calibration complete!")
         msgs.info("#######################################################################")
@@ -140,7 +140,7 @@ class CoAdd1D:
         # Generate the DataContainer
         onespec = OneSpec(self.wave_coadd[wave_gpm], self.flux_coadd[wave_gpm],
                           PYP_SPEC=self.spectrograph.name, ivar=self.ivar_coadd[wave_gpm],
-                          mask=self.gpm_coadd[wave_gpm].astype(int),
+                          mask=self.gpm_coadd[wave_gpm].astype(np.uint8),
                           ext_mode=self.par['ex_value'], fluxed=self.par['flux_value'])
         onespec.head0 = self.header
 
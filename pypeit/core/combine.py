@@ -6,12 +6,121 @@ import numpy as np
 
 from astropy import stats
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 from pypeit import msgs
 from pypeit import utils
 
 from IPython import embed
 
 
+if njit is None:
+    def _weighted_stack_sum(stack, weights, gpm, power):
+        """
+        Return the sum over the first axis of ``stack*(weights*gpm)**power``.
+        """
+        return np.sum(stack * (weights*gpm.astype(float))**power, axis=0)
+else:
+    @njit(parallel=True, cache=True)
+    def _weighted_stack_sum(stack, weights, gpm, power):
+        """
+        Return the sum over the first axis of ``stack*(weights*gpm)**power``.
+
+        The sum is accumulated pixel by pixel, streaming through the images
+        in the stack, such that no temporary arrays with the shape of the
+        stack are created.
+        """
+        nimgs, nspec, nspat = stack.shape
+        out = np.empty((nspec, nspat), dtype=np.float64)
+        for i in prange(nspec):
+            for j in range(nspat):
+                s = 0.0
+                for k in range(nimgs):
+                    w = weights[k,i,j] * gpm[k,i,j]
+                    if power == 2:
+                        w = w * w
+                    s += stack[k,i,j] * w
+                out[i,j] = s
+        return out
+
+
+if njit is None:
+    _sigma_clip_stack = None
+else:
+    @njit(cache=True)
+    def _sorted_median(a, n):
+        """
+        Sort the first ``n`` elements of ``a`` in place and return their
+        median.  An insertion sort is used because ``n`` (the number of
+        images in a stack) is small.
+        """
+        for i in range(1, n):
+            v = a[i]
+            j = i - 1
+            while j >= 0 and a[j] > v:
+                a[j+1] = a[j]
+                j -= 1
+            a[j+1] = v
+        h = n // 2
+        return a[h] if n % 2 == 1 else (a[h-1] + a[h]) / 2
+
+    @njit(parallel=True, cache=True)
+    def _sigma_clip_stack(stack, gpm, sigrej, maxiters):
+        """
+        Sigma-clip an image stack along its first axis.
+
+        This is a pixel-by-pixel equivalent of using
+        `astropy.stats.SigmaClip`_ with ``cenfunc='median'`` and
+        ``stdfunc=utils.nan_mad_std``; i.e., values are rejected if they
+        are further than ``sigrej`` times the median absolute deviation
+        (scaled to a standard deviation) from the median.  Masked and
+        non-finite values are ignored.
+
+        Returns the good-pixel mask after the clipping.
+        """
+        nimgs, nspec, nspat = stack.shape
+        out = np.zeros(stack.shape, dtype=np.bool_)
+        for i in prange(nspec):
+            vals = np.empty(nimgs, dtype=np.float64)
+            work = np.empty(nimgs, dtype=np.float64)
+            indx = np.empty(nimgs, dtype=np.int64)
+            for j in range(nspat):
+                # Collect the unmasked values
+                n = 0
+                for k in range(nimgs):
+                    if gpm[k,i,j] and np.isfinite(stack[k,i,j]):
+                        vals[n] = stack[k,i,j]
+                        indx[n] = k
+                        n += 1
+                for it in range(maxiters):
+                    if n == 0:
+                        break
+                    for k in range(n):
+                        work[k] = vals[k]
+                    cen = _sorted_median(work, n)
+                    for k in range(n):
+                        work[k] = abs(vals[k] - cen)
+                    std = _sorted_median(work, n) * 1.482602218505602
+                    lower = cen - std * sigrej
+                    upper = cen + std * sigrej
+                    # Keep only the values within the bounds
+                    m = 0
+                    for k in range(n):
+                        if vals[k] >= lower and vals[k] <= upper:
+                            vals[m] = vals[k]
+                            indx[m] = indx[k]
+                            m += 1
+                    if m == n:
+                        break
+                    n = m
+                for k in range(n):
+                    out[indx[k],i,j] = True
+        return out
+
+
 def masked_weightmean(a, maskvalue):
     """
     .. todo::
@@ -163,12 +272,22 @@ def weighted_combine(weights, sci_list, var_list, inmask_stack,
             else:
                 sigrej = 2.0
         # sigma clip if we have enough images
-        # mask_stack > 0 is a masked value. numpy masked arrays are True for masked (bad) values
-        data = np.ma.MaskedArray(sigma_clip_stack, mask=np.logical_not(inmask_stack))
-        sigclip = stats.SigmaClip(sigma=sigrej, maxiters=maxiters, cenfunc='median',
-                                  stdfunc=utils.nan_mad_std)
-        data_clipped, lower, upper = sigclip(data, axis=0, masked=True, return_bounds=True)
-        mask_stack = np.logical_not(data_clipped.mask)  # mask_stack = True are good values
+        if _sigma_clip_stack is None:
+            # mask_stack > 0 is a masked value. numpy masked arrays are True for masked (bad) values
+            data = np.ma.MaskedArray(sigma_clip_stack, mask=np.logical_not(inmask_stack))
+            sigclip = stats.SigmaClip(sigma=sigrej, maxiters=maxiters, cenfunc='median',
+                                      stdfunc=utils.nan_mad_std)
+            data_clipped, lower, upper = sigclip(data, axis=0, masked=True, return_bounds=True)
+            mask_stack = np.logical_not(data_clipped.mask)  # mask_stack = True are good values
+        else:
+            # Use the compiled, pixel-by-pixel equivalent.  Each iteration
+            # rejects at least one value or ends the clipping, such that
+            # nimgs iterations is equivalent to iterating until convergence.
+            _maxiters = nimgs if maxiters is None else min(maxiters, nimgs)
+            _shape = (nimgs, img_shape[0], -1)
+            mask_stack = _sigma_clip_stack(sigma_clip_stack.reshape(_shape).astype(float, copy=False),
+                                           inmask_stack.reshape(_shape), float(sigrej),
+                                           _maxiters).reshape(shape)
     else:
         if sigma_clip and nimgs < 3:
             msgs.warn('Sigma clipping requested, but you cannot sigma clip with less than 3 '
@@ -177,18 +296,26 @@ def weighted_combine(weights, sci_list, var_list, inmask_stack,
 
     nused = np.sum(mask_stack, axis=0)
     weights_stack = broadcast_weights(weights, shape)
-    weights_mask_stack = weights_stack*mask_stack.astype(float)
 
-    weights_sum = np.sum(weights_mask_stack, axis=0)
+    # The weighted sums are computed for 3D stacks, so add a dimension for
+    # stacks of 1D spectra
+    _shape = (nimgs, img_shape[0], -1)
+    _weights = weights_stack.reshape(_shape)
+    _mask = mask_stack.reshape(_shape)
+    weights_sum = _weighted_stack_sum(np.broadcast_to(1., _weights.shape), _weights, _mask,
+                                      1).reshape(img_shape)
     inv_w_sum = 1./(weights_sum + (weights_sum == 0.0))
     sci_list_out = []
     for sci_stack in sci_list:
-        sci_list_out.append(np.sum(sci_stack * weights_mask_stack, axis=0) * inv_w_sum)
+        sci_list_out.append(_weighted_stack_sum(sci_stack.reshape(_shape), _weights, _mask,
+                                                1).reshape(img_shape) * inv_w_sum)
     var_list_out = []
     for var_stack in var_list:
-        var_list_out.append(np.sum(var_stack * weights_mask_stack**2, axis=0) * inv_w_sum**2)
-    # Was it masked everywhere?
-    gpm = np.any(mask_stack, axis=0)
+        var_list_out.append(_weighted_stack_sum(var_stack.reshape(_shape), _weights, _mask,
+                                                2).reshape(img_shape) * inv_w_sum**2)
+    # Was it masked everywhere?  NOTE: This uses the number of images used,
+    # instead of another pass through the full mask stack.
+    gpm = nused > 0
 
     return sci_list_out, var_list_out, gpm, nused
 
@@ -255,7 +382,10 @@ def broadcast_weights(weights, shape):
             (nimgs, nspec, nspat) for 2d spectrum images
 
     Returns:
-        np.ndarray:
+        np.ndarray: The weights with the shape of the image stack.  To avoid
+        allocating a full stack of (repeated) weights, this is a read-only
+        broadcast view of ``weights`` unless ``weights`` already has the
+        required shape.
 
     """
     # Create the weights stack images from the wavelength dependent weights, i.e. propagate these
@@ -263,9 +393,9 @@ def broadcast_weights(weights, shape):
     if weights.ndim == 1:
         # One float per image
         if len(shape) == 2:
-            weights_stack = np.einsum('i,ij->ij', weights, np.ones(shape))
+            weights_stack = np.broadcast_to(weights[:,None], shape)
         elif len(shape) == 3:
-            weights_stack = np.einsum('i,ijk->ijk', weights, np.ones(shape))
+            weights_stack = np.broadcast_to(weights[:,None,None], shape)
         else:
             msgs.error('Image shape is not supported')
     elif weights.ndim == 2:
@@ -275,7 +405,7 @@ def broadcast_weights(weights, shape):
                 msgs.error('The shape of weights does not match the shape of the image stack')
             weights_stack = weights
         elif len(shape) == 3:
-            weights_stack = np.einsum('ij,k->ijk', weights, np.ones(shape[2]))
+            weights_stack = np.broadcast_to(weights[:,:,None], shape)
     elif weights.ndim == 3:
         # Full image stack of weights
         if weights.shape != shape:
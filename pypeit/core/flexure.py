@@ -909,7 +909,7 @@ class MultiSlitFlexure(DataContainer):
         """
         # Cut on S/N
         good_SN = self['SN'] > self.flex_par['multi_min_SN']
-        good_slit = np.sum(good_SN, axis=0) == self.ndet
+        good_slit = np.all(good_SN, axis=0)
 
         # Basic stats
         mu =  np.median(self['indiv_fit_slope'][good_slit])
@@ -27,7 +27,10 @@ def lacosmic(sciframe, saturation, nonlinear, varframe=None, maxiter=1, grow=1.5
         saturation:
         nonlinear:
         varframe:
-        maxiter:
+        maxiter (int):
+            The identified cosmic rays are not replaced in the image, so
+            any value above 0 performs a single pass of the algorithm.
+            If 0, no cosmic rays are identified.
         grow:
         remove_compact_obj:
         sigclip (float):
@@ -59,7 +62,13 @@ def lacosmic(sciframe, saturation, nonlinear, varframe=None, maxiter=1, grow=1.5
     # Define the kernels
     laplkernel = np.array([[0.0, -1.0, 0.0], [-1.0, 4.0, -1.0], [0.0, -1.0, 0.0]])  # Laplacian kernal
     growkernel = np.ones((3,3))
-    for i in range(1, maxiter+1):
+    # NOTE: Unlike the original L.A.Cosmic algorithm, the cosmic rays are not
+    # replaced in the image between iterations.  Every iteration would
+    # therefore select the same pixels, and only one is performed.
+    if maxiter > 1:
+        msgs.info("Identified cosmic rays do not change between iterations; performing 1 "
+                  "instead of {0:d}".format(maxiter))
+    if maxiter > 0:
         msgs.info("Convolving image with Laplacian kernel")
         # Subsample, convolve, clip negative values, and rebin to original size
         subsam = utils.subsample(scicopy)
@@ -69,8 +78,8 @@ def lacosmic(sciframe, saturation, nonlinear, varframe=None, maxiter=1, grow=1.5
 
         msgs.info("Creating noise model")
         # Build a custom noise map, and compare  this to the laplacian
-        m5 = ndimage.filters.median_filter(scicopy, size=5, mode='mirror')
         if varframe is None:
+            m5 = ndimage.filters.median_filter(scicopy, size=5, mode='mirror')
             noise = np.sqrt(np.abs(m5))
         else:
             noise = np.sqrt(varframe)
@@ -139,20 +148,10 @@ def lacosmic(sciframe, saturation, nonlinear, varframe=None, maxiter=1, grow=1.5
             msgs.info("Masking saturated stars")
             finalsel = np.logical_and(np.logical_not(satpix), finalsel)
 
-        ncrp = np.sum(finalsel)
-
-        msgs.info("{0:5d} pixels detected as cosmics".format(ncrp))
-
-        # We find how many cosmics are not yet known :
-        newmask = np.logical_and(np.logical_not(crmask), finalsel)
-        nnew = np.sum(newmask)
-
         # We update the mask with the cosmics we have found :
-        crmask = np.logical_or(crmask, finalsel)
+        crmask = finalsel
 
-        msgs.info("Iteration {0:d} -- {1:d} pixels identified as cosmic rays ({2:d} new)".format(i, ncrp, nnew))
-        if ncrp == 0:
-            break
+        msgs.info("{0:5d} pixels detected as cosmics".format(np.sum(crmask)))
 
     # Additional algorithms (not traditionally implemented by LA cosmic) to
     # remove some false positives.
@@ -215,30 +214,33 @@ def cr_screen(a, mask_value=0.0, spatial_axis=1):
 
 
 def grow_masked(img, grow, growval):
+    """
+    Grow the pixels with a given value by a circular radius.
+
+    Args:
+        img (`numpy.ndarray`_):
+            2D image to grow.
+        grow (:obj:`float`):
+            Radius in pixels.  Any pixel within this distance of a pixel with
+            value ``growval`` is also set to ``growval``.
+        growval (:obj:`float`):
+            The value to grow.
 
-    if not np.any(img == growval):
+    Returns:
+        `numpy.ndarray`_: The grown image.  If no pixels have the value
+        ``growval``, this is the input image; otherwise, it is a copy.
+    """
+    indx = img == growval
+    if not np.any(indx):
         return img
 
-    _img = img.copy()
-    sz_x, sz_y = img.shape
+    # Circular footprint
     d = int(1+grow)
-    rsqr = grow*grow
+    x, y = np.meshgrid(np.arange(-d, d+1), np.arange(-d, d+1), indexing='ij')
+    footprint = x*x + y*y <= grow*grow
 
-    # Grow any masked values by the specified amount
-    for x in range(sz_x):
-        for y in range(sz_y):
-            if img[x,y] != growval:
-                continue
-
-            mnx = 0 if x-d < 0 else x-d
-            mxx = x+d+1 if x+d+1 < sz_x else sz_x
-            mny = 0 if y-d < 0 else y-d
-            mxy = y+d+1 if y+d+1 < sz_y else sz_y
-
-            for i in range(mnx,mxx):
-                for j in range(mny, mxy):
-                    if (i-x)*(i-x)+(j-y)*(j-y) <= rsqr:
-                        _img[i,j] = growval
+    _img = img.copy()
+    _img[ndimage.binary_dilation(indx, structure=footprint)] = growval
     return _img
 
 
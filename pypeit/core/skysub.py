@@ -105,10 +105,6 @@ def global_skysub(image, ivar, tilts, thismask, slit_left, slit_righ, inmask=Non
     # routine would save time. But this is pretty fast, so we just do it here to make the interface simpler.
     ximg, edgmask = pixels.ximg_and_edgemask(slit_left, slit_righ, thismask, trim_edg=trim_edg)
 
-    # TESTING!!!!
-    #no_poly=True
-    #show_fit=True
-
     # Init
     (nspec, nspat) = image.shape
     piximg = tilts * (nspec-1)
@@ -1193,9 +1189,10 @@ def ech_local_skysub_extract(sciimg, sciivar, fullmask, tilts, waveimg, global_s
 
     # Set the bit for pixels which were masked by the extraction.
     # For extractmask, True = Good, False = Bad
-    iextract = (fullmask == 0) & (extractmask == False)
+    iextract = (fullmask == 0) & np.logical_not(extractmask)
     # Undefined inverse variances
-    outmask[iextract] = bitmask.turn_on(outmask[iextract], 'EXTRACT')
+    np.bitwise_or(outmask, bitmask.bit_values['EXTRACT'], out=outmask,
+                  where=iextract)
 
     # Return
     return skymodel, objmodel, ivarmodel, outmask, sobjs
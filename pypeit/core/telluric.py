@@ -686,7 +686,7 @@ def save_coadd1d_tofits(outfile, wave, flux, ivar, gpm, spectrograph=None, tellu
     """
     wave_gpm = wave > 1.0
     spec = onespec.OneSpec(wave[wave_gpm], flux[wave_gpm], PYP_SPEC=spectrograph,
-                           ivar=ivar[wave_gpm], mask=gpm[wave_gpm].astype(int),
+                           ivar=ivar[wave_gpm], mask=gpm[wave_gpm].astype(np.uint8),
                            telluric=None if telluric is None else telluric[wave_gpm],
                            obj_model=None if obj_model is None else obj_model[wave_gpm],
                            ext_mode=ex_value, fluxed=True)
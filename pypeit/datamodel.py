@@ -1061,12 +1061,14 @@ class DataContainer:
         # Two annoying hacks:
         #   - Hack to expunge charray which are basically deprecated and
         #     cause trouble.
-        #   - Hack to force native byte ordering
+        #   - Hack to force native byte ordering.  Arrays that are
+        #     already native (e.g., single-byte types) are not copied.
         for key in _d:
             if isinstance(_d[key], np.chararray):
                 _d[key] = np.asarray(_d[key])
-            elif isinstance(_d[key], np.ndarray) and _d[key].dtype.byteorder not in ['=', '|']:
-                _d[key] = _d[key].astype(_d[key].dtype.type)
+            elif isinstance(_d[key], np.ndarray) \
+                    and not _d[key].dtype.isnative and _d[key].dtype.byteorder != '|':
+                _d[key] = _d[key].astype(_d[key].dtype.newbyteorder('='), copy=False)
 
         # Return
         return _d, dm_version_passed and found_data, dm_type_passed and found_data, \
@@ -1128,7 +1130,13 @@ class DataContainer:
                             'Allowed type(s) are: {0}'.format(self.datamodel[item]['otype']))
         # Array?
         if 'atype' in self.datamodel[item].keys():
-            if not isinstance(value.flat[0], self.datamodel[item]['atype']):
+            # For anything but object arrays, the type of each element is
+            # the scalar type of the array, so there's no need to
+            # construct the element to check it.
+            atype_passed = isinstance(value.flat[0], self.datamodel[item]['atype']) \
+                                if value.dtype == object \
+                                else issubclass(value.dtype.type, self.datamodel[item]['atype'])
+            if not atype_passed:
                 raise TypeError('Wrong data type for array: {}\n'.format(item)
                                 + 'Allowed type(s) for the array are: {}'.format(
                                     self.datamodel[item]['atype']))
@@ -1382,7 +1390,7 @@ class DataContainer:
         return self
 
     def to_file(self, ofile, overwrite=False, checksum=True, primary_hdr=None, hdr=None,
-                limit_hdus=None):
+                limit_hdus=None, buffered=False):
         """
         Write the data to a file.
 
@@ -1409,10 +1417,14 @@ class DataContainer:
                 the DATASUM and CHECKSUM keywords fits header(s).
             limit_hdus (:obj:`list`, optional):
                 Passed to :func:`to_hdu`; see usage there
+            buffered (:obj:`bool`, optional):
+                Serialize the file to memory before writing it to disk;
+                see :func:`pypeit.io.write_to_fits`.
         """
         io.write_to_fits(self.to_hdu(add_primary=True, primary_hdr=primary_hdr,
                                      limit_hdus=limit_hdus, hdr=hdr),
-                         ofile, overwrite=overwrite, checksum=checksum, hdr=hdr)
+                         ofile, overwrite=overwrite, checksum=checksum, hdr=hdr,
+                         buffered=buffered)
 
     # TODO: This requires that master_key be an attribute... This
     # method is a bit too ad hoc for me...
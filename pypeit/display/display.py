@@ -472,28 +472,76 @@ def show_trace(viewer, ch, trace, trc_name='Trace', color='blue', clear=False,
             If not provided, it is assumed the input x values track y=0,1,2,3,etc.
 
     """
+    show_traces(viewer, ch, trace, trc_names=trc_name, colors=color, clear=clear,
+                rotate=rotate, pstep=pstep, yval=yval)
+
+
+def show_traces(viewer, ch, traces, trc_names='Trace', colors='blue', clear=False,
+                rotate=False, pstep=50, yval=None):
+    r"""
+    Overplot a set of traces, and their names, on the image in Ginga in the
+    given channel.
+
+    This is equivalent to calling :func:`show_trace` for each trace, but
+    the canvas is only retrieved once and the trace coordinates are
+    converted for all traces at once.  The drawing itself is not batched:
+    Ginga's remote-control interface can only add one canvas object per
+    call, so each trace still requires two calls to the viewer (one for
+    the path and one for the name).
+
+    Args:
+        viewer (ginga.util.grc.RemoteClient):
+            Ginga RC viewer
+        ch (ginga.util.grc._channel_proxy):
+            Ginga channel
+        traces (`numpy.ndarray`_):
+            x-positions on the detector. Shape must be :math:`(N_{\rm
+            spec},)` or :math:`(N_{\rm spec}, N_{\rm trace})`.
+        trc_names (:obj:`str`, array-like, optional):
+            Trace names. If a single string, the same name is used for
+            all traces. Otherwise, shape must be :math:`(N_{\rm trace},)`.
+        colors (:obj:`str`, array-like, optional):
+            Color for the traces. If a single string, the same color is
+            used for all traces. Otherwise, shape must be :math:`(N_{\rm
+            trace},)`.
+        clear (:obj:`bool`, optional):
+            Clear the canvas?
+        rotate (:obj:`bool`, optional):
+            Rotate the image?
+        pstep (:obj:`int`, optional):
+            Show every pstep point of the edges as opposed to *every* point, recommended for speed
+        yval (`numpy.ndarray`_, optional):
+            If not provided, it is assumed the input x values track y=0,1,2,3,etc.
+    """
+    _traces = traces.reshape(-1,1) if traces.ndim == 1 else traces
+    ntrc = _traces.shape[1]
+    _trc_names = [trc_names]*ntrc if isinstance(trc_names, str) else list(trc_names)
+    _colors = [colors]*ntrc if isinstance(colors, str) else list(colors)
+    if len(_trc_names) != ntrc or len(_colors) != ntrc:
+        msgs.error('Incorrect number of trace names or colors provided.')
+
     # Canvas
     canvas = viewer.canvas(ch._chname)
     if clear:
         canvas.clear()
-    # Show
-    if yval is None:
-        y = (np.arange(trace.size)[::pstep]).tolist()
-    else:
-        y = yval[::pstep].tolist()
-    trace_list = trace[::pstep].tolist()
-    xy = [trace_list, y]
-    if rotate:
-        xy[0], xy[1] = xy[1], xy[0]
-    points = list(zip(xy[0], xy[1]))
-    canvas.add(str('path'), points, color=str(color))
-    # Text
-    ohf = len(trace_list)//2
-    xyt = [float(trace_list[ohf]), float(y[ohf])]
-    if rotate:
-        xyt[0], xyt[1] = xyt[1], xyt[0]
-    # Do it
-    canvas.add(str('text'), xyt[0], xyt[1], trc_name, rot_deg=90., color=str(color), fontsize=17.)
+    # Points need to be int or float.  Use of .tolist() insures this
+    y = (np.arange(_traces.shape[0])[::pstep] if yval is None else yval[::pstep]).tolist()
+    trace_lists = _traces[::pstep].T.tolist()
+    for trace_list, trc_name, color in zip(trace_lists, _trc_names, _colors):
+        # Show
+        xy = [trace_list, y]
+        if rotate:
+            xy[0], xy[1] = xy[1], xy[0]
+        points = list(zip(xy[0], xy[1]))
+        canvas.add(str('path'), points, color=str(color))
+        # Text
+        ohf = len(trace_list)//2
+        xyt = [float(trace_list[ohf]), float(y[ohf])]
+        if rotate:
+            xyt[0], xyt[1] = xyt[1], xyt[0]
+        # Do it
+        canvas.add(str('text'), xyt[0], xyt[1], trc_name, rot_deg=90., color=str(color),
+                   fontsize=17.)
 
 
 def clear_canvas(cname):
@@ -4504,10 +4504,11 @@ class EdgeTraceSet(DataContainer):
         # The index in the objects table are found by mapping the slit
         # index of each object in the design file to the slit index
         # included in the registration
-        obj_index = utils.index_of_x_eq_y(self.slitmask.objects[:,0], maskdef_id, strict=False)
-        # if not all the element of self.slitmask.objects[obj_index,0] are equal to maskdef_id,
-        # keep only the elements that are equal (matched)
-        matched = np.where(self.slitmask.objects[obj_index,0].astype(int) == maskdef_id)[0]
+        obj_index = utils.index_of_x_eq_y(self.slitmask.objects['slitid'], maskdef_id,
+                                          strict=False)
+        # if not all the element of self.slitmask.objects['slitid'][obj_index] are equal to
+        # maskdef_id, keep only the elements that are equal (matched)
+        matched = np.where(self.slitmask.objects['slitid'][obj_index] == maskdef_id)[0]
         obj_index = obj_index[matched]
 
         # Number of objects
@@ -4515,9 +4516,11 @@ class EdgeTraceSet(DataContainer):
         # Instantiate an empty table
         self.objects = EdgeTraceSet.empty_objects_table(rows=nobj)
         # Fill the columns
-        for i,key in enumerate(['MASKDEF_ID', 'OBJID', 'OBJRA', 'OBJDEC', 'OBJNAME', 'OBJMAG', 'OBJMAG_BAND',
-                                'OBJ_TOPDIST', 'OBJ_BOTDIST']):
-            self.objects[key] = self.slitmask.objects[obj_index,i].astype(dtype=self.objects[key].dtype)
+        for key, field in zip(['MASKDEF_ID', 'OBJID', 'OBJRA', 'OBJDEC', 'OBJNAME', 'OBJMAG',
+                               'OBJMAG_BAND', 'OBJ_TOPDIST', 'OBJ_BOTDIST'],
+                              self.slitmask.objects.dtype.names):
+            self.objects[key] = self.slitmask.objects[field][obj_index].astype(
+                                        dtype=self.objects[key].dtype)
 
         # SLITINDX is the index of the slit in the `design` table, not
         # in the original slit-mask design data
@@ -84,6 +84,8 @@ class FlatImages(datamodel.DataContainer):
         # Master stuff
         self.master_key = None
         self.master_dir = None
+        # Most recent illumination flat constructed by fit2illumflat
+        self._illumflat_cache = None
 
     def _validate(self):
         #
@@ -237,6 +239,16 @@ class FlatImages(datamodel.DataContainer):
 
     def fit2illumflat(self, slits, frametype='illum', initial=False, flexure_shift=None):
         """
+        Construct the illumination flat from the spatial bspline fits.
+
+        The construction requires full-frame operations for each slit.
+        Because the same illumination flat is applied to every frame in a
+        stack of processed images, the most recent result is cached and
+        returned directly by subsequent calls with the same slits
+        (including their current mask bits), bsplines, and arguments.  The
+        returned array is therefore read-only.  Illumination flats
+        constructed with a ``flexure_shift`` are not cached, because the
+        shift is generally different for each frame.
 
         Args:
             slits (:class:`pypeit.slittrace.SlitTraceSet`):
@@ -247,12 +259,20 @@ class FlatImages(datamodel.DataContainer):
             flexure_shift (float, optional):
 
         Returns:
-
+            `numpy.ndarray`_: The (read-only) illumination flat.
         """
-        illumflat = np.ones(self.shape())
         # Load spatial bsplines
         spat_bsplines = self.get_spat_bsplines(frametype=frametype)
 
+        # Check if this has already been constructed
+        key = (frametype, initial, slits.mask.tobytes())
+        if flexure_shift is None and self._illumflat_cache is not None:
+            _key, _slits, _spat_bsplines, illumflat = self._illumflat_cache
+            if _key == key and _slits is slits and _spat_bsplines is spat_bsplines:
+                return illumflat
+
+        illumflat = np.ones(self.shape())
+
         # Loop
         for slit_idx in range(slits.nslits):
             # Skip masked
@@ -268,6 +288,11 @@ class FlatImages(datamodel.DataContainer):
                                                       flexure_shift=flexure_shift)
             illumflat[onslit] = spat_bsplines[slit_idx].value(spat_coo[onslit])[0]
         # TODO -- Update the internal one?  Or remove it altogether??
+        illumflat.flags.writeable = False
+        # NOTE: The slits and bsplines are kept with the cached image so that
+        # the identity checks above cannot be fooled by a recycled object id.
+        if flexure_shift is None:
+            self._illumflat_cache = (key, slits, spat_bsplines, illumflat)
         return illumflat
 
     def show(self, frametype='all', slits=None, wcs_match=True):
@@ -180,7 +180,8 @@ def buildimage_fromlist(spectrograph, det, frame_par, file_list, bias=None, bpm=
                                    sigma_clip=frame_par['process']['clip'],
                                    sigrej=frame_par['process']['comb_sigrej'], maxiters=maxiters,
                                    ignore_saturation=ignore_saturation, slits=slits,
-                                   combine_method=frame_par['process']['combine'])
+                                   combine_method=frame_par['process']['combine'],
+                                   nproc=frame_par['process']['nproc'])
 
     # Decorate according to the type of calibration, primarily as needed for
     # handling MasterFrames.  WARNING: Any internals (i.e., the ones defined by
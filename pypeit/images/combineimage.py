@@ -5,6 +5,10 @@
 """
 
 import os
+import contextlib
+import functools
+import multiprocessing
+from concurrent import futures
 
 from IPython import embed
 
@@ -19,6 +23,35 @@ from pypeit.images import pypeitimage
 from pypeit.images import rawimage
 from pypeit.images import imagebitmask
 
+def process_one(spectrograph, det, par, ifile, bias=None, bpm=None, dark=None,
+                flatimages=None, slits=None):
+    """
+    Load and process a single raw image.
+
+    This is a module-level function (instead of a method of
+    :class:`CombineImage`) so that it can be executed by a pool of worker
+    processes; see :func:`CombineImage.run`.
+
+    Args:
+        spectrograph (:class:`~pypeit.spectrographs.spectrograph.Spectrograph`):
+            Spectrograph used to take the data.
+        det (:obj:`int`):
+            The 1-indexed detector number to process.
+        par (:class:`~pypeit.par.pypeitpar.ProcessImagesPar`):
+            Parameters that dictate the processing of the image.
+        ifile (:obj:`str`):
+            Raw file to process.
+        bias, bpm, dark, flatimages, slits (optional):
+            Passed directly to :func:`~pypeit.images.rawimage.RawImage.process`.
+
+    Returns:
+        :class:`~pypeit.images.pypeitimage.PypeItImage`: The processed image.
+    """
+    rawImage = rawimage.RawImage(ifile, spectrograph, det)
+    return rawImage.process(par, bias=bias, bpm=bpm, dark=dark, flatimages=flatimages,
+                            slits=slits)
+
+
 class CombineImage:
     """
     Process and combine detector images.
@@ -61,7 +94,8 @@ class CombineImage:
             msgs.error('CombineImage requires a list of files to instantiate')
 
     def run(self, bias=None, flatimages=None, ignore_saturation=False, sigma_clip=True,
-            bpm=None, sigrej=None, maxiters=5, slits=None, dark=None, combine_method='mean'):
+            bpm=None, sigrej=None, maxiters=5, slits=None, dark=None, combine_method='mean',
+            nproc=1):
         r"""
         Process and combine all images.
 
@@ -170,6 +204,16 @@ class CombineImage:
             combine_method (str):
                 Method used to combine images.  Must be ``'mean'`` or
                 ``'median'``; see above.
+            nproc (:obj:`int`, optional):
+                Number of worker processes used to process the files.  If 1,
+                the files are processed serially.  Otherwise, up to
+                ``nproc`` files are processed simultaneously, each in a
+                separate process; the stacks used for the combination are
+                the same regardless of the number of processes.  Each
+                worker receives its own (pickled) copy of the calibrations,
+                including ``flatimages``, so illumination flats constructed
+                by :func:`~pypeit.flatfield.FlatImages.fit2illumflat` are
+                not shared between the workers or with the calling process.
 
         Returns:
             :class:`~pypeit.images.pypeitimage.PypeItImage`: The combination of
@@ -188,60 +232,74 @@ class CombineImage:
         if bpm is None:
             bpm = self.spectrograph.bpm(self.files[0], self.det)
 
-        # Loop on the files
-        for kk, ifile in enumerate(self.files):
-            # Load raw image
-            rawImage = rawimage.RawImage(ifile, self.spectrograph, self.det)
-            # Process
-            pypeitImage = rawImage.process(self.par, bias=bias, bpm=bpm, dark=dark,
-                                           flatimages=flatimages, slits=slits)
-            if self.nfiles == 1:
-                # Only 1 file, so we're done
-                return pypeitImage
-            elif kk == 0:
-                # Allocate arrays to collect data for each frame
-                shape = (self.nfiles,) + pypeitImage.shape
-                img_stack = np.zeros(shape, dtype=float)
-                scl_stack = np.ones(shape, dtype=float)
-#                ivar_stack= np.ones(shape, dtype=float)
-                rn2img_stack = np.zeros(shape, dtype=float)
-                basev_stack = np.zeros(shape, dtype=float)
-#                crmask_stack = np.zeros(shape, dtype=bool)
-                gpm_stack = np.zeros(shape, dtype=bool)
-                lampstat = [None]*self.nfiles
-                darkcurr = np.zeros(self.nfiles, dtype=float)
-                exptime = np.zeros(self.nfiles, dtype=float)
-
-            # Save the lamp status
-            lampstat[kk] = self.spectrograph.get_lamps_status(pypeitImage.rawheadlist)
-            # Save the dark current and exposure time
-            darkcurr[kk] = pypeitImage.detector['darkcurr']
-            exptime[kk] = pypeitImage.exptime
-            # Processed image
-            img_stack[kk] = pypeitImage.image
-#            # Construct raw variance image and turn into inverse variance
-#            if pypeitImage.ivar is not None:
-#                ivar_stack[kk] = pypeitImage.ivar
-#            # Mask cosmic rays
-#            if pypeitImage.crmask is not None:
-#                crmask_stack[kk] = pypeitImage.crmask
-            # Get the count scaling
-            if pypeitImage.img_scale is not None:
-                scl_stack[kk] = pypeitImage.img_scale
-            # Read noise squared image
-            if pypeitImage.rn2img is not None:
-                rn2img_stack[kk] = pypeitImage.rn2img * scl_stack[kk]**2
-            # Processing variance image
-            if pypeitImage.base_var is not None:
-                basev_stack[kk] = pypeitImage.base_var * scl_stack[kk]**2
-            # Final mask for this image
-            # TODO: This seems kludgy to me. Why not just pass ignore_saturation
-            # to process_one and ignore the saturation when the mask is actually
-            # built, rather than untoggling the bit here?
-            if ignore_saturation:  # Important for calibrations as we don't want replacement by 0
-                pypeitImage.update_mask('SATURATION', action='turn_off')
-            # Get a simple boolean good-pixel mask for all the unmasked pixels
-            gpm_stack[kk] = pypeitImage.select_flag(invert=True)
+        # Process the files.  Processing is done serially by default;
+        # otherwise, the files are distributed to a pool of worker processes,
+        # and the processed images are collected in the order of the files.
+        process = functools.partial(process_one, self.spectrograph, self.det, self.par,
+                                    bias=bias, bpm=bpm, dark=dark, flatimages=flatimages,
+                                    slits=slits)
+        if self.nfiles == 1:
+            # Only 1 file, so we're done
+            return process(self.files[0])
+
+        with contextlib.ExitStack() as stack:
+            if nproc > 1:
+                # NOTE: Worker processes are spawned, not forked, because
+                # forking a process that has already started threads (e.g.,
+                # numba's parallel kernels) can deadlock the workers.
+                executor = stack.enter_context(
+                        futures.ProcessPoolExecutor(max_workers=min(nproc, self.nfiles),
+                                                    mp_context=multiprocessing.get_context('spawn')))
+                images = executor.map(process, self.files)
+            else:
+                images = map(process, self.files)
+
+            # Loop on the processed images
+            for kk, pypeitImage in enumerate(images):
+                if kk == 0:
+                    # Allocate arrays to collect data for each frame
+                    shape = (self.nfiles,) + pypeitImage.shape
+                    img_stack = np.zeros(shape, dtype=float)
+                    scl_stack = np.ones(shape, dtype=float)
+#                    ivar_stack= np.ones(shape, dtype=float)
+                    rn2img_stack = np.zeros(shape, dtype=float)
+                    basev_stack = np.zeros(shape, dtype=float)
+#                    crmask_stack = np.zeros(shape, dtype=bool)
+                    gpm_stack = np.zeros(shape, dtype=bool)
+                    lampstat = [None]*self.nfiles
+                    darkcurr = np.zeros(self.nfiles, dtype=float)
+                    exptime = np.zeros(self.nfiles, dtype=float)
+
+                # Save the lamp status
+                lampstat[kk] = self.spectrograph.get_lamps_status(pypeitImage.rawheadlist)
+                # Save the dark current and exposure time
+                darkcurr[kk] = pypeitImage.detector['darkcurr']
+                exptime[kk] = pypeitImage.exptime
+                # Processed image
+                img_stack[kk] = pypeitImage.image
+#                # Construct raw variance image and turn into inverse variance
+#                if pypeitImage.ivar is not None:
+#                    ivar_stack[kk] = pypeitImage.ivar
+#                # Mask cosmic rays
+#                if pypeitImage.crmask is not None:
+#                    crmask_stack[kk] = pypeitImage.crmask
+                # Get the count scaling
+                if pypeitImage.img_scale is not None:
+                    scl_stack[kk] = pypeitImage.img_scale
+                # Read noise squared image
+                if pypeitImage.rn2img is not None:
+                    rn2img_stack[kk] = pypeitImage.rn2img * scl_stack[kk]**2
+                # Processing variance image
+                if pypeitImage.base_var is not None:
+                    basev_stack[kk] = pypeitImage.base_var * scl_stack[kk]**2
+                # Final mask for this image
+                # TODO: This seems kludgy to me. Why not just pass ignore_saturation
+                # to process_one and ignore the saturation when the mask is actually
+                # built, rather than untoggling the bit here?
+                if ignore_saturation:  # Important for calibrations as we don't want replacement by 0
+                    pypeitImage.update_mask('SATURATION', action='turn_off')
+                # Get a simple boolean good-pixel mask for all the unmasked pixels
+                gpm_stack[kk] = pypeitImage.select_flag(invert=True)
 
         # Check that the lamps being combined are all the same:
         if not lampstat[1:] == lampstat[:-1]:
@@ -318,8 +376,9 @@ class CombineImage:
                                           count_scale=comb_scl,
                                           noise_floor=self.par['noise_floor'])
 
-        # Build the combined image
-        comb = pypeitimage.PypeItImage(image=comb_img, ivar=utils.inverse(comb_var), nimg=nstack,
+        # Build the combined image; the variance is inverted in place
+        comb = pypeitimage.PypeItImage(image=comb_img, ivar=utils.inverse(comb_var, out=comb_var),
+                                       nimg=nstack,
                                        rn2img=comb_rn2, base_var=comb_basev, img_scale=comb_scl,
                                        # NOTE: The detector is needed here so
                                        # that we can get the dark current later.
@@ -7,6 +7,11 @@ import numpy as np
 import os
 import inspect
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 from pypeit import msgs
 from pypeit.images import detector_container, imagebitmask
 from pypeit.core import procimg
@@ -18,6 +23,52 @@ from pypeit import masterframe
 from IPython import embed
 
 
+if njit is None:
+    _flag_pixels = None
+else:
+    @njit(parallel=True, cache=True)
+    def _flag_pixels(fullmask, image, ivar, bpm, crmask, slitmask, saturation, mincounts,
+                     bits):
+        """
+        Set ``fullmask`` to the bits of all the flags set by
+        :func:`PypeItImage.build_mask`, in a single pass over the image.
+        Every pixel in ``fullmask`` is overwritten, such that it does not
+        need to be initialized.
+
+        ``bits`` provides the bit values for the BPM, CR, SATURATION,
+        MINCOUNTS, IS_NAN, IVAR0, IVAR_NAN, and OFFSLITS flags, in that order.
+        Any of ``ivar``, ``bpm``, ``crmask``, and ``slitmask`` can be None,
+        in which case the relevant flags are not set.
+        """
+        nspec, nspat = image.shape
+        for i in prange(nspec):
+            for j in range(nspat):
+                m = 0
+                if bpm is not None:
+                    if bpm[i,j]:
+                        m |= bits[0]
+                if crmask is not None:
+                    if crmask[i,j]:
+                        m |= bits[1]
+                s = image[i,j]
+                if s >= saturation:
+                    m |= bits[2]
+                if s <= mincounts:
+                    m |= bits[3]
+                if not np.isfinite(s):
+                    m |= bits[4]
+                if ivar is not None:
+                    iv = ivar[i,j]
+                    if not iv > 0.0:
+                        m |= bits[5]
+                    if not np.isfinite(iv):
+                        m |= bits[6]
+                if slitmask is not None:
+                    if slitmask[i,j] == -1:
+                        m |= bits[7]
+                fullmask[i,j] = m
+
+
 class PypeItImage(datamodel.DataContainer):
     """
     Class to hold a single image from a single detector in PypeIt
@@ -243,6 +294,9 @@ class PypeItImage(datamodel.DataContainer):
             has_cr = img.select_flag(flag='CR')
             is_saturated = img.select_flag(flag='SATURATION')
 
+        If :attr:`fullmask` already exists with the correct shape and type,
+        the array is reused and overwritten.
+
         Args:
             saturation (:obj:`float`, optional):
                 Saturation limit in counts or ADU (needs to match the input image)
@@ -254,34 +308,70 @@ class PypeItImage(datamodel.DataContainer):
         """
         _mincounts = self.detector['mincounts'] if mincounts is None else mincounts
         _saturation = self.detector['saturation'] if saturation is None else saturation
-        # Instatiate the mask
-        self.reinit_mask()
+        compiled = _flag_pixels is not None and np.ndim(_saturation) == 0 \
+                        and np.ndim(_mincounts) == 0
+
+        # Instatiate the mask, reusing the existing array if possible.  The
+        # compiled kernel sets every pixel, so the mask only needs to be
+        # initialized for the numpy calculation.
+        dtype = self.bitmask.minimum_dtype(asuint=True)
+        if self.fullmask is None or self.fullmask.shape != self.image.shape \
+                or self.fullmask.dtype != dtype:
+            self.fullmask = np.empty(self.image.shape, dtype=dtype)
+        if not compiled:
+            self.fullmask[...] = 0
+        fullmask = self.fullmask
+
+        if compiled:
+            # Set all the flags in a single pass using the compiled kernel
+            bits = np.array([self.bitmask.bit_values[flag]
+                                for flag in ['BPM', 'CR', 'SATURATION', 'MINCOUNTS', 'IS_NAN',
+                                             'IVAR0', 'IVAR_NAN', 'OFFSLITS']],
+                            dtype=fullmask.dtype)
+            _flag_pixels(fullmask, self.image, self.ivar, self.bpm, self.crmask, slitmask,
+                         float(_saturation), float(_mincounts), bits)
+            return
+
+        # All the bits are turned on in place, in a single pass over the
+        # mask for each flag.  The boolean arrays selecting the pixels to
+        # flag reuse the same buffer.
+        indx = np.empty(fullmask.shape, dtype=bool)
+        bit_values = self.bitmask.bit_values
 
         # Bad pixel mask
         if self.bpm is not None:
-            self.update_mask('BPM', indx=self.bpm.astype(bool))
+            np.bitwise_or(fullmask, bit_values['BPM'], out=fullmask,
+                          where=self.bpm.astype(bool, copy=False))
 
         # Cosmic rays
         if self.crmask is not None:
-            self.update_mask('CR', indx=self.crmask.astype(bool))
+            np.bitwise_or(fullmask, bit_values['CR'], out=fullmask,
+                          where=self.crmask.astype(bool, copy=False))
 
         # Saturated pixels
-        self.update_mask('SATURATION', indx=self.image>=_saturation)
+        np.greater_equal(self.image, _saturation, out=indx)
+        np.bitwise_or(fullmask, bit_values['SATURATION'], out=fullmask, where=indx)
 
         # Minimum counts
-        self.update_mask('MINCOUNTS', indx=self.image<=_mincounts)
+        np.less_equal(self.image, _mincounts, out=indx)
+        np.bitwise_or(fullmask, bit_values['MINCOUNTS'], out=fullmask, where=indx)
 
         # Undefined counts
-        self.update_mask('IS_NAN', indx=np.logical_not(np.isfinite(self.image)))
+        np.logical_not(np.isfinite(self.image, out=indx), out=indx)
+        np.bitwise_or(fullmask, bit_values['IS_NAN'], out=fullmask, where=indx)
 
         if self.ivar is not None:
             # Bad inverse variance values
-            self.update_mask('IVAR0', indx=np.logical_not(self.ivar > 0.0))
+            np.logical_not(np.greater(self.ivar, 0.0, out=indx), out=indx)
+            np.bitwise_or(fullmask, bit_values['IVAR0'], out=fullmask, where=indx)
             # Undefined inverse variances
-            self.update_mask('IVAR_NAN', indx=np.logical_not(np.isfinite(self.ivar)))
+            np.logical_not(np.isfinite(self.ivar, out=indx), out=indx)
+            np.bitwise_or(fullmask, bit_values['IVAR_NAN'], out=fullmask, where=indx)
 
         if slitmask is not None:
-            self.update_mask_slitmask(slitmask)
+            # Pixels excluded from any slit.
+            np.equal(slitmask, -1, out=indx)
+            np.bitwise_or(fullmask, bit_values['OFFSLITS'], out=fullmask, where=indx)
 
     def update_mask_slitmask(self, slitmask):
         """
@@ -314,7 +404,9 @@ class PypeItImage(datamodel.DataContainer):
         Update :attr:`fullmask` by operating on the bits for the provided (list
         of) flags.
 
-        This method alters :attr:`fullmask` in-place.
+        This method alters :attr:`fullmask` in-place.  When pixels are
+        selected, the bits are altered in a single pass over :attr:`fullmask`
+        without creating any temporary arrays.
 
         Args:
             flag (:obj:`str`, array-like):
@@ -333,7 +425,12 @@ class PypeItImage(datamodel.DataContainer):
             return
         if indx.shape != self.fullmask.shape:
             msgs.error('Array selecting pixels to update must be the same shape as fullmask.')
-        self.fullmask[indx] = getattr(self.bitmask, action)(self.fullmask[indx], flag)
+        # Value with the relevant bits turned on
+        bits = self.bitmask.turn_on(self.fullmask.dtype.type(0), flag)
+        if action == 'turn_on':
+            np.bitwise_or(self.fullmask, bits, out=self.fullmask, where=indx)
+        else:
+            np.bitwise_and(self.fullmask, np.invert(bits), out=self.fullmask, where=indx)
 
     def reinit_mask(self):
         """
@@ -12,6 +12,7 @@ import sys
 import warnings
 import gzip
 import shutil
+from io import BytesIO
 from packaging import version
 
 import numpy
@@ -651,7 +652,8 @@ def write_to_hdu(d, name=None, hdr=None, force_to_bintbl=False):
     raise TypeError('Input must be a dictionary, astropy.table.Table, list, or numpy.ndarray.')
 
 
-def write_to_fits(d, ofile, name=None, hdr=None, overwrite=False, checksum=True):
+def write_to_fits(d, ofile, name=None, hdr=None, overwrite=False, checksum=True,
+                  buffered=False):
     """
     Write the provided object to a fits file.
 
@@ -675,6 +677,12 @@ def write_to_fits(d, ofile, name=None, hdr=None, overwrite=False, checksum=True)
           `astropy.io.fits.HDUList.writeto`_ do the compression,
           particularly for files with many extensions (or at least
           this was true in the past).
+        - If ``buffered`` is True, the fits file is first serialized to
+          an in-memory buffer and then written to disk in a single call.
+          This avoids the many small writes performed by
+          `astropy.io.fits.HDUList.writeto`_, which are slow on
+          high-latency (e.g., networked) file systems, at the expense
+          of holding a copy of the full file in memory.
 
     Args:
         d (:obj:`dict`, :obj:`list`, `numpy.ndarray`_, `astropy.table.Table`_, `astropy.io.fits.HDUList`_):
@@ -694,6 +702,9 @@ def write_to_fits(d, ofile, name=None, hdr=None, overwrite=False, checksum=True)
         checksum (:obj:`bool`, optional):
             Passed to `astropy.io.fits.HDUList.writeto`_ to add the
             DATASUM and CHECKSUM keywords fits header(s).
+        buffered (:obj:`bool`, optional):
+            Serialize the file to memory and write it to disk in a
+            single call; see above.
     """
     if os.path.isfile(ofile) and not overwrite:
         raise FileExistsError('File already exists; to overwrite, set overwrite=True.')
@@ -709,9 +720,15 @@ def write_to_fits(d, ofile, name=None, hdr=None, overwrite=False, checksum=True)
     _hdr = initialize_header() if hdr is None else hdr.copy()
 
     # Construct the hdus and write the fits file.
-    fits.HDUList(d if isinstance(d, fits.HDUList) else 
-                 [fits.PrimaryHDU(header=_hdr)] + [write_to_hdu(d, name=name, hdr=_hdr)]
-                 ).writeto(_ofile, overwrite=True, checksum=checksum)
+    hdul = d if isinstance(d, fits.HDUList) else \
+                fits.HDUList([fits.PrimaryHDU(header=_hdr)] + [write_to_hdu(d, name=name, hdr=_hdr)])
+    if buffered:
+        buf = BytesIO()
+        hdul.writeto(buf, checksum=checksum)
+        with open(_ofile, 'wb') as f:
+            f.write(buf.getbuffer())
+    else:
+        hdul.writeto(_ofile, overwrite=True, checksum=checksum)
 
     # Compress the file if the output filename has a '.gz' extension;
     # this is slow but still faster than if you have astropy.io.fits do
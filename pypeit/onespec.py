@@ -4,16 +4,48 @@ Provides a simple datamodel for a single spectrum.
 .. include common links, assuming primary doc root is up one directory
 .. include:: ../include/links.rst
 """
-import inspect
-
-from IPython import embed
 
 import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+from pypeit import msgs
 from pypeit import datamodel
 from pypeit import io
 from pypeit.spectrographs.util import load_spectrograph
 
+
+if njit is None:
+    def _weighted_sums(flux, ivar, mask, telluric):
+        """
+        Return the weighted sum of the flux and the sum of the weights,
+        where the weights are ``ivar*telluric`` for pixels with ``mask > 0``.
+        """
+        gpm = mask > 0
+        wgt = ivar[gpm] * telluric[gpm]
+        return np.sum(flux[gpm] * wgt), np.sum(wgt)
+else:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _weighted_sums(flux, ivar, mask, telluric):
+        """
+        Return the weighted sum of the flux and the sum of the weights,
+        where the weights are ``ivar*telluric`` for pixels with ``mask > 0``.
+
+        The calculation is done in a single pass without temporary arrays.
+        """
+        s = 0.0
+        w = 0.0
+        for i in prange(flux.shape[0]):
+            if mask[i] > 0:
+                wi = ivar[i] * telluric[i]
+                s += flux[i] * wi
+                w += wi
+        return s, w
+
+
 class OneSpec(datamodel.DataContainer):
     """
     DataContainer to hold single spectra, e.g., from
@@ -28,13 +60,50 @@ class OneSpec(datamodel.DataContainer):
 
     Attributes:
         head0 (`astropy.io.fits.Header`):  Primary header
-        spect_meta (:obj:`dict`): Parsed meta from the header
+        filename (:obj:`str`): File from which the spectrum was read
+        spect_meta (:obj:`dict`): Parsed meta from the header; parsed on
+            first access
         spectrograph (:class:`pypeit.spectrographs.spectrograph.Spectrograph`):
             Build from PYP_SPEC
 
     """
     version = '1.0.0'
 
+    block_keys = ['wave', 'flux', 'ivar', 'telluric', 'obj_model']
+    """
+    Per-pixel floating-point arrays that are packed by :func:`blocks`, in
+    row order.  Arrays that are None are skipped.
+    """
+
+    _spectrograph_cache = {}
+    """
+    Spectrograph objects shared among all instances, keyed by ``PYP_SPEC``.
+    Spectrograph objects are small and only a few are ever used, so entries
+    are kept for the duration of the session.
+    """
+
+    @classmethod
+    def _load_spectrograph(cls, name):
+        """
+        Cached wrapper for :func:`~pypeit.spectrographs.util.load_spectrograph`.
+
+        OneSpec only uses the spectrograph to parse and construct headers, so
+        the same instance can be shared among all objects for a given
+        spectrograph.
+
+        Args:
+            name (:obj:`str`):
+                Spectrograph name; see ``PYP_SPEC``.
+
+        Returns:
+            :class:`~pypeit.spectrographs.spectrograph.Spectrograph`:
+        """
+        spectrograph = cls._spectrograph_cache.get(name)
+        if spectrograph is None:
+            spectrograph = load_spectrograph(name)
+            cls._spectrograph_cache[name] = spectrograph
+        return spectrograph
+
     datamodel = {'wave': dict(otype=np.ndarray, atype=np.floating, descr='Wavelength array (Ang)'),
                  'flux': dict(otype=np.ndarray, atype=np.floating,
                               descr='Flux array in units of counts/s or 10^-17 erg/s/cm^2/Ang'),
@@ -56,6 +125,10 @@ class OneSpec(datamodel.DataContainer):
         Over-load :func:`pypeit.datamodel.DataContainer.from_file`
         to deal with the header
 
+        The file is memory-mapped, such that array data are only read
+        from disk as they are accessed.  The file itself is closed before
+        returning; the memory map is kept alive by the arrays that use it.
+
         Args:
             ifile (str):  Filename holding the object
 
@@ -63,41 +136,165 @@ class OneSpec(datamodel.DataContainer):
             :class:`OneSpec`:
 
         """
-        hdul = io.fits_open(ifile)
-        slf = super(OneSpec, cls).from_hdu(hdul)
-
-        # Internals
-        slf.filename = ifile
-        slf.head0 = hdul[0].header
-        # Meta
-        slf.spectrograph = load_spectrograph(slf.PYP_SPEC)
-        slf.spect_meta = slf.spectrograph.parse_spec_header(slf.head0)
+        with io.fits_open(ifile, memmap=True) as hdul:
+            slf = super(OneSpec, cls).from_hdu(hdul)
+            # Internals
+            slf.filename = ifile
+            slf.head0 = hdul[0].header
+        # Meta; spect_meta is parsed from head0 when first accessed
+        slf.spectrograph = cls._load_spectrograph(slf.PYP_SPEC)
         #
         return slf
 
     def __init__(self, wave, flux, PYP_SPEC=None, ivar=None, mask=None, telluric=None,
                  obj_model=None, ext_mode=None, fluxed=None):
 
-        args, _, _, values = inspect.getargvalues(inspect.currentframe())
-        _d = dict([(k,values[k]) for k in args[1:]])
+        _d = {'wave': wave, 'flux': flux, 'PYP_SPEC': PYP_SPEC, 'ivar': ivar, 'mask': mask,
+              'telluric': telluric, 'obj_model': obj_model, 'ext_mode': ext_mode,
+              'fluxed': fluxed}
         # Setup the DataContainer
         datamodel.DataContainer.__init__(self, d=_d)
 
+    @classmethod
+    def from_numpy_soa(cls, **arrays):
+        """
+        Instantiate from a dictionary of arrays, e.g., as returned by
+        :func:`to_numpy_soa`.
+
+        Arrays are used directly by the new object, without copying,
+        except that the mask is converted to ``uint8`` if it has a
+        different type.
+
+        Args:
+            **arrays:
+                Keyword arguments passed directly to the instantiation;
+                ``wave`` and ``flux`` are required.
+
+        Returns:
+            :class:`OneSpec`:
+        """
+        return cls(**arrays)
+
+    def to_numpy_soa(self):
+        """
+        Return the per-pixel arrays as a dictionary of contiguous arrays.
+
+        The floating-point arrays (see :attr:`block_keys`) are returned as
+        C-contiguous, 64-bit float arrays, and the mask is returned as a
+        C-contiguous integer array.  Arrays that already satisfy this are
+        returned without copying, so modifying them modifies the object.
+        Arrays that are None are not included.
+
+        Returns:
+            :obj:`dict`: Dictionary with the arrays.
+        """
+        soa = {key: np.ascontiguousarray(self[key], dtype=np.float64)
+                    for key in self.block_keys if self[key] is not None}
+        if self.mask is not None:
+            soa['mask'] = np.ascontiguousarray(self.mask)
+        return soa
+
+    def blocks(self, size=1024):
+        """
+        Iterate over the packed floating-point arrays in blocks of pixels.
+
+        This is meant for kernels that process the spectrum in chunks that
+        fit in cache.  When called, the arrays in :attr:`block_keys`
+        (skipping any that are None) are copied into a single contiguous
+        2D array, with one row per array.  Each yielded block is a view of
+        that array; the last block may be shorter than ``size``.  The
+        packed array is a copy, so modifying the blocks does not modify
+        the object.
+
+        Args:
+            size (:obj:`int`, optional):
+                Number of pixels per block.
+
+        Yields:
+            `numpy.ndarray`_: 2D view with shape ``(nkeys, size)``.
+        """
+        if size < 1:
+            msgs.error('Block size must be positive.')
+        keys = [key for key in self.block_keys if self[key] is not None]
+        if len(keys) == 0:
+            return
+        shape = self[keys[0]].shape
+        if len(shape) != 1 or any(self[key].shape != shape for key in keys):
+            msgs.error('Floating-point arrays must all be 1D with the same length to iterate '
+                       'in blocks.')
+        block = np.empty((len(keys),) + shape,
+                         dtype=np.result_type(*[self[key] for key in keys]))
+        for i, key in enumerate(keys):
+            block[i] = self[key]
+        for start in range(0, shape[0], size):
+            yield block[:,start:start+size]
+
     def _init_internals(self):
         self.head0 = None
         self.filename = None
         self.spectrograph = None
-        self.spect_meta = None
         self.history = []
 
-    def to_file(self, ofile, primary_hdr=None, history=None, **kwargs):
+    def _validate(self):
+        """
+        Convert the mask to ``uint8``.
+
+        The floating-point arrays are used as provided; in particular,
+        arrays read by :func:`from_file` are not copied.
+        """
+        # The mask only holds 0/1 values; use the smallest integer type.
+        if self.mask is not None:
+            self.mask = self.mask.astype(np.uint8, copy=False)
+
+    @property
+    def spect_meta(self):
+        """
+        Metadata parsed from :attr:`head0` by :attr:`spectrograph`.
+
+        The header is only parsed the first time this is accessed.
+        """
+        if self.__dict__['spect_meta'] is None and self.spectrograph is not None \
+                and self.head0 is not None:
+            self.__dict__['spect_meta'] = self.spectrograph.parse_spec_header(self.head0)
+        return self.__dict__['spect_meta']
+
+    def weighted_mean(self, use_telluric=True):
+        """
+        Compute the inverse-variance weighted mean flux of the good pixels.
+
+        If `numba`_ is available, the calculation is done by a compiled
+        kernel; otherwise, it falls back to numpy.
+
+        Args:
+            use_telluric (:obj:`bool`, optional):
+                Include the telluric model, if defined, in the weights.
+
+        Returns:
+            :obj:`float`: The weighted mean; NaN if the sum of the weights
+            is not positive.
+        """
+        if self.ivar is None or self.mask is None:
+            msgs.error('Cannot compute weighted mean without ivar and mask.')
+        telluric = self.telluric if use_telluric and self.telluric is not None \
+                        else np.broadcast_to(1., self.flux.shape)
+        s, w = _weighted_sums(self.flux, self.ivar, self.mask, telluric)
+        return s / w if w > 0 else np.nan
+
+    def to_file(self, ofile, primary_hdr=None, history=None, buffered=True, **kwargs):
         """
         Over-load :func:`pypeit.datamodel.DataContainer.to_file`
         to deal with the header
 
+        By default, the file is serialized to memory and written to disk
+        in a single call; see :func:`pypeit.io.write_to_fits`.
+
         Args:
             ofile (:obj:`str`): Filename
             primary_hdr (`astropy.io.fits.Header`_, optional):
+            history (:class:`~pypeit.history.History`, optional):
+                History entries to add to the primary header.
+            buffered (:obj:`bool`, optional):
+                Serialize the file to memory before writing it to disk.
             **kwargs:  Passed to super.to_file()
 
         """
@@ -105,21 +302,17 @@ class OneSpec(datamodel.DataContainer):
             primary_hdr = io.initialize_header(primary=True)
         # Build the header
         if self.head0 is not None and self.PYP_SPEC is not None:
-            spectrograph = load_spectrograph(self.PYP_SPEC)
+            spectrograph = self._load_spectrograph(self.PYP_SPEC)
             subheader = spectrograph.subheader_for_spec(self.head0, self.head0,
                                                         extra_header_cards = ['RA_OBJ', 'DEC_OBJ'])
         else:
             subheader = {}
         # Add em in
-        for key in subheader:
-            primary_hdr[key] = subheader[key]
+        primary_hdr.update(subheader)
 
         # Add history
         if history is not None:
             history.write_to_header(primary_hdr)
 
         # Do it
-        super(OneSpec, self).to_file(ofile, primary_hdr=primary_hdr, **kwargs)
-
-
-
+        super(OneSpec, self).to_file(ofile, primary_hdr=primary_hdr, buffered=buffered, **kwargs)
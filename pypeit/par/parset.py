@@ -557,6 +557,27 @@ class ParSet:
         """Return the list of parameter set keys."""
         return list(self.data.keys())
 
+    def update(self, values):
+        """
+        Set a number of parameters at once.
+
+        Values are set using :func:`__setitem__`, such that they are
+        validated.  Nested dictionaries are applied recursively to the
+        nested :class:`ParSet` objects, meaning only the parameters
+        provided are altered.  Lists are copied such that the parameter set
+        does not share them with ``values``.
+
+        Args:
+            values (:obj:`dict`):
+                Dictionary with the parameters to set.  Any nested parameter
+                set can be given as a nested dictionary.
+        """
+        for key, value in values.items():
+            if isinstance(value, dict) and isinstance(self.data.get(key), ParSet):
+                self.data[key].update(value)
+            else:
+                self[key] = list(value) if isinstance(value, list) else value
+
     
     def add(self, key, value, default=None, options=None, dtype=None, can_call=None, descr=None):
         """
@@ -212,7 +212,7 @@ class ProcessImagesPar(ParSet):
                  use_biasimage=None, use_overscan=None, use_darkimage=None,
                  empirical_rn=None, shot_noise=None, noise_floor=None,
                  use_pixelflat=None, use_illumflat=None, use_specillum=None,
-                 use_pattern=None, spat_flexure_correct=None):
+                 use_pattern=None, spat_flexure_correct=None, nproc=None):
 
         # Grab the parameter names and values from the function
         # arguments
@@ -332,6 +332,13 @@ class ProcessImagesPar(ParSet):
         descr['comb_sigrej'] = 'Sigma-clipping level for when clip=True; ' \
                            'Use None for automatic limit (recommended).  '
 
+        defaults['nproc'] = 1
+        dtypes['nproc'] = int
+        descr['nproc'] = 'Number of processes used to process the individual frames before ' \
+                         'they are combined.  If 1, the frames are processed serially.  Each ' \
+                         'process works with its own copy of the calibrations, so memory use ' \
+                         'grows with the number of processes.'
+
         defaults['satpix'] = 'reject'
         options['satpix'] = ProcessImagesPar.valid_saturation_handling()
         dtypes['satpix'] = str
@@ -362,7 +369,10 @@ class ProcessImagesPar(ParSet):
 
         defaults['lamaxiter'] = 1
         dtypes['lamaxiter'] = int
-        descr['lamaxiter'] = 'Maximum number of iterations for LA cosmics routine.'
+        descr['lamaxiter'] = 'Maximum number of iterations for LA cosmics routine.  The ' \
+                               'identified cosmic rays are not replaced between ' \
+                               'iterations, so any value above 0 performs a single pass ' \
+                               'of the routine; 0 disables the cosmic-ray detection.'
 
         defaults['grow'] = 1.5
         dtypes['grow'] = [int, float]
@@ -409,7 +419,7 @@ class ProcessImagesPar(ParSet):
                    'n_lohi', 'mask_cr',
                    #'replace',
                    'lamaxiter', 'grow', 'clip', 'comb_sigrej', 'rmcompact', 'sigclip',
-                   'sigfrac', 'objlim']
+                   'sigfrac', 'objlim', 'nproc']
 
         badkeys = np.array([pk not in parkeys for pk in k])
         if np.any(badkeys):
@@ -456,6 +466,9 @@ class ProcessImagesPar(ParSet):
         if self.data['n_lohi'] is not None and len(self.data['n_lohi']) != 2:
             raise ValueError('n_lohi must be a list of two numbers.')
 
+        if self.data['nproc'] < 1:
+            raise ValueError('Number of processes must be at least 1.')
+
         if not self.data['use_overscan']:
             return
         if self.data['overscan_par'] is None:
@@ -3304,7 +3317,7 @@ class ReducePar(ParSet):
     """
 
     def __init__(self, findobj=None, skysub=None, extraction=None,
-                 cube=None, trim_edge=None, slitmask=None):
+                 cube=None, trim_edge=None, slitmask=None, nproc=None):
 
         # Grab the parameter names and values from the function
         # arguments
@@ -3345,6 +3358,12 @@ class ReducePar(ParSet):
         dtypes['trim_edge'] = list
         descr['trim_edge'] = 'Trim the slit by this number of pixels left/right when performing sky sub'
 
+        defaults['nproc'] = 1
+        dtypes['nproc'] = int
+        descr['nproc'] = 'Number of processes used to perform the object finding, global sky ' \
+                         'subtraction, and local sky subtraction and extraction of independent ' \
+                         'slits in parallel.  If 1, the slits are processed serially.'
+
         # Instantiate the parameter set
         super(ReducePar, self).__init__(list(pars.keys()),
                                              values=list(pars.values()),
@@ -3358,7 +3377,7 @@ class ReducePar(ParSet):
     def from_dict(cls, cfg):
         k = np.array([*cfg.keys()])
 
-        allkeys = ['findobj', 'skysub', 'extraction', 'cube', 'trim_edge', 'slitmask']
+        allkeys = ['findobj', 'skysub', 'extraction', 'cube', 'trim_edge', 'slitmask', 'nproc']
         badkeys = np.array([pk not in allkeys for pk in k])
         if np.any(badkeys):
             raise ValueError('{0} not recognized key(s) for ReducePar.'.format(k[badkeys]))
@@ -3375,11 +3394,15 @@ class ReducePar(ParSet):
         kwargs[pk] = CubePar.from_dict(cfg[pk]) if pk in k else None
         pk = 'slitmask'
         kwargs[pk] = SlitMaskPar.from_dict(cfg[pk]) if pk in k else None
+        # Keywords that are not ParSets
+        pk = 'nproc'
+        kwargs[pk] = cfg[pk] if pk in k else None
 
         return cls(**kwargs)
 
     def validate(self):
-        pass
+        if self.data['nproc'] < 1:
+            raise ValueError('Number of processes must be at least 1.')
 
 
 class FindObjPar(ParSet):
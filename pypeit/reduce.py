@@ -7,6 +7,9 @@ Main driver class for skysubtraction and extraction
 """
 
 import inspect
+import functools
+import multiprocessing
+from concurrent import futures
 import numpy as np
 import os
 
@@ -30,6 +33,190 @@ from linetools.spectra import xspectrum1d
 from IPython import embed
 
 
+def slit_pixel_index(slitmask, spat_id):
+    """
+    Group the pixels of a slit image by slit.
+
+    A single stable sort of the flattened slit image buckets the pixels of
+    each slit, such that the pixels in any slit can be selected without a
+    full-frame comparison (i.e., ``slitmask == spat_id[i]``).  Within each
+    slit, the flattened pixel indices are in ascending order, which is the
+    same order as the elements selected by the equivalent boolean mask.
+
+    Args:
+        slitmask (`numpy.ndarray`_):
+            Integer image with the spatial ID of the slit that each pixel
+            falls in and -1 for pixels that are not in any slit; see
+            :func:`~pypeit.slittrace.SlitTraceSet.slit_img`.
+        spat_id (`numpy.ndarray`_):
+            The spatial IDs of the slits.
+
+    Returns:
+        :obj:`tuple`: Two integer `numpy.ndarray`_ objects.  The first
+        provides the flattened pixel indices sorted by slit ID; the second
+        has shape ``(nslits,2)`` and provides the start and end of each
+        slit's pixels in the first array.  I.e., the flattened indices of
+        the pixels in slit ``i`` are ``order[bounds[i,0]:bounds[i,1]]``.
+    """
+    flat = slitmask.ravel()
+    # Integer types with 16 or fewer bits use a (much faster) radix sort
+    if flat.size > 0 and flat.max() < np.iinfo(np.int16).max:
+        flat = flat.astype(np.int16)
+    order = np.argsort(flat, kind='stable')
+    srt = flat[order]
+    bounds = np.column_stack((np.searchsorted(srt, spat_id, side='left'),
+                              np.searchsorted(srt, spat_id, side='right')))
+    return order, bounds
+
+
+def index_to_mask(indx, shape, values=True):
+    """
+    Construct a boolean image from a set of flattened pixel indices.
+
+    Args:
+        indx (`numpy.ndarray`_):
+            Flattened indices of the pixels to set.
+        shape (:obj:`tuple`):
+            Shape of the output image.
+        values (:obj:`bool`, `numpy.ndarray`_, optional):
+            Values to assign to the selected pixels.  All other pixels are
+            False.
+
+    Returns:
+        `numpy.ndarray`_: Boolean image with the provided shape.
+    """
+    mask = np.zeros(shape, dtype=bool)
+    mask.flat[indx] = values
+    return mask
+
+
+# Images used by all the slits processed by a worker process; see
+# :func:`map_slits`.
+_slit_images = None
+
+
+def _init_slit_worker(images):
+    """
+    Store the images used by all slits in a worker process; see
+    :func:`map_slits`.
+    """
+    global _slit_images
+    _slit_images = images
+
+
+def _call_on_slit(func, *args, **kwargs):
+    """
+    Execute a per-slit function in a worker process; see :func:`map_slits`.
+    """
+    return func(*_slit_images, *args, **kwargs)
+
+
+def map_slits(func, images, *args, nproc=1, **kwargs):
+    """
+    Apply a function to a set of slits, optionally using a pool of worker
+    processes.
+
+    The function is called as ``func(*images, *slit_args, **kwargs)``, where
+    ``slit_args`` holds the elements of ``args`` for a single slit.  When
+    using multiple processes, the images (typically full-frame images needed
+    by every slit) are sent to each worker process once, instead of once per
+    slit.  Workers are spawned, instead of forked, to avoid deadlocks in
+    threaded (e.g., numba) code.
+
+    Args:
+        func (callable):
+            Module-level function to apply to each slit.
+        images (:obj:`tuple`):
+            Images (or any other object) passed as the first arguments to
+            ``func`` for every slit.
+        *args (:obj:`list`):
+            Sequences with the arguments specific to each slit.  All must
+            have the same length, the number of slits.
+        nproc (:obj:`int`, optional):
+            Number of worker processes.  If 1, the slits are processed
+            serially in the current process.
+        **kwargs:
+            Keyword arguments passed to ``func`` for every slit.
+
+    Returns:
+        :obj:`list`: The result of ``func`` for each slit, in the same order
+        as the input.
+    """
+    nslits = len(args[0]) if len(args) > 0 else 0
+    if nproc is None or nproc < 2 or nslits < 2:
+        return [func(*images, *slit_args, **kwargs) for slit_args in zip(*args)]
+    with futures.ProcessPoolExecutor(max_workers=min(nproc, nslits),
+                                     mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_slit_worker,
+                                     initargs=(images,)) as executor:
+        return list(executor.map(functools.partial(_call_on_slit, func, **kwargs), *args))
+
+
+def _objfind_slit(image, indx, gpm, slit_left, slit_righ, slit_kwargs, **kwargs):
+    """
+    Find objects in a single slit; see :func:`~pypeit.core.extract.objfind`.
+
+    The slit and good-pixel masks are reconstructed from the flattened
+    indices of the slit pixels, ``indx``, and the good-pixel flags for those
+    pixels, ``gpm``.  ``slit_kwargs`` and ``kwargs`` are passed directly to
+    :func:`~pypeit.core.extract.objfind`.
+    """
+    thismask = index_to_mask(indx, image.shape)
+    inmask = index_to_mask(indx, image.shape, values=gpm)
+    return extract.objfind(image, thismask, slit_left, slit_righ, inmask=inmask, **slit_kwargs,
+                           **kwargs)
+
+
+def _global_skysub_slit(sciimg, sciivar, tilts, indx, gpm, slit_left, slit_righ, **kwargs):
+    """
+    Fit the sky in a single slit; see :func:`~pypeit.core.skysub.global_skysub`.
+
+    The slit and good-pixel masks are reconstructed from the flattened
+    indices of the slit pixels, ``indx``, and the good-pixel flags for those
+    pixels, ``gpm``.  ``kwargs`` are passed directly to
+    :func:`~pypeit.core.skysub.global_skysub`.
+
+    The fit only uses the image columns spanned by the slit.  All spectral
+    rows are kept because the tilts are normalized by the number of rows in
+    the image.  The slit edges are shifted by an integer number of pixels,
+    which is exact, such that the result is identical to the fit using the
+    full images.
+    """
+    nspec, nspat = sciimg.shape
+    spat = indx % nspat
+    cols = slice(spat.min(), spat.max()+1)
+    shape = (nspec, cols.stop - cols.start)
+    # Flattened indices in the sub-image
+    _indx = indx // nspat * shape[1] + spat - cols.start
+    thismask = index_to_mask(_indx, shape)
+    inmask = index_to_mask(_indx, shape, values=gpm)
+    return skysub.global_skysub(sciimg[:,cols], sciivar[:,cols], tilts[:,cols], thismask,
+                                slit_left - cols.start, slit_righ - cols.start, inmask=inmask,
+                                **kwargs)
+
+
+def _local_skysub_extract_slit(sciimg, sciivar, tilts, waveimg, global_sky, base_var,
+                               count_scale, spat_pix, indx, gpm, slit_left, slit_righ, sobjs,
+                               **kwargs):
+    """
+    Perform the local sky subtraction and extraction of the objects in a
+    single slit; see :func:`~pypeit.core.skysub.local_skysub_extract`.
+
+    The slit and good-pixel masks are reconstructed from the flattened
+    indices of the slit pixels, ``indx``, and the good-pixel flags for those
+    pixels, ``gpm``.  ``kwargs`` are passed directly to
+    :func:`~pypeit.core.skysub.local_skysub_extract`.  Because the objects
+    are altered in-place, and the ones processed by a worker process are
+    copies, the returned tuple includes ``sobjs``.
+    """
+    thismask = index_to_mask(indx, sciimg.shape)
+    ingpm = index_to_mask(indx, sciimg.shape, values=gpm)
+    return skysub.local_skysub_extract(sciimg, sciivar, tilts, waveimg, global_sky, thismask,
+                                       slit_left, slit_righ, sobjs, ingpm=ingpm,
+                                       spat_pix=spat_pix, base_var=base_var,
+                                       count_scale=count_scale, **kwargs) + (sobjs,)
+
+
 class Reduce:
     """
     This class will organize and run actions related to
@@ -90,7 +277,14 @@ class Reduce:
 
     __metaclass__ = ABCMeta
 
-
+    # Sky-subtracted images and residual maps that can be displayed by
+    # :func:`show`.  For each, provides the attribute with the sky model to
+    # subtract, if the object model is also subtracted, if the image is
+    # normalized by the model noise, and the prefix of the ginga channel.
+    _show_images = {'global': ('global_sky', False, False, 'global_sky'),
+                    'local': ('skymodel', False, False, 'local_sky'),
+                    'sky_resid': ('skymodel', False, True, 'sky_resid'),
+                    'resid': ('skymodel', True, True, 'resid')}
 
     # Superclass factory method generates the subclass instance
     @classmethod
@@ -158,6 +352,13 @@ class Reduce:
         else:
             msgs.error("Not ready for this objtype in Reduce")
 
+        # Slit images and the grouping of the pixels by slit are cached; see
+        # :func:`get_slitmask` and :func:`get_slit_pixel_index`
+        self._slitmask_cache = {}
+        self._slit_index_cache = None
+        # The model noise is cached for display; see :func:`show`
+        self._sqrt_ivarmodel_cache = None
+
         # Initialise the slits
         msgs.info("Initialising slits")
         self.initialise_slits()
@@ -201,6 +402,79 @@ class Reduce:
         self.slitshift = np.zeros(self.slits.nslits)  # Global spectral flexure slit shifts (in pixels) that are applied to all slits.
         self.vel_corr = None
 
+    def get_slitmask(self, **kwargs):
+        """
+        Return the slit image, constructing it only if an identical image
+        has not already been built for this object.
+
+        The construction of the slit image requires a full-frame pass for
+        every slit, which is redundant when the same image is requested
+        more than once (e.g., when the slits are re-initialised).  The
+        cached images are keyed by the current slit mask and the keyword
+        arguments, and they are only reused for the same slit object; the cache is therefore safe to use if the
+        slit mask bits are changed during the reduction.
+
+        .. warning::
+
+            The returned array is shared with the cache and should not be
+            altered.
+
+        Args:
+            **kwargs:
+                Passed directly to
+                :func:`~pypeit.slittrace.SlitTraceSet.slit_img`.
+
+        Returns:
+            `numpy.ndarray`_: The image identifying the slit associated
+            with each pixel; see
+            :func:`~pypeit.slittrace.SlitTraceSet.slit_img`.
+        """
+        key = (self.slits.mask.tobytes(),) \
+                + tuple((k, tuple(v) if isinstance(v, list) else v)
+                        for k, v in sorted(kwargs.items()))
+        if key in self._slitmask_cache:
+            _slits, slitmask = self._slitmask_cache[key]
+            if _slits is self.slits:
+                return slitmask
+        slitmask = self.slits.slit_img(**kwargs)
+        # NOTE: The slits are kept with the cached image so that the identity
+        # check above cannot be fooled by a recycled object id.
+        self._slitmask_cache[key] = (self.slits, slitmask)
+        return slitmask
+
+    def get_slit_pixel_index(self):
+        """
+        Return the flattened indices of the pixels in each slit.
+
+        The pixels are grouped by :func:`slit_pixel_index` using the current
+        slit image (:attr:`slitmask`) and slit IDs.  The result is cached and
+        reused by all the methods processing the same exposure; it is
+        recomputed only when :attr:`slitmask` is reassigned (e.g., by
+        :func:`prepare_extraction`) or the slit IDs change.
+
+        Returns:
+            :obj:`tuple`: See :func:`slit_pixel_index`.
+        """
+        spat_id = self.slits.spat_id
+        if self._slit_index_cache is None or self._slit_index_cache[0] is not self.slitmask \
+                or not np.array_equal(self._slit_index_cache[1], spat_id):
+            self._slit_index_cache = (self.slitmask, spat_id.copy(),
+                                      slit_pixel_index(self.slitmask, spat_id))
+        return self._slit_index_cache[2]
+
+    def _sqrt_ivarmodel(self):
+        """
+        Return the square root of :attr:`ivarmodel`.
+
+        The result is cached and only recomputed when :attr:`ivarmodel` is
+        reassigned, such that repeated calls to :func:`show` don't
+        recompute it.
+        """
+        if self._sqrt_ivarmodel_cache is None \
+                or self._sqrt_ivarmodel_cache[0] is not self.ivarmodel:
+            self._sqrt_ivarmodel_cache = (self.ivarmodel, np.sqrt(self.ivarmodel))
+        return self._sqrt_ivarmodel_cache[1]
+
     def initialise_slits(self, initial=False):
         """
         Initialise the slits
@@ -217,8 +491,8 @@ class Reduce:
             = self.slits.select_edges(initial=initial, flexure=self.spat_flexure_shift)
 
         # Slitmask
-        self.slitmask = self.slits.slit_img(initial=initial, flexure=self.spat_flexure_shift,
-                                            exclude_flag=self.slits.bitmask.exclude_for_reducing+['BOXSLIT'])
+        self.slitmask = self.get_slitmask(initial=initial, flexure=self.spat_flexure_shift,
+                                          exclude_flag=self.slits.bitmask.exclude_for_reducing+['BOXSLIT'])
         # Now add the slitmask to the mask (i.e. post CR rejection in proc)
         # NOTE: this uses the par defined by EdgeTraceSet; this will
         # use the tweaked traces if they exist
@@ -281,13 +555,21 @@ class Reduce:
             self.sobjs = self.sobjs_obj.copy()
             # Purge out the negative objects if this was a near-IR reduction unless negative objects are requested
 
+            # Group the pixels by the slit of each object and get the
+            # good-pixel mask once for all objects
+            slitid = np.unique(self.sobjs.SLITID) if self.sobjs.nobj > 0 \
+                        else np.array([], dtype=int)
+            slit_order, slit_bounds = slit_pixel_index(self.slitmask, slitid)
+            base_gpm = self.sciImg.select_flag(invert=True)
+
             # Quick loop over the objects
             for iobj in range(self.sobjs.nobj):
                 sobj = self.sobjs[iobj]
                 plate_scale = self.get_platescale(sobj)
-                # True  = Good, False = Bad for inmask
-                thismask = self.slitmask == sobj.SLITID  # pixels for this slit
-                inmask = self.sciImg.select_flag(invert=True) & thismask
+                # True  = Good, False = Bad for inmask; only pixels in the slit
+                # with this object are included
+                indx = slit_order[slice(*slit_bounds[np.searchsorted(slitid, sobj.SLITID)])]
+                inmask = index_to_mask(indx, self.slitmask.shape, values=base_gpm.flat[indx])
                 # Do it
                 box_rad = self.par['reduce']['extraction']['boxcar_radius']/plate_scale
                 extract.extract_boxcar(self.sciImg.image, self.sciImg.ivar, inmask, self.waveimg,
@@ -296,7 +578,7 @@ class Reduce:
                                        noise_floor=self.sciImg.noise_floor)
 
             # Fill up extra bits and pieces
-            self.objmodel = np.zeros_like(self.sciImg.image)
+            self.objmodel = np.zeros(self.sciImg.image.shape, dtype=self.sciImg.image.dtype)
             self.ivarmodel = np.copy(self.sciImg.ivar)
             # NOTE: fullmask is a bit mask, make sure it's treated as such, not
             # a boolean (e.g., bad pixel) mask.
@@ -410,8 +692,8 @@ class Reduce:
                           (np.invert(self.slits.bitmask.flagged(self.slits.mask,
                                                                 flag=self.slits.bitmask.exclude_for_reducing)))
         # Update Slitmask to remove `BOXSLIT`, i.e., we don't want to extract those
-        self.slitmask = self.slits.slit_img(flexure=self.spat_flexure_shift,
-                                            exclude_flag=self.slits.bitmask.exclude_for_reducing)
+        self.slitmask = self.get_slitmask(flexure=self.spat_flexure_shift,
+                                          exclude_flag=self.slits.bitmask.exclude_for_reducing)
         # use the tweaked traces if they exist - DP: I'm not sure this is necessary
         self.sciImg.update_mask_slitmask(self.slitmask)
 
@@ -502,7 +784,7 @@ class Reduce:
             if self.find_negative:
                 self.sobjs_obj.make_neg_pos() if return_negative else self.sobjs_obj.purge_neg()
             self.skymodel = self.initial_sky
-            self.objmodel = np.zeros_like(self.sciImg.image)
+            self.objmodel = np.zeros(self.sciImg.image.shape, dtype=self.sciImg.image.dtype)
             # Set to sciivar. Could create a model but what is the point?
             self.ivarmodel = np.copy(self.sciImg.ivar)
             # Set to the initial mask in case no objects were found
@@ -644,7 +926,11 @@ class Reduce:
 
         """
         # Prep
-        self.global_sky = np.zeros_like(self.sciImg.image)
+        # NOTE: The sky must be 0 for pixels that are not in any slit or in
+        # slits that are not fit.  np.zeros (unlike np.zeros_like) gets
+        # memory that is already zeroed by the system, instead of zeroing it
+        # in a separate pass.
+        self.global_sky = np.zeros(self.sciImg.image.shape, dtype=self.sciImg.image.dtype)
         # Parameters for a standard star
         if self.std_redux:
             sigrej = 7.0
@@ -661,31 +947,54 @@ class Reduce:
                                                                 flag=self.slits.bitmask.exclude_for_reducing)))
         gdslits = np.where(np.invert(tmp_bpm))[0]
 
-        # Mask objects using the skymask? If skymask has been set by objfinding, and masking is requested, then do so
-        skymask_now = skymask if (skymask is not None) else np.ones_like(self.sciImg.image, dtype=bool)
+        # Group the pixels by slit and get the good-pixel mask once for all
+        # slits.  Mask objects using the skymask? If skymask has been set by
+        # objfinding, and masking is requested, then do so
+        slit_order, slit_bounds = self.get_slit_pixel_index()
+        base_gpm = self.sciImg.select_flag(invert=True)
+        if skymask is not None:
+            base_gpm &= skymask
 
-        # Loop on slits
+        # Parameters and images that are the same for all slits
+        bsp = self.par['reduce']['skysub']['bspline_spacing']
+        no_poly = self.par['reduce']['skysub']['no_poly']
+        sciimg = self.sciImg.image
+        sciivar = self.sciImg.ivar
+        spat_id = self.slits.spat_id
+        slit_left = self.slits_left
+        slit_righ = self.slits_right
+        # Interactive plots can only be shown by the main process
+        nproc = 1 if show_fit else self.par['reduce']['nproc']
+
+        # Collect the pixels in each slit
+        fit_slits = []
+        slit_indx = []
+        slit_gpm = []
         for slit_idx in gdslits:
-            slit_spat = self.slits.spat_id[slit_idx]
+            slit_spat = spat_id[slit_idx]
             msgs.info("Global sky subtraction for slit: {:d}".format(slit_spat))
-            thismask = self.slitmask == slit_spat
-            inmask = self.sciImg.select_flag(invert=True) & thismask & skymask_now
+            indx = slit_order[slice(*slit_bounds[slit_idx])]
+            gpm = base_gpm.flat[indx]
             # All masked?
-            if not np.any(inmask):
+            if not np.any(gpm):
                 msgs.warn("No pixels for fitting sky.  If you are using mask_by_boxcar=True, your radius may be too large.")
                 self.reduce_bpm[slit_idx] = True
                 continue
-
-            # Find sky
-            self.global_sky[thismask] = skysub.global_skysub(self.sciImg.image, self.sciImg.ivar, self.tilts,
-                                                             thismask, self.slits_left[:,slit_idx],
-                                                             self.slits_right[:,slit_idx],
-                                                             inmask=inmask, sigrej=sigrej,
-                                                             bsp=self.par['reduce']['skysub']['bspline_spacing'],
-                                                             no_poly=self.par['reduce']['skysub']['no_poly'],
-                                                             pos_mask=(not self.ir_redux), show_fit=show_fit)
+            fit_slits += [slit_idx]
+            slit_indx += [indx]
+            slit_gpm += [gpm]
+
+        # Find sky; the slits are independent, such that they can be fit in
+        # parallel
+        sky = map_slits(_global_skysub_slit, (sciimg, sciivar, self.tilts), slit_indx, slit_gpm,
+                        [slit_left[:,slit_idx] for slit_idx in fit_slits],
+                        [slit_righ[:,slit_idx] for slit_idx in fit_slits], nproc=nproc,
+                        sigrej=sigrej, bsp=bsp, no_poly=no_poly, pos_mask=(not self.ir_redux),
+                        show_fit=show_fit)
+        for slit_idx, indx, slit_sky in zip(fit_slits, slit_indx, sky):
+            self.global_sky.flat[indx] = slit_sky
             # Mask if something went wrong
-            if np.sum(self.global_sky[thismask]) == 0.:
+            if np.sum(slit_sky) == 0.:
                 msgs.warn("Bad fit to sky.  Rejecting slit: {:d}".format(slit_idx))
                 self.reduce_bpm[slit_idx] = True
 
@@ -801,12 +1110,13 @@ class Reduce:
                 trace_spat = 0.5 * (self.slits_left + self.slits_right)
                 trace_spec = np.arange(self.slits.nspec)
                 slit_specs = []
+                slit_order, slit_bounds = self.get_slit_pixel_index()
                 for ss in range(self.slits.nslits):
                     if not gd_slits[ss]:
                         slit_specs.append(None)
                         continue
-                    slit_spat = self.slits.spat_id[ss]
-                    thismask = (self.slitmask == slit_spat)
+                    thismask = index_to_mask(slit_order[slice(*slit_bounds[ss])],
+                                             self.slitmask.shape)
                     box_denom = moment1d(self.waveimg * thismask > 0.0, trace_spat[:, ss], 2, row=trace_spec)[0]
                     wghts = (box_denom + (box_denom == 0.0))
                     slit_sky = moment1d(self.global_sky * thismask, trace_spat[:, ss], 2, row=trace_spec)[0] / wghts
@@ -924,12 +1234,10 @@ class Reduce:
         Parameters
         ----------
         attr : str
-          global -- Sky model (global)
-          sci -- Processed science image
-          rawvar -- Raw variance image
-          modelvar -- Model variance image
-          crmasked -- Science image with CRs set to 0
-          skysub -- Science image with global sky subtracted
+          global -- Science image with the global sky subtracted
+          local -- Science image with the local sky subtracted
+          sky_resid -- Sky residual map, with the objects included
+          resid -- Residual map after subtracting the sky and object models
           image -- Input image
         display : str, optional
         image : ndarray, optional
@@ -947,69 +1255,45 @@ class Reduce:
             mask_in = None
             bitmask_in = None
 
-        img_gpm = self.sciImg.select_flag(invert=True)
-
-        if attr == 'global':
-            # global sky subtraction
-            if self.sciImg.image is not None and self.global_sky is not None \
-                    and self.sciImg.fullmask is not None:
-                # sky subtracted image
-                image = (self.sciImg.image - self.global_sky) * img_gpm.astype(float)
-                mean, med, sigma = stats.sigma_clipped_stats(image[img_gpm], sigma_lower=5.0,
-                                                             sigma_upper=5.0)
-                cut_min = mean - 1.0 * sigma
-                cut_max = mean + 4.0 * sigma
-                ch_name = chname if chname is not None else 'global_sky_{}'.format(self.det)
-                viewer, ch = display.show_image(image, chname=ch_name, bitmask=bitmask_in,
-                                                mask=mask_in, clear=clear, wcs_match=True)
-                                              #, cuts=(cut_min, cut_max))
-        elif attr == 'local':
-            # local sky subtraction
-            if self.sciImg.image is not None and self.skymodel is not None \
-                    and self.sciImg.fullmask is not None:
-                # sky subtracted image
-                image = (self.sciImg.image - self.skymodel) * img_gpm.astype(float)
-                mean, med, sigma = stats.sigma_clipped_stats(image[img_gpm], sigma_lower=5.0,
-                                                             sigma_upper=5.0)
-                cut_min = mean - 1.0 * sigma
-                cut_max = mean + 4.0 * sigma
-                ch_name = chname if chname is not None else 'local_sky_{}'.format(self.det)
-                viewer, ch = display.show_image(image, chname=ch_name, bitmask=bitmask_in,
-                                                mask=mask_in, clear=clear, wcs_match=True)
-                                              #, cuts=(cut_min, cut_max))
-        elif attr == 'sky_resid':
-            # sky residual map with object included
-            if self.sciImg.image is not None and self.skymodel is not None \
-                    and self.objmodel is not None and self.ivarmodel is not None \
-                    and self.sciImg.fullmask is not None:
-                image = (self.sciImg.image - self.skymodel) * np.sqrt(self.ivarmodel)
-                image *= img_gpm.astype(float)
-                ch_name = chname if chname is not None else 'sky_resid_{}'.format(self.det)
-                viewer, ch = display.show_image(image, chname=ch_name, cuts=(-5.0, 5.0),
-                                                bitmask=bitmask_in, mask=mask_in, clear=clear,
-                                                wcs_match=True)
-        elif attr == 'resid':
-            # full residual map with object model subtractede
-            if self.sciImg.image is not None and self.skymodel is not None \
-                    and self.objmodel is not None and self.ivarmodel is not None \
-                    and self.sciImg.fullmask is not None:
-                # full model residual map
-                image = (self.sciImg.image - self.skymodel - self.objmodel) * np.sqrt(self.ivarmodel)
-                image *= img_gpm.astype(float)
-                ch_name = chname if chname is not None else 'resid_{}'.format(self.det)
-                viewer, ch = display.show_image(image, chname=ch_name, cuts=(-5.0, 5.0),
-                                                bitmask=bitmask_in, mask=mask_in, clear=clear,
-                                                wcs_match=True)
+        if attr in self._show_images:
+            sky, sub_obj, normalize, ch_prefix = self._show_images[attr]
+            required = [self.sciImg.image, self.sciImg.fullmask, getattr(self, sky)]
+            if normalize:
+                required += [self.objmodel, self.ivarmodel]
+            if any(r is None for r in required):
+                return
+            # Masked pixels are set to 0 in the displayed image
+            img_bpm = self.sciImg.select_flag()
+            # Sky-subtracted image or residual map
+            image = self.sciImg.image - getattr(self, sky)
+            if sub_obj:
+                image -= self.objmodel
+            if normalize:
+                image *= self._sqrt_ivarmodel()
+            np.putmask(image, img_bpm, 0.0)
+            if normalize:
+                cuts = (-5.0, 5.0)
+            else:
+                mean, med, sigma = stats.sigma_clipped_stats(image, mask=img_bpm,
+                                                             sigma_lower=5.0, sigma_upper=5.0)
+                cuts = None  # (mean - 1.0 * sigma, mean + 4.0 * sigma)
+            ch_name = chname if chname is not None else '{0}_{1}'.format(ch_prefix, self.det)
+            viewer, ch = display.show_image(image, chname=ch_name, cuts=cuts,
+                                            bitmask=bitmask_in, mask=mask_in, clear=clear,
+                                            wcs_match=True)
         elif attr == 'image':
             ch_name = chname if chname is not None else 'image'
             viewer, ch = display.show_image(image, chname=ch_name, clear=clear, wcs_match=True)
         else:
             msgs.warn("Not an option for show")
+            return
 
-        if sobjs is not None:
-            for spec in sobjs:
-                color = 'magenta' if spec.hand_extract_flag else 'orange'
-                display.show_trace(viewer, ch, spec.TRACE_SPAT, spec.NAME, color=color)
+        if sobjs is not None and len(sobjs) > 0:
+            # Overplot all the traces with a single call to show_traces
+            display.show_traces(viewer, ch, np.column_stack([spec.TRACE_SPAT for spec in sobjs]),
+                                trc_names=[spec.NAME for spec in sobjs],
+                                colors=['magenta' if spec.hand_extract_flag else 'orange'
+                                            for spec in sobjs])
 
         if slits and self.slits_left is not None:
             display.show_slits(viewer, ch, self.slits_left, self.slits_right)
@@ -1092,7 +1376,7 @@ class MultiSlitReduce(Reduce):
         gdslits = np.where(np.invert(self.reduce_bpm))[0]
 
         # create the ouptut image for skymask
-        skymask = np.zeros_like(image, dtype=bool)
+        skymask = np.zeros(image.shape, dtype=bool)
         # Instantiate the specobjs container
         sobjs = specobjs.SpecObjs()
 
@@ -1102,13 +1386,33 @@ class MultiSlitReduce(Reduce):
         else:
             boxcar_rad_skymask = None
 
-        # Loop on slits
+        # Group the pixels by slit and get the good-pixel mask once for all
+        # slits
+        slit_order, slit_bounds = self.get_slit_pixel_index()
+        base_gpm = self.sciImg.select_flag(invert=True)
+
+        # Parameters that are the same for all slits
+        findobj_par = self.par['reduce']['findobj']
+        use_user_fwhm = self.par['reduce']['extraction']['use_user_fwhm']
+        spat_id = self.slits.spat_id
+        slit_left = self.slits_left
+        slit_righ = self.slits_right
+        boxslit = self.slits.bitmask.flagged(self.slits.mask, flag='BOXSLIT')
+        # Interactive plots can only be shown by the main process
+        nproc = 1 if show_peaks or show_fits or show_trace or debug \
+                    else self.par['reduce']['nproc']
+
+        # Collect the pixels and parameters specific to each slit
+        slit_indx = []
+        slit_gpm = []
+        slit_kwargs = []
         for slit_idx in gdslits:
-            slit_spat = self.slits.spat_id[slit_idx]
+            slit_spat = spat_id[slit_idx]
             qa_title ="Finding objects on slit # {:d}".format(slit_spat)
             msgs.info(qa_title)
-            thismask = self.slitmask == slit_spat
-            inmask = self.sciImg.select_flag(invert=True) & thismask
+            indx = slit_order[slice(*slit_bounds[slit_idx])]
+            slit_indx += [indx]
+            slit_gpm += [base_gpm.flat[indx]]
             # Find objects
             specobj_dict = {'SLITID': slit_spat,
                             'DET': self.det, 'OBJTYPE': self.objtype,
@@ -1117,38 +1421,42 @@ class MultiSlitReduce(Reduce):
             # This condition allows to not use a threshold to find objects in alignment boxes
             # because these boxes are smaller than normal slits and the stars are very bright,
             # the detection threshold would be too high and the star not detected.
-            if self.slits.bitmask.flagged(self.slits.mask[slit_idx], flag='BOXSLIT'):
-                sig_thresh = 0.
-            else:
-                sig_thresh = self.par['reduce']['findobj']['sig_thresh']
-
-            # TODO we need to add QA paths and QA hooks. QA should be
-            # done through objfind where all the relevant information
-            # is. This will be a png file(s) per slit.
-
-            sobjs_slit, skymask[thismask] = \
-                    extract.objfind(image, thismask,
-                                self.slits_left[:,slit_idx],
-                                self.slits_right[:,slit_idx],
-                                inmask=inmask, has_negative=self.find_negative,
-                                ncoeff=self.par['reduce']['findobj']['trace_npoly'],
-                                std_trace=std_trace,
-                                sig_thresh= sig_thresh,
-                                cont_sig_thresh=self.par['reduce']['findobj']['cont_sig_thresh'],
-                                hand_extract_dict=manual_extract_dict,
-                                specobj_dict=specobj_dict, show_peaks=show_peaks,
-                                show_fits=show_fits, show_trace=show_trace,
-                                trim_edg=self.par['reduce']['findobj']['find_trim_edge'],
-                                cont_fit=self.par['reduce']['findobj']['find_cont_fit'],
-                                npoly_cont=self.par['reduce']['findobj']['find_npoly_cont'],
-                                fwhm=self.par['reduce']['findobj']['find_fwhm'],
-                                use_user_fwhm = self.par['reduce']['extraction']['use_user_fwhm'],
-                                boxcar_rad_skymask=boxcar_rad_skymask,
-                                maxdev=self.par['reduce']['findobj']['find_maxdev'],
-                                find_min_max=self.par['reduce']['findobj']['find_min_max'],
-                                qa_title=qa_title, nperslit=self.par['reduce']['findobj']['maxnumber'],
-                                debug_all=debug)
-
+            sig_thresh = 0. if boxslit[slit_idx] else findobj_par['sig_thresh']
+
+            slit_kwargs += [dict(specobj_dict=specobj_dict, sig_thresh=sig_thresh,
+                                 qa_title=qa_title)]
+
+        # TODO we need to add QA paths and QA hooks. QA should be
+        # done through objfind where all the relevant information
+        # is. This will be a png file(s) per slit.
+
+        # The slits are independent, such that objects can be found in
+        # parallel
+        result = map_slits(_objfind_slit, (image,), slit_indx, slit_gpm,
+                           [slit_left[:,slit_idx] for slit_idx in gdslits],
+                           [slit_righ[:,slit_idx] for slit_idx in gdslits], slit_kwargs,
+                           nproc=nproc, has_negative=self.find_negative,
+                           ncoeff=findobj_par['trace_npoly'],
+                           std_trace=std_trace,
+                           cont_sig_thresh=findobj_par['cont_sig_thresh'],
+                           hand_extract_dict=manual_extract_dict,
+                           show_peaks=show_peaks,
+                           show_fits=show_fits, show_trace=show_trace,
+                           trim_edg=findobj_par['find_trim_edge'],
+                           cont_fit=findobj_par['find_cont_fit'],
+                           npoly_cont=findobj_par['find_npoly_cont'],
+                           fwhm=findobj_par['find_fwhm'],
+                           use_user_fwhm = use_user_fwhm,
+                           boxcar_rad_skymask=boxcar_rad_skymask,
+                           maxdev=findobj_par['find_maxdev'],
+                           find_min_max=findobj_par['find_min_max'],
+                           nperslit=findobj_par['maxnumber'],
+                           debug_all=debug)
+
+        for indx, (sobjs_slit, skymask_slit) in zip(slit_indx, result):
+            # NOTE: objfind returns the sky mask for the pixels selected by
+            # thismask, which are in the same (ascending) order as indx
+            skymask.flat[indx] = skymask_slit
             sobjs.add_sobj(sobjs_slit)
 
         # Steps
@@ -1208,72 +1516,108 @@ class MultiSlitReduce(Reduce):
         gdslits = np.where(np.invert(self.reduce_bpm))[0]
 
         # Allocate the images that are needed
-        # Initialize to mask in case no objects were found
+        # NOTE: To avoid full-frame copies that are never altered, the output
+        # mask, sky model, and inverse variance model are initialized to
+        # (i.e., share memory with) their input values, which is the correct
+        # result in case no objects were found.  They are only copied once
+        # they need to be altered.
         # NOTE: fullmask is a bit mask, make sure it's treated as such, not a
         # boolean (e.g., bad pixel) mask.
-        self.outmask = np.copy(self.sciImg.fullmask)
+        self.outmask = self.sciImg.fullmask
         # Initialize to input mask in case no objects were found
-        self.extractmask = self.sciImg.select_flag(invert=True)
+        base_gpm = self.sciImg.select_flag(invert=True)
+        self.extractmask = base_gpm.copy()
         # Initialize to zero in case no objects were found
-        self.objmodel = np.zeros_like(self.sciImg.image)
+        self.objmodel = np.zeros(self.sciImg.image.shape, dtype=self.sciImg.image.dtype)
         # Set initially to global sky in case no objects were found
-        self.skymodel  = np.copy(self.global_sky)
+        self.skymodel = self.global_sky
         # Set initially to sciivar in case no obects were found.
-        self.ivarmodel = np.copy(self.sciImg.ivar)
+        self.ivarmodel = self.sciImg.ivar
 
         # Could actually create a model anyway here, but probably
         # overkill since nothing is extracted
         self.sobjs = sobjs.copy()  # WHY DO WE CREATE A COPY HERE?
 
-        base_gpm = self.sciImg.select_flag(invert=True)
+        # Group the pixels by slit
+        slit_order, slit_bounds = self.get_slit_pixel_index()
 
-        # Loop on slits
+        # Parameters and images that are the same for all slits
+        model_full_slit = self.par['reduce']['extraction']['model_full_slit']
+        box_rad = self.par['reduce']['extraction']['boxcar_radius']/self.get_platescale(None)
+        sigrej = self.par['reduce']['skysub']['sky_sigrej']
+        bsp = self.par['reduce']['skysub']['bspline_spacing']
+        force_gauss = self.par['reduce']['extraction']['use_user_fwhm']
+        sn_gauss = self.par['reduce']['extraction']['sn_gauss']
+        use_2dmodel_mask = self.par['reduce']['extraction']['use_2dmodel_mask']
+        no_local_sky = self.par['reduce']['skysub']['no_local_sky']
+        sciimg = self.sciImg.image
+        sciivar = self.sciImg.ivar
+        spat_id = self.slits.spat_id
+        slit_left = self.slits_left
+        slit_righ = self.slits_right
+        sobj_slitid = self.sobjs.SLITID if self.sobjs.nobj > 0 else np.array([], dtype=int)
+        # Interactive plots can only be shown by the main process
+        nproc = 1 if show_profile else self.par['reduce']['nproc']
+
+        # Collect the pixels and objects in each slit
+        ext_slits = []
+        slit_indx = []
+        slit_gpm = []
+        slit_objs = []
         for slit_idx in gdslits:
-            slit_spat = self.slits.spat_id[slit_idx]
+            slit_spat = spat_id[slit_idx]
             msgs.info("Local sky subtraction and extraction for slit: {:d}".format(slit_spat))
-            thisobj = self.sobjs.SLITID == slit_spat    # indices of objects for this slit
+            thisobj = sobj_slitid == slit_spat    # indices of objects for this slit
             if not np.any(thisobj):
                 continue
             # Setup to run local skysub
-            thismask = self.slitmask == slit_spat   # pixels for this slit
+            indx = slit_order[slice(*slit_bounds[slit_idx])]
+            ext_slits += [slit_idx]
+            slit_indx += [indx]
             # True  = Good, False = Bad for inmask
-            ingpm = base_gpm & thismask
-
-            # ... Just for readability
-            model_full_slit = self.par['reduce']['extraction']['model_full_slit']
-            box_rad = self.par['reduce']['extraction']['boxcar_radius']/self.get_platescale(None)
-            sigrej = self.par['reduce']['skysub']['sky_sigrej']
-            bsp = self.par['reduce']['skysub']['bspline_spacing']
-            force_gauss = self.par['reduce']['extraction']['use_user_fwhm']
-            sn_gauss = self.par['reduce']['extraction']['sn_gauss']
-            use_2dmodel_mask = self.par['reduce']['extraction']['use_2dmodel_mask']
-            no_local_sky = self.par['reduce']['skysub']['no_local_sky']
-
-            # Local sky subtraction and extraction
-            self.skymodel[thismask], self.objmodel[thismask], self.ivarmodel[thismask], \
-                self.extractmask[thismask] \
-                    = skysub.local_skysub_extract(self.sciImg.image, self.sciImg.ivar,
-                                                  self.tilts, self.waveimg, self.global_sky,
-                                                  thismask, self.slits_left[:,slit_idx],
-                                                  self.slits_right[:, slit_idx],
-                                                  self.sobjs[thisobj], ingpm=ingpm,
-                                                  spat_pix=spat_pix,
-                                                  model_full_slit=model_full_slit, box_rad=box_rad,
-                                                  sigrej=sigrej, model_noise=model_noise,
-                                                  std=self.std_redux, bsp=bsp,
-                                                  force_gauss=force_gauss, sn_gauss=sn_gauss,
-                                                  show_profile=show_profile,
-                                                  use_2dmodel_mask=use_2dmodel_mask,
-                                                  no_local_sky=no_local_sky,
-                                                  base_var=self.sciImg.base_var,
-                                                  count_scale=self.sciImg.img_scale,
-                                                  adderr=self.sciImg.noise_floor)
+            slit_gpm += [base_gpm.flat[indx]]
+            slit_objs += [thisobj]
+
+        # Local sky subtraction and extraction; the slits are independent,
+        # such that they can be processed in parallel
+        result = map_slits(_local_skysub_extract_slit,
+                           (sciimg, sciivar, self.tilts, self.waveimg, self.global_sky,
+                            self.sciImg.base_var, self.sciImg.img_scale, spat_pix),
+                           slit_indx, slit_gpm,
+                           [slit_left[:,slit_idx] for slit_idx in ext_slits],
+                           [slit_righ[:,slit_idx] for slit_idx in ext_slits],
+                           [self.sobjs[thisobj] for thisobj in slit_objs], nproc=nproc,
+                           model_full_slit=model_full_slit, box_rad=box_rad,
+                           sigrej=sigrej, model_noise=model_noise,
+                           std=self.std_redux, bsp=bsp,
+                           force_gauss=force_gauss, sn_gauss=sn_gauss,
+                           show_profile=show_profile,
+                           use_2dmodel_mask=use_2dmodel_mask,
+                           no_local_sky=no_local_sky,
+                           adderr=self.sciImg.noise_floor)
+
+        for indx, thisobj, (skymodel, objmodel, ivarmodel, extractmask, sobjs_slit) \
+                in zip(slit_indx, slit_objs, result):
+            # Copy the models on the first slit that alters them
+            if self.skymodel is self.global_sky:
+                self.skymodel = self.global_sky.copy()
+                self.ivarmodel = sciivar.copy()
+            self.skymodel.flat[indx] = skymodel
+            self.objmodel.flat[indx] = objmodel
+            self.ivarmodel.flat[indx] = ivarmodel
+            self.extractmask.flat[indx] = extractmask
+            # Objects extracted by worker processes are copies
+            self.sobjs.specobjs[thisobj] = sobjs_slit.specobjs
 
         # Set the bit for pixels which were masked by the extraction.
         # For extractmask, True = Good, False = Bad
         iextract = base_gpm & np.logical_not(self.extractmask)
-        # TODO: Change this to use the update_mask method?
-        self.outmask[iextract] = self.sciImg.bitmask.turn_on(self.outmask[iextract], 'EXTRACT')
+        if np.any(iextract):
+            # Turn on the bit in a single pass, directly while copying the
+            # input mask
+            self.outmask = np.bitwise_or(self.sciImg.fullmask,
+                                         self.sciImg.bitmask.bit_values['EXTRACT'],
+                                         where=iextract, out=self.sciImg.fullmask.copy())
 
         # Step
         self.steps.append(inspect.stack()[0][3])
@@ -1367,7 +1711,7 @@ class EchelleReduce(Reduce):
             subtraction
         """
         # create the ouptut image for skymask
-        skymask = np.zeros_like(image, dtype=bool)
+        skymask = np.zeros(image.shape, dtype=bool)
 
         plate_scale = self.spectrograph.order_platescale(self.order_vec, binning=self.binning)
         inmask = self.sciImg.select_flag(invert=True)
@@ -1552,7 +1896,7 @@ class IFUReduce(MultiSlitReduce):
         skymask_now = skymask if (skymask is not None) else np.ones_like(self.sciImg.image, dtype=bool)
         hist_trim = 0  # Trim the edges of the histogram to take into account edge effects
         gpm = self.sciImg.select_flag(invert=True)
-        slitid_img_init = self.slits.slit_img(pad=0, initial=True, flexure=self.spat_flexure_shift)
+        slitid_img_init = self.get_slitmask(pad=0, initial=True, flexure=self.spat_flexure_shift)
         spatScaleImg = np.ones_like(self.sciImg.image)
         # For each slit, grab the spatial coordinates and a spline
         # representation of the spatial profile from the illumflat
@@ -1660,7 +2004,7 @@ class IFUReduce(MultiSlitReduce):
         msgs.info("Performing joint global sky subtraction")
         # Mask objects using the skymask? If skymask has been set by objfinding, and masking is requested, then do so
         skymask_now = skymask if (skymask is not None) else np.ones_like(self.sciImg.image, dtype=bool)
-        self.global_sky = np.zeros_like(self.sciImg.image)
+        self.global_sky = np.zeros(self.sciImg.image.shape, dtype=self.sciImg.image.dtype)
         thismask = (self.slitmask > 0)
         inmask = (self.sciImg.select_flag(invert=True) & thismask & skymask_now).astype(np.bool)
         # Convert the wavelength image to A/pixel, registered at pixel 0 (this gives something like
@@ -5,7 +5,17 @@ which do not have sufficient calibs
 .. include common links, assuming primary doc root is up one directory
 .. include:: ../include/links.rst
 """
+import os
+import shutil
 
+import numpy as np
+
+from astropy import table
+
+from pypeit import msgs
+from pypeit import calibrations
+from pypeit.pypeitsetup import PypeItSetup
+from pypeit.par import PypeItPar
 from pypeit.scripts import scriptbase
 from pypeit.spectrographs import available_spectrographs
 
@@ -38,22 +48,6 @@ class ChkForCalibs(scriptbase.ScriptBase):
             astropy.table.Table:
 
         """
-
-        import os
-
-        from IPython import embed
-
-        import numpy as np
-
-        from astropy import table
-
-        from pypeit.pypeitsetup import PypeItSetup
-        from pypeit import calibrations
-        from pypeit import msgs
-        from pypeit.par import PypeItPar
-
-        import shutil
-
         # Check that the spectrograph is provided if using a file root
         if args.root is not None:
             if args.spectrograph is None:
@@ -73,6 +67,7 @@ class ChkForCalibs(scriptbase.ScriptBase):
         # Run the setup
         ps.run(setup_only=True)#, write_bkg_pairs=args.background)
         is_science = ps.fitstbl.find_frames('science')
+        is_science_or_standard = is_science | ps.fitstbl.find_frames('standard')
 
         msgs.info('Loaded spectrograph {0}'.format(ps.spectrograph.name))
 
@@ -83,18 +78,15 @@ class ChkForCalibs(scriptbase.ScriptBase):
         # they're not truncated.
         answers = table.Table()
         answers['setups'] = list(uniq_cfg.keys())
-        # Add the configuration columns
-        for setup, setup_dict in uniq_cfg.items():
-            for key, value in setup_dict.items():
-                answers[key] = np.empty(len(answers), dtype=object) if isinstance(value, str) \
-                                    else type(value)(0)
-            break
+        # Add the configuration columns, filling each with the values for
+        # all setups at once
+        for key, value in next(iter(uniq_cfg.values()), {}).items():
+            answers[key] = np.array([uniq_cfg[setup].get(key) for setup in uniq_cfg.keys()],
+                                    dtype=object if isinstance(value, str) else None)
         answers['pass'] = False
         answers['scifiles'] = np.empty(len(answers), dtype=object)
 
         for i, setup in enumerate(uniq_cfg.keys()):
-            for setup_key, setup_value in uniq_cfg[setup].items():
-                answers[setup_key] = setup_value
             if setup == 'None':
                 print("There is a setup without science frames.  Skipping...")
                 answers['pass'][i] = False
@@ -112,11 +104,10 @@ class ChkForCalibs(scriptbase.ScriptBase):
             config_specific_file = None
 
             # Grab a science/standard frame
-            data_files = [os.path.join(row['directory'], row['filename']) 
-                            for row in ps.fitstbl[in_cfg]]
-            for idx, row in enumerate(ps.fitstbl[in_cfg]):
-                if 'science' in row['frametype'] or 'standard' in row['frametype']:
-                    config_specific_file = data_files[idx]
+            idx = np.where(in_cfg & is_science_or_standard)[0]
+            if len(idx) > 0:
+                config_specific_file = os.path.join(ps.fitstbl['directory'][idx[-1]],
+                                                    ps.fitstbl['filename'][idx[-1]])
             if config_specific_file is not None:
                 msgs.info('Setting configuration-specific parameters using {0}'.format(
                             os.path.split(config_specific_file)[1]))
@@ -530,6 +530,10 @@ class SpecObjs:
 
         First attempts to grab data from the Summary table, then the list
         """
+        # Avoid infinite recursion when the object is not yet fully
+        # instantiated (e.g., when unpickling)
+        if k == 'specobjs' or k.startswith('__'):
+            raise AttributeError(k)
         if len(self.specobjs) == 0:
             raise ValueError("Empty specobjs")
         try:
@@ -5,8 +5,8 @@ files.
 .. include:: ../include/links.rst
 """
 import os
-import glob
 import re
+import functools
 import warnings
 from pkg_resources import resource_filename
 
@@ -14,11 +14,13 @@ from IPython import embed
 
 import numpy as np
 
-from scipy import interpolate
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 from astropy.io import fits
-from astropy.coordinates import SkyCoord, Angle
-from astropy.table import Table
+from astropy.coordinates import SkyCoord
 from astropy import units, time
 
 import linetools
@@ -38,6 +40,60 @@ from pypeit.utils import index_of_x_eq_y
 from pypeit.spectrographs.slitmask import SlitMask
 from pypeit.spectrographs.opticalmodel import ReflectionGrating, OpticalModel, DetectorMap
 
+
+# Atmospheric model grid used for the telluric correction; see
+# :func:`KeckDEIMOSSpectrograph.default_pypeit_par`
+_telgridfile = os.path.join(resource_filename('pypeit', 'data/telluric/atm_grids/'),
+                            'TelFit_MaunaKea_3100_26100_R20000.fits')
+
+# Calibrated grating roll, yaw, and tilt coefficients, by slider and ruling;
+# see :func:`KeckDEIMOSSpectrograph._grating_orientation`.  These are the
+# newest coefficients and are meant for observations obtained Post-2016
+# Servicing.
+_orientation_coeffs = {3: {    600: [ 0.145, -0.008, 5.6e-4, -0.146],
+                               831: [ 0.143,  0.000, 5.6e-4, -0.018],
+                               900: [ 0.141,  0.000, 5.6e-4, -0.118],
+                              1200: [ 0.145,  0.055, 5.6e-4, -0.141],
+                           'other': [ 0.145,  0.000, 5.6e-4, -0.141] },
+                       4: {    600: [-0.065,  0.063, 6.9e-4, -0.108],
+                               831: [-0.034,  0.060, 6.9e-4, -0.038],
+                               900: [-0.064,  0.083, 6.9e-4, -0.060],
+                              1200: [-0.052,  0.122, 6.9e-4, -0.110],
+                           'other': [-0.050,  0.080, 6.9e-4, -0.110] } }
+
+# Orientation coefficients meant for observations taken Pre-2016 Servicing
+# _orientation_coeffs = {3: {    600: [ 0.145, -0.008, 5.6e-4, -0.182],
+#                                831: [ 0.143,  0.000, 5.6e-4, -0.182],
+#                                900: [ 0.141,  0.000, 5.6e-4, -0.134],
+#                               1200: [ 0.145,  0.055, 5.6e-4, -0.181],
+#                            'other': [ 0.145,  0.000, 5.6e-4, -0.182] },
+#                        4: {    600: [-0.065,  0.063, 6.9e-4, -0.298],
+#                                831: [-0.034,  0.060, 6.9e-4, -0.196],
+#                                900: [-0.064,  0.083, 6.9e-4, -0.277],
+#                               1200: [-0.052,  0.122, 6.9e-4, -0.294],
+#                            'other': [-0.050,  0.080, 6.9e-4, -0.250] } }
+
+
+if njit is None:
+    _fill_chip = None
+else:
+    @njit(parallel=True, cache=True)
+    def _fill_chip(image, rawdatasec_img, oscansec_img, data, oscan, y1, x1, o_y1, o_x1):
+        """
+        Copy the data and overscan of one DEIMOS chip into the mosaic and
+        flag the relevant pixels in the amplifier images, in a single pass
+        over the rows of the chip.  See
+        :func:`KeckDEIMOSSpectrograph.get_rawimage`.
+        """
+        x2 = x1 + data.shape[1]
+        for i in prange(data.shape[0]):
+            image[y1+i,x1:x2] = data[i]
+            rawdatasec_img[y1+i,x1:x2] = 1
+        o_x2 = o_x1 + oscan.shape[1]
+        for i in prange(oscan.shape[0]):
+            image[o_y1+i,o_x1:o_x2] = oscan[i]
+            oscansec_img[o_y1+i,o_x1:o_x2] = 1
+
 class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
     """
     Child to handle Keck/DEIMOS specific code
@@ -50,6 +106,116 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
     supported = True
     comment = 'Supported gratings: 600ZD, 830G, 900ZD, 1200B, 1200G; see :doc:`deimos`'
 
+    # Wavelength-calibration templates for each supported grating
+    _reid_arxiv = {'600ZD': 'keck_deimos_600ZD.fits',
+                   '830G': 'keck_deimos_830G.fits',
+                   '1200G': 'keck_deimos_1200G.fits',
+                   '1200B': 'keck_deimos_1200B.fits',
+                   '900ZD': 'keck_deimos_900ZD.fits'}
+
+    # Rulings of the supported gratings, as adjusted for the optical model;
+    # see :func:`get_grating`
+    _grating_ruling = {'600ZD': 600., '830G': 831.90, '900ZD': 900., '1200B': 1200.06,
+                       '1200G': 1200.06}
+
+    # Wavelengths (in angstroms) covering the full DEIMOS range used by
+    # :func:`mask_to_pixel_coordinates` when none are provided.  Read-only.
+    _default_wave = np.arange(250) * 24. + 4000.
+    _default_wave.flags.writeable = False
+
+    # Detector parameters that do not depend on the frame; see
+    # :func:`get_detector_par`.  Parameters shared by all detectors are in
+    # :attr:`_detector_base`, and those that differ between detectors are
+    # columns of :attr:`_detector_tbl`, with one row per detector.
+    _detector_base = dict(specaxis=0, specflip=False, spatflip=False, platescale=0.1185,
+                          saturation=65535.,    # ADU
+                          nonlinear=0.95,       # Changed by JFH from 0.86 to 0.95
+                          mincounts=-1e10, numamplifiers=1)
+    _detector_tbl = np.array([(4.19, 1.226, 2.570), (3.46, 1.188, 2.491), (4.03, 1.248, 2.618),
+                              (3.80, 1.220, 2.557), (4.71, 1.184, 2.482), (4.28, 1.177, 2.469),
+                              (3.33, 1.201, 2.518), (3.69, 1.230, 2.580)],
+                             dtype=[('darkcurr', float), ('gain', float), ('ronoise', float)])
+
+    # Metadata keywords and how they are derived from the header cards; see
+    # :func:`init_meta`
+    _meta = {
+        # Required (core)
+        'ra': dict(ext=0, card='RA'),
+        'dec': dict(ext=0, card='DEC'),
+        'target': dict(ext=0, card='TARGNAME'),
+        'decker': dict(ext=0, card='SLMSKNAM'),
+        'binning': dict(card=None, compound=True),
+        'mjd': dict(card=None, compound=True),
+        'exptime': dict(ext=0, card='ELAPTIME'),
+        'airmass': dict(ext=0, card='AIRMASS'),
+        'dispname': dict(ext=0, card='GRATENAM'),
+        # Extras for config and frametyping
+        'hatch': dict(ext=0, card='HATCHPOS'),
+        'dispangle': dict(card=None, compound=True, rtol=1e-5),
+        # Image type
+        'idname': dict(ext=0, card='OBSTYPE'),
+        # Lamps
+        'lampstat01': dict(ext=0, card='LAMPS'),
+        # Extras for pypeit file
+        'dateobs': dict(ext=0, card='DATE-OBS'),
+        'utc': dict(ext=0, card='UTC'),
+        'mode': dict(ext=0, card='MOSMODE'),
+        'amp': dict(ext=0, card='AMPMODE'),
+        'object': dict(ext=0, card='OBJECT'),
+        'filter1': dict(ext=0, card='DWFILNAM'),
+        'frameno': dict(ext=0, card='FRAMENO'),
+        'instrument': dict(ext=0, card='INSTRUME'),
+    }
+
+    # Alterations to the default parameters; see :func:`default_pypeit_par`
+    _default_par_updates = {
+        # Spectral flexure correction
+        'flexure': {'spec_method': 'boxcar'},
+        'calibrations': {
+            # Set wave tilts order
+            'slitedges': {'edge_thresh': 50., 'fit_order': 3, 'minimum_slit_gap': 0.25,
+                          'minimum_slit_length_sci': 4.},
+            # 1D wavelength solution
+            'wavelengths': {'lamps': ['ArI','NeI','KrI','XeI'], 'n_first': 3,
+                            'match_toler': 2.5},
+            # Alter the method used to combine pixel flats
+            'pixelflatframe': {'process': {'combine': 'median', 'comb_sigrej': 10.}},
+            # Do not sigmaclip the arc frames
+            'arcframe': {'process': {'clip': False}},
+            # Do not sigmaclip the tilt frames
+            'tiltframe': {'process': {'clip': False}},
+            # Lower value of tracethresh
+            'tilts': {'tracethresh': 10}},
+        # LACosmics parameters
+        'scienceframe': {'process': {'sigclip': 4.0, 'objlim': 1.5}},
+        # Find objects
+        #  The following corresponds to 1.1" if unbinned (DEIMOS is never binned)
+        'reduce': {'findobj': {'find_fwhm': 10.}},
+    }
+
+    # Bad columns on each detector, used by :func:`bpm`; negative indices
+    # count from the last column.
+    _bad_columns = {1: np.r_[1052:1054],
+                    2: np.r_[0:4, 376:381, 489, 1333:1335, 2047],
+                    3: np.r_[0:4, 221, 260, 366, 816:819, 851, 940, 1167, 1280, 1301:1303,
+                             1744:1747, -4, -3, -2, -1],
+                    4: np.r_[0:4, 47, 744, 790:792, 997:999],
+                    5: np.r_[25:27, 128:130, 1535:1539],
+                    7: np.r_[426:428, 676, 1176:1178],
+                    8: np.r_[440, 509:513, 806, 931:934]}
+
+    # The idname, whether or not the lamps are on, and the hatch position
+    # that select each simple frame type; see :func:`check_frame_type`
+    _frame_type_specs = {'science': ('Object', False, 'open'),
+                         'bias': ('Bias', False, 'closed'),
+                         'dark': ('Dark', False, 'closed'),
+                         'arc': ('Line', True, 'closed'),
+                         'tilt': ('Line', True, 'closed')}
+
+    # Header card with the central wavelength for each grating position; see
+    # :func:`compound_meta`
+    _tltwav_card = {3: 'G3TLTWAV', 4: 'G4TLTWAV'}
+
     def __init__(self):
         super().__init__()
 
@@ -78,92 +244,20 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         """
         # Binning
         # TODO: Could this be detector dependent?
-        binning = '1,1' if hdu is None else self.get_meta_value(self.get_headarr(hdu), 'binning')
-
-        # Detector 1
-        detector_dict1 = dict(
-            binning         = binning,
-            det             = 1,
-            dataext         = 1,
-            specaxis        = 0,
-            specflip        = False,
-            spatflip        = False,
-            platescale      = 0.1185,
-            darkcurr        = 4.19,
-            saturation      = 65535., # ADU
-            nonlinear       = 0.95,   # Changed by JFH from 0.86 to 0.95
-            mincounts       = -1e10,
-            numamplifiers   = 1,
-            gain            = np.atleast_1d(1.226),
-            ronoise         = np.atleast_1d(2.570),
-            )
-        # Detector 2
-        detector_dict2 = detector_dict1.copy()
-        detector_dict2.update(dict(
-            det=2,
-            dataext=2,
-            darkcurr=3.46,
-            gain=np.atleast_1d(1.188),
-            ronoise=np.atleast_1d(2.491),
-        ))
-        # Detector 3
-        detector_dict3 = detector_dict1.copy()
-        detector_dict3.update(dict(
-            det=3,
-            dataext=3,
-            darkcurr=4.03,
-            gain=np.atleast_1d(1.248),
-            ronoise=np.atleast_1d(2.618),
-        ))
-        # Detector 4
-        detector_dict4 = detector_dict1.copy()
-        detector_dict4.update(dict(
-            det=4,
-            dataext=4,
-            darkcurr=3.80,
-            gain=np.atleast_1d(1.220),
-            ronoise=np.atleast_1d(2.557),
-        ))
-        # Detector 5
-        detector_dict5 = detector_dict1.copy()
-        detector_dict5.update(dict(
-            det=5,
-            dataext=5,
-            darkcurr=4.71,
-            gain=np.atleast_1d(1.184),
-            ronoise=np.atleast_1d(2.482),
-        ))
-        # Detector 6
-        detector_dict6 = detector_dict1.copy()
-        detector_dict6.update(dict(
-            det=6,
-            dataext=6,
-            darkcurr=4.28,
-            gain=np.atleast_1d(1.177),
-            ronoise=np.atleast_1d(2.469),
-        ))
-        # Detector 7
-        detector_dict7 = detector_dict1.copy()
-        detector_dict7.update(dict(
-            det=7,
-            dataext=7,
-            darkcurr=3.33,
-            gain=np.atleast_1d(1.201),
-            ronoise=np.atleast_1d(2.518),
-        ))
-        # Detector 8
-        detector_dict8 = detector_dict1.copy()
-        detector_dict8.update(dict(
-            det=8,
-            dataext=8,
-            darkcurr=3.69,
-            gain=np.atleast_1d(1.230),
-            ronoise=np.atleast_1d(2.580),
-        ))
-        detectors = [detector_dict1, detector_dict2, detector_dict3, detector_dict4,
-                     detector_dict5, detector_dict6, detector_dict7, detector_dict8]
+        # NOTE: The binning is constructed using only the primary header, so
+        # only that header is passed to avoid parsing the headers of all the
+        # (lazily loaded) HDUs.
+        binning = '1,1' if hdu is None else self.get_meta_value([hdu[0].header], 'binning')
+
+        # Combine the fixed parameters of the selected detector with the
+        # frame-dependent binning
+        row = self._detector_tbl[det-1]
         # Return
-        return detector_container.DetectorContainer(**detectors[det-1])
+        return detector_container.DetectorContainer(**self._detector_base, binning=binning,
+                                                    det=det, dataext=det,
+                                                    darkcurr=float(row['darkcurr']),
+                                                    gain=np.atleast_1d(row['gain']),
+                                                    ronoise=np.atleast_1d(row['ronoise']))
 
     @classmethod
     def default_pypeit_par(cls):
@@ -176,46 +270,15 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         """
         par = super().default_pypeit_par()
 
-        # Spectral flexure correction
-        par['flexure']['spec_method'] = 'boxcar'
-        # Set wave tilts order
-        par['calibrations']['slitedges']['edge_thresh'] = 50.
-        par['calibrations']['slitedges']['fit_order'] = 3
-        par['calibrations']['slitedges']['minimum_slit_gap'] = 0.25
-        par['calibrations']['slitedges']['minimum_slit_length_sci'] = 4.
-
-        # 1D wavelength solution
-        par['calibrations']['wavelengths']['lamps'] = ['ArI','NeI','KrI','XeI']
-        par['calibrations']['wavelengths']['n_first'] = 3
-        par['calibrations']['wavelengths']['match_toler'] = 2.5
-
         # Do not require bias frames
         turn_off = dict(use_biasimage=False)
         par.reset_all_processimages_par(**turn_off)
 
-        # Alter the method used to combine pixel flats
-        par['calibrations']['pixelflatframe']['process']['combine'] = 'median'
-        par['calibrations']['pixelflatframe']['process']['comb_sigrej'] = 10.
-
-        # Do not sigmaclip the arc frames
-        par['calibrations']['arcframe']['process']['clip'] = False
-        # Do not sigmaclip the tilt frames
-        par['calibrations']['tiltframe']['process']['clip'] = False
-        # Lower value of tracethresh
-        par['calibrations']['tilts']['tracethresh'] = 10
-
-        # LACosmics parameters
-        par['scienceframe']['process']['sigclip'] = 4.0
-        par['scienceframe']['process']['objlim'] = 1.5
-
-        # Find objects
-        #  The following corresponds to 1.1" if unbinned (DEIMOS is never binned)
-        par['reduce']['findobj']['find_fwhm'] = 10.  
+        # Apply the remaining DEIMOS defaults
+        par.update(cls._default_par_updates)
 
         # If telluric is triggered
-        par['sensfunc']['IR']['telgridfile'] \
-                = os.path.join(par['sensfunc']['IR'].default_root,
-                               'TelFit_MaunaKea_3100_26100_R20000.fits')
+        par['sensfunc']['IR']['telgridfile'] = _telgridfile
         return par
 
     def config_specific_par(self, scifile, inp_par=None):
@@ -238,21 +301,24 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         par = super().config_specific_par(scifile, inp_par=inp_par)
 
         headarr = self.get_headarr(scifile)
+        decker = self.get_meta_value(headarr, 'decker')
+        dispname = self.get_meta_value(headarr, 'dispname')
+
+        # Classify the slitmask
+        # TODO: I'm a bit worried that this won't catch all
+        # long-slits...
+        is_lvm = 'LVMslit' in decker
+        is_long = 'Long' in decker
 
         # When using LVM mask reduce only detectors 3,7
-        if 'LVMslit' in self.get_meta_value(headarr, 'decker'):
+        if is_lvm:
             par['rdx']['detnum'] = [3,7]
 
-        # Turn PCA off for long slits
-        # TODO: I'm a bit worried that this won't catch all
-        # long-slits...
-        if ('Long' in self.get_meta_value(headarr, 'decker')) or (
-                'LVMslit' in self.get_meta_value(headarr, 'decker')):
+        if is_long or is_lvm:
+            # Turn PCA off for long slits
             par['calibrations']['slitedges']['sync_predict'] = 'nearest'
-
-        # Turn on the use of mask design
-        if ('Long' not in self.get_meta_value(headarr, 'decker')) and (
-                'LVMslit' not in self.get_meta_value(headarr, 'decker')):
+        else:
+            # Turn on the use of mask design
             # TODO -- Move this parameter into SlitMaskPar??
             par['calibrations']['slitedges']['use_maskdesign'] = True
             # Since we use the slitmask info to find the alignment boxes, I don't need `minimum_slit_length_sci`
@@ -271,30 +337,16 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
             par['reduce']['slitmask']['extract_missing_objs'] = True
 
         # Templates
-        if self.get_meta_value(headarr, 'dispname') == '600ZD':
-            par['calibrations']['wavelengths']['method'] = 'full_template'
-            par['calibrations']['wavelengths']['reid_arxiv'] = 'keck_deimos_600ZD.fits'
-            # par['calibrations']['wavelengths']['lamps'] += ['CdI', 'ZnI', 'HgI']
-        elif self.get_meta_value(headarr, 'dispname') == '830G':
-            par['calibrations']['wavelengths']['method'] = 'full_template'
-            par['calibrations']['wavelengths']['reid_arxiv'] = 'keck_deimos_830G.fits'
-        elif self.get_meta_value(headarr, 'dispname') == '1200G':
-            par['calibrations']['wavelengths']['method'] = 'full_template'
-            par['calibrations']['wavelengths']['reid_arxiv'] = 'keck_deimos_1200G.fits'
-        elif self.get_meta_value(headarr, 'dispname') == '1200B':
+        if dispname in self._reid_arxiv:
             par['calibrations']['wavelengths']['method'] = 'full_template'
-            par['calibrations']['wavelengths']['reid_arxiv'] = 'keck_deimos_1200B.fits'
-            # par['calibrations']['wavelengths']['lamps'] += ['CdI', 'ZnI', 'HgI']
-        elif self.get_meta_value(headarr, 'dispname') == '900ZD':
-            par['calibrations']['wavelengths']['method'] = 'full_template'
-            par['calibrations']['wavelengths']['reid_arxiv'] = 'keck_deimos_900ZD.fits'
+            par['calibrations']['wavelengths']['reid_arxiv'] = self._reid_arxiv[dispname]
             # par['calibrations']['wavelengths']['lamps'] += ['CdI', 'ZnI', 'HgI']
         # Arc lamps list from header
         par['calibrations']['wavelengths']['lamps'] = ['use_header']
 
         # FWHM
-        binning = parse.parse_binning(self.get_meta_value(headarr, 'binning'))
-        par['calibrations']['wavelengths']['fwhm'] = 6.0 / binning[1]
+        _, binspatial = parse.parse_binning(self.get_meta_value(headarr, 'binning'))
+        par['calibrations']['wavelengths']['fwhm'] = 6.0 / binspatial
         par['calibrations']['wavelengths']['fwhm_fromlines'] = True
 
         # Return
@@ -307,34 +359,9 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         That is, this associates the ``PypeIt``-specific metadata keywords
         with the instrument-specific header cards using :attr:`meta`.
         """
-        self.meta = {}
-        # Required (core)
-        self.meta['ra'] = dict(ext=0, card='RA')
-        self.meta['dec'] = dict(ext=0, card='DEC')
-        self.meta['target'] = dict(ext=0, card='TARGNAME')
-        self.meta['decker'] = dict(ext=0, card='SLMSKNAM')
-        self.meta['binning'] = dict(card=None, compound=True)
-
-        self.meta['mjd'] = dict(card=None, compound=True)
-        self.meta['exptime'] = dict(ext=0, card='ELAPTIME')
-        self.meta['airmass'] = dict(ext=0, card='AIRMASS')
-        self.meta['dispname'] = dict(ext=0, card='GRATENAM')
-        # Extras for config and frametyping
-        self.meta['hatch'] = dict(ext=0, card='HATCHPOS')
-        self.meta['dispangle'] = dict(card=None, compound=True, rtol=1e-5)
-        # Image type
-        self.meta['idname'] = dict(ext=0, card='OBSTYPE')
-        # Lamps
-        self.meta['lampstat01'] = dict(ext=0, card='LAMPS')
-        # Extras for pypeit file
-        self.meta['dateobs'] = dict(ext=0, card='DATE-OBS')
-        self.meta['utc'] = dict(ext=0, card='UTC')
-        self.meta['mode'] = dict(ext=0, card='MOSMODE')
-        self.meta['amp'] = dict(ext=0, card='AMPMODE')
-        self.meta['object'] = dict(ext=0, card='OBJECT')
-        self.meta['filter1'] = dict(ext=0, card='DWFILNAM')
-        self.meta['frameno'] = dict(ext=0, card='FRAMENO')
-        self.meta['instrument'] = dict(ext=0, card='INSTRUME')
+        # The definitions are shared by all instances; only the top-level
+        # dictionary is copied.
+        self.meta = dict(self._meta)
 
     def compound_meta(self, headarr, meta_key):
         """
@@ -350,22 +377,25 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         Returns:
             object: Metadata value read from the header(s).
         """
+        # Each card is only looked up once in the primary header
+        hdr = headarr[0]
         if meta_key == 'binning':
-            binspatial, binspec = parse.parse_binning(headarr[0]['BINNING'])
+            binspatial, binspec = parse.parse_binning(hdr['BINNING'])
             binning = parse.binning2string(binspec, binspatial)
             return binning
         elif meta_key == 'dispangle':
-            if headarr[0]['GRATEPOS'] == 3:
-                return headarr[0]['G3TLTWAV']
-            elif headarr[0]['GRATEPOS'] == 4:
-                return headarr[0]['G4TLTWAV']
-            else:
-                msgs.warn('This is probably a problem. Non-standard DEIMOS GRATEPOS={0}.'.format(headarr[0]['GRATEPOS']))
+            gratepos = hdr['GRATEPOS']
+            card = self._tltwav_card.get(gratepos)
+            if card is None:
+                msgs.warn('This is probably a problem. Non-standard DEIMOS GRATEPOS={0}.'.format(gratepos))
+                return None
+            return hdr[card]
         elif meta_key == 'mjd':
-            if headarr[0].get('MJD-OBS', None) is not None:
-                return headarr[0]['MJD-OBS']
+            mjd = hdr.get('MJD-OBS', None)
+            if mjd is not None:
+                return mjd
             else:
-                return time.Time('{}T{}'.format(headarr[0]['DATE-OBS'], headarr[0]['UTC'])).mjd
+                return _iso_to_mjd(hdr['DATE-OBS'], hdr['UTC'])
         else:
             msgs.error("Not ready for this compound meta")
 
@@ -486,32 +516,36 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
             `numpy.ndarray`_: Boolean array with the flags selecting the
             exposures in ``fitstbl`` that are ``ftype`` type frames.
         """
-        good_exp = (framematch.check_frame_exptime(fitstbl['exptime'], exprng)) \
-                        & (fitstbl['mode'] == 'Spectral')
-        if ftype == 'science':
-            return good_exp & (fitstbl['idname'] == 'Object') & (fitstbl['lampstat01'] == 'Off') \
-                        & (fitstbl['hatch'] == 'open')
-        if ftype == 'bias':
-            return good_exp & (fitstbl['idname'] == 'Bias') & (fitstbl['lampstat01'] == 'Off') \
-                        & (fitstbl['hatch'] == 'closed')
-        if ftype in ['pixelflat', 'trace', 'illumflat']:
-            # Flats and trace frames are typed together
-            is_flat = np.any(np.vstack([(fitstbl['idname'] == n) & (fitstbl['hatch'] == h)
-                                    for n,h in zip(['IntFlat', 'DmFlat', 'SkyFlat'],
-                                                   ['closed', 'open', 'open'])]), axis=0)
-            return good_exp & is_flat & (fitstbl['lampstat01'] != 'Off')
         if ftype == 'pinhole':
             # Pinhole frames are never assigned for DEIMOS
             return np.zeros(len(fitstbl), dtype=bool)
-        if ftype == 'dark':
-            return good_exp & (fitstbl['idname'] == 'Dark') & (fitstbl['lampstat01'] == 'Off') \
-                        & (fitstbl['hatch'] == 'closed')
-        if ftype in ['arc', 'tilt']:
-            return good_exp & (fitstbl['idname'] == 'Line') & (fitstbl['hatch'] == 'closed') \
-                        & (fitstbl['lampstat01'] != 'Off')
+        if ftype not in self._frame_type_specs and ftype not in ['pixelflat', 'trace', 'illumflat']:
+            msgs.warn('Cannot determine if frames are of type {0}.'.format(ftype))
+            return np.zeros(len(fitstbl), dtype=bool)
 
-        msgs.warn('Cannot determine if frames are of type {0}.'.format(ftype))
-        return np.zeros(len(fitstbl), dtype=bool)
+        good_exp = (framematch.check_frame_exptime(fitstbl['exptime'], exprng)) \
+                        & (fitstbl['mode'] == 'Spectral')
+        # Only compare the remaining metadata for the frames with a valid
+        # exposure time and mode
+        is_type = np.zeros(len(fitstbl), dtype=bool)
+        indx = np.flatnonzero(good_exp)
+        if indx.size == 0:
+            return is_type
+        idname = fitstbl['idname'][indx]
+        hatch = fitstbl['hatch'][indx]
+        lampstat = fitstbl['lampstat01'][indx]
+
+        if ftype in self._frame_type_specs:
+            _idname, lamps_on, _hatch = self._frame_type_specs[ftype]
+            lamps = lampstat != 'Off' if lamps_on else lampstat == 'Off'
+            is_type[indx] = (idname == _idname) & (hatch == _hatch) & lamps
+            return is_type
+
+        # Flats and trace frames are typed together
+        is_flat = ((idname == 'IntFlat') & (hatch == 'closed')) \
+                    | (((idname == 'DmFlat') | (idname == 'SkyFlat')) & (hatch == 'open'))
+        is_type[indx] = is_flat & (lampstat != 'Off')
+        return is_type
 
     # TODO: We should aim to get rid of this... I'm not sure it's ever used...
     def idname(self, ftype):
@@ -587,60 +621,61 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
             pixel. Pixels unassociated with any amplifier are set to 0.
         """
         # Check for file; allow for extra .gz, etc. suffix
-        # TODO: Why not use os.path.isfile?
-        fil = glob.glob(raw_file + '*')
+        fil = [raw_file + sfx for sfx in ['', '.gz', '.fz', '.bz2']
+                    if os.path.isfile(raw_file + sfx)][:1]
         if len(fil) != 1:
-            msgs.error('Found {0} files matching {1}'.format(len(fil), raw_file + '*'))
+            msgs.error('Could not find {0} or its compressed version.'.format(raw_file))
         # Read
         msgs.info("Reading DEIMOS file: {:s}".format(fil[0]))
 
-        hdu = io.fits_open(fil[0])
-        if hdu[0].header['AMPMODE'] != 'SINGLE:B':
+        # The HDUs are loaded lazily, such that only the primary HDU and the
+        # HDUs of the requested detectors are parsed.
+        hdu = io.fits_open(fil[0], lazy_load_hdus=True)
+        primary_hdr = hdu[0].header
+        if primary_hdr['AMPMODE'] != 'SINGLE:B':
             msgs.error('PypeIt can only reduce images with AMPMODE == SINGLE:B.')
-        if hdu[0].header['MOSMODE'] != 'Spectral':
+        if primary_hdr['MOSMODE'] != 'Spectral':
             msgs.error('PypeIt can only reduce images with MOSMODE == Spectral.')
 
         # Get post, pre-pix values
-        postpix = hdu[0].header['POSTPIX']
-        detlsize = hdu[0].header['DETLSIZE']
+        postpix = primary_hdr['POSTPIX']
+        detlsize = primary_hdr['DETLSIZE']
         x0, x_npix, y0, y_npix = np.array(parse.load_sections(detlsize)).flatten()
 
-        # Create final image
-        if det is None:
-            image = np.zeros((x_npix, y_npix + 4 * postpix))
-            rawdatasec_img = np.zeros_like(image, dtype=int)
-            oscansec_img = np.zeros_like(image, dtype=int)
-
         # get the x and y binning factors...
-        binning = hdu[0].header['BINNING']
+        binning = primary_hdr['BINNING']
         if binning != '1,1':
             msgs.error("This binning for DEIMOS might not work.  But it might..")
 
-        # DEIMOS detectors
-        nchip = 8
-
-        if det is None:
-            chips = range(nchip)
+        if det is not None:
+            # Read a single detector; the overscan is appended to the
+            # data columns
+            data, oscan = deimos_read_1chip(hdu, det)
+            image = np.concatenate((data, oscan), axis=1).astype(float, copy=False)
+            rawdatasec_img = np.zeros(image.shape, dtype=np.int8)
+            rawdatasec_img[:,:data.shape[1]] = 1 # Amp
+            oscansec_img = np.zeros(image.shape, dtype=np.int8)
+            oscansec_img[:,data.shape[1]:] = 1 # Amp
         else:
-            chips = [det - 1]  # Indexing starts at 0 here
-        # Loop
-        for tt in chips:
-            data, oscan = deimos_read_1chip(hdu, tt + 1)
-
-            # One detector??
-            if det is not None:
-                image = np.zeros((data.shape[0], data.shape[1] + oscan.shape[1]))
-                rawdatasec_img = np.zeros_like(image, dtype=int)
-                oscansec_img = np.zeros_like(image, dtype=int)
-
-            # Indexing
-            x1, x2, y1, y2, o_x1, o_x2, o_y1, o_y2 = indexing(tt, postpix, det=det)
-
-            # Fill
-            image[y1:y2, x1:x2] = data
-            rawdatasec_img[y1:y2, x1:x2] = 1 # Amp
-            image[o_y1:o_y2, o_x1:o_x2] = oscan
-            oscansec_img[o_y1:o_y2, o_x1:o_x2] = 1 # Amp
+            # Create the mosaic of all the DEIMOS detectors
+            nchip = 8
+            image = np.zeros((x_npix, y_npix + 4 * postpix))
+            rawdatasec_img = np.zeros(image.shape, dtype=np.int8)
+            oscansec_img = np.zeros(image.shape, dtype=np.int8)
+            for tt in range(nchip):
+                data, oscan = deimos_read_1chip(hdu, tt + 1)
+                # Indexing
+                x1, x2, y1, y2, o_x1, o_x2, o_y1, o_y2 = indexing(tt, postpix)
+                # Fill
+                if _fill_chip is not None and data.dtype.isnative and oscan.dtype.isnative \
+                        and data.shape == (y2-y1, x2-x1) and oscan.shape == (o_y2-o_y1, o_x2-o_x1):
+                    _fill_chip(image, rawdatasec_img, oscansec_img, data, oscan, y1, x1, o_y1,
+                               o_x1)
+                    continue
+                image[y1:y2, x1:x2] = data
+                rawdatasec_img[y1:y2, x1:x2] = 1 # Amp
+                image[o_y1:o_y2, o_x1:o_x2] = oscan
+                oscansec_img[o_y1:o_y2, o_x1:o_x2] = 1 # Amp
 
         # Return
         exptime = hdu[self.meta['exptime']['ext']].header[self.meta['exptime']['card']]
@@ -677,46 +712,13 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         # Call the base-class method to generate the empty bpm
         bpm_img = super().bpm(filename, det, shape=shape, msbias=msbias)
 
-        if det == 1:
-            bpm_img[:,1052:1054] = 1
-        elif det == 2:
-            bpm_img[:,0:4] = 1
-            bpm_img[:,376:381] = 1
-            bpm_img[:,489] = 1
-            bpm_img[:,1333:1335] = 1
-            bpm_img[:,2047] = 1
-        elif det == 3:
-            bpm_img[:,0:4] = 1
-            bpm_img[:,221] = 1
-            bpm_img[:,260] = 1
-            bpm_img[:,366] = 1
-            bpm_img[:,816:819] = 1
-            bpm_img[:,851] = 1
-            bpm_img[:,940] = 1
-            bpm_img[:,1167] = 1
-            bpm_img[:,1280] = 1
-            bpm_img[:,1301:1303] = 1
-            bpm_img[:,1744:1747] = 1
-            bpm_img[:,-4:] = 1
-        elif det == 4:
-            bpm_img[:,0:4] = 1
-            bpm_img[:,47] = 1
-            bpm_img[:,744] = 1
-            bpm_img[:,790:792] = 1
-            bpm_img[:,997:999] = 1
-        elif det == 5:
-            bpm_img[:,25:27] = 1
-            bpm_img[:,128:130] = 1
-            bpm_img[:,1535:1539] = 1
-        elif det == 7:
-            bpm_img[:,426:428] = 1
-            bpm_img[:,676] = 1
-            bpm_img[:,1176:1178] = 1
-        elif det == 8:
-            bpm_img[:,440] = 1
-            bpm_img[:,509:513] = 1
-            bpm_img[:,806] = 1
-            bpm_img[:,931:934] = 1
+        if det in self._bad_columns:
+            # Flag the bad columns in a single row and broadcast it over the
+            # image, which writes contiguous rows instead of strided columns
+            cols = self._bad_columns[det]
+            bad_row = np.zeros(bpm_img.shape[1], dtype=bpm_img.dtype)
+            bad_row[cols[cols < bad_row.size]] = 1
+            np.maximum(bpm_img, bad_row, out=bpm_img)
 
         return bpm_img
 
@@ -733,7 +735,9 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
 
         """
 
-        return [f'{lamp}I' for lamp in np.unique(np.concatenate([lname.split() for lname in fitstbl['lampstat01']]))]
+        # Sorted to match the order returned by np.unique
+        return [f'{lamp}I' for lamp in sorted({lamp for lname in fitstbl['lampstat01']
+                                                     for lamp in lname.split()})]
 
     def get_telescope_offset(self, file_list):
         """
@@ -750,31 +754,35 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         """
         # file (can be a raw or a spec2d)
         deimos_files = np.atleast_1d(file_list)
-        # headers for all the files
-        hdrs = np.array([self.get_headarr(file) for file in deimos_files], dtype=object)
+        nfiles = deimos_files.size
+        # primary headers for all the files; all the keywords needed are in
+        # the primary header, so there's no need to parse the other HDUs
+        hdrs = [[fits.getheader(file, ext=0)] for file in deimos_files]
         # mjd for al the files
-        mjds = np.array([self.get_meta_value(aa, 'mjd') for aa in hdrs], dtype=object)
-        # sort
-        sorted_by_mjd = np.argsort(mjds)
+        mjds = np.fromiter((self.get_meta_value(aa, 'mjd') for aa in hdrs), dtype=float,
+                           count=nfiles)
+        # sort the headers by mjd, so that the arrays below are built in
+        # time order
+        hdrs = [hdrs[i] for i in np.argsort(mjds)]
         # telescope coordinates
         # precision: RA=0.15", Dec=0.1"
-        ras = np.array([self.get_meta_value(aa, 'ra') for aa in hdrs], dtype=object)[sorted_by_mjd]
-        decs = np.array([self.get_meta_value(aa, 'dec') for aa in hdrs], dtype=object)[sorted_by_mjd]
+        ras = np.fromiter((self.get_meta_value(aa, 'ra') for aa in hdrs), dtype=float,
+                          count=nfiles)
+        decs = np.fromiter((self.get_meta_value(aa, 'dec') for aa in hdrs), dtype=float,
+                           count=nfiles)
+        # ROTPOSN take into account small changes in the mask PA
+        rotposn = np.fromiter((aa[0]['ROTPOSN'] for aa in hdrs), dtype=float, count=nfiles)
         coords = SkyCoord(ra=ras, dec=decs, frame='fk5', unit='deg')
 
-        # compute telescope offsets with respect to the first frame
-        tel_off = []
-        for i in range(len(coords)):
-            offset = coords[0].separation(coords[i])
-            pa = coords[0].position_angle(coords[i])
-            # ROTPOSN take into account small changes in the mask PA
-            maskpa = Angle((hdrs[i][0]['ROTPOSN'] + 90.) * units.deg)
-            # tetha = PA in the slitmask reference frame
-            theta = pa - maskpa
-            # telescope offset
-            tel_off.append(offset.arcsec * np.cos(theta))
-
-        return np.array(tel_off)
+        # compute telescope offsets with respect to the first frame, for all
+        # frames at once
+        offset = coords[0].separation(coords)
+        pa = coords[0].position_angle(coords)
+        maskpa = (rotposn + 90.) * units.deg
+        # tetha = PA in the slitmask reference frame
+        theta = (pa - maskpa).to_value(units.rad)
+        # telescope offset
+        return offset.to_value(units.arcsec) * np.cos(theta)
 
     def get_slitmask(self, filename):
         """
@@ -782,65 +790,70 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         :class:`~pypeit.spectrographs.slitmask.SlitMask` object.
 
         Args:
-            filename (:obj:`str`):
-                Name of the file to read.
+            filename (:obj:`str`, `astropy.io.fits.HDUList`_):
+                Name of the file to read, or the already opened file.
 
         Returns:
             :class:`~pypeit.spectrographs.slitmask.SlitMask`: The slitmask
             data read from the file. The returned object is the same as
             :attr:`slitmask`.
         """
-        # Open the file
-        hdu = io.fits_open(filename)
+        # Open the file (if necessary) and pull out each of the required
+        # tables once
+        hdu = _open_maskdef(filename)
+        objmap = hdu['SlitObjMap'].data
+        objcat = hdu['ObjectCat'].data
+        desislits = hdu['DesiSlits'].data
+        bluslits = hdu['BluSlits'].data
 
         # Build the object data
         #   - Find the index of the object IDs in the slit-object
         #     mapping that match the object catalog
-        mapid = hdu['SlitObjMap'].data['ObjectID']
-        catid = hdu['ObjectCat'].data['ObjectID']
+        mapid = objmap['ObjectID']
+        catid = objcat['ObjectID']
         indx = index_of_x_eq_y(mapid, catid)
-        objname = [item.strip() for item in hdu['ObjectCat'].data['OBJECT']]
-        #   - Pull out the slit ID, object ID, name, object coordinates, top and bottom distance
-        objects = np.array([hdu['SlitObjMap'].data['dSlitId'][indx].astype(int),
-                            catid.astype(int),
-                            hdu['ObjectCat'].data['RA_OBJ'],
-                            hdu['ObjectCat'].data['DEC_OBJ'],
-                            objname,
-                            hdu['ObjectCat'].data['mag'],
-                            hdu['ObjectCat'].data['pBand'],
-                            hdu['SlitObjMap'].data['TopDist'][indx],
-                            hdu['SlitObjMap'].data['BotDist'][indx]]).T
         #   - Only keep the objects that are in the slit-object mapping
-        objects = objects[mapid[indx] == catid]
+        keep = mapid[indx] == catid
+        indx = indx[keep]
+        #   - Pull out the slit ID, object ID, name, object coordinates, top and bottom distance
+        objects = np.rec.fromarrays([objmap['dSlitId'][indx].astype(int),
+                                     catid[keep].astype(int),
+                                     objcat['RA_OBJ'][keep].astype(float),
+                                     objcat['DEC_OBJ'][keep].astype(float),
+                                     np.char.strip(objcat['OBJECT'][keep]),
+                                     objcat['mag'][keep].astype(float),
+                                     objcat['pBand'][keep],
+                                     objmap['TopDist'][indx].astype(float),
+                                     objmap['BotDist'][indx].astype(float)],
+                                    names=[name for name, _ in SlitMask.object_fields])
 
         # Match the slit IDs in DesiSlits to those in BluSlits
-        indx = index_of_x_eq_y(hdu['DesiSlits'].data['dSlitId'], hdu['BluSlits'].data['dSlitId'],
-                               strict=True)
+        indx = index_of_x_eq_y(desislits['dSlitId'], bluslits['dSlitId'], strict=True)
 
         # PA corresponding to positive x on detector (spatial)
         posx_pa = hdu['MaskDesign'].data['PA_PNT'][0]
         if posx_pa < 0.:
             posx_pa += 360.
 
+        # Slit corners, filled directly into the (nslits, 4, 2) array
+        # expected by SlitMask
+        corners = np.empty((len(bluslits), 4, 2), dtype=float)
+        for i in range(4):
+            corners[:,i,0] = bluslits['slitX{0}'.format(i+1)]
+            corners[:,i,1] = bluslits['slitY{0}'.format(i+1)]
+
+        # On-sky coordinates and geometry of each slit
+        onsky = np.empty((len(bluslits), 5), dtype=float)
+        for i, key in enumerate(['slitRA', 'slitDec', 'slitLen', 'slitWid', 'slitLPA']):
+            onsky[:,i] = desislits[key][indx]
+
         # Instantiate the slit mask object and return it
-        self.slitmask = SlitMask(np.array([hdu['BluSlits'].data['slitX1'],
-                                           hdu['BluSlits'].data['slitY1'],
-                                           hdu['BluSlits'].data['slitX2'],
-                                           hdu['BluSlits'].data['slitY2'],
-                                           hdu['BluSlits'].data['slitX3'],
-                                           hdu['BluSlits'].data['slitY3'],
-                                           hdu['BluSlits'].data['slitX4'],
-                                           hdu['BluSlits'].data['slitY4']]).T.reshape(-1,4,2),
-                                 slitid=hdu['BluSlits'].data['dSlitId'],
-                                 align=hdu['DesiSlits'].data['slitTyp'][indx] == 'A',
-                                 science=hdu['DesiSlits'].data['slitTyp'][indx] == 'P',
-                                 onsky=np.array([hdu['DesiSlits'].data['slitRA'][indx],
-                                                 hdu['DesiSlits'].data['slitDec'][indx],
-                                                 hdu['DesiSlits'].data['slitLen'][indx],
-                                                 hdu['DesiSlits'].data['slitWid'][indx],
-                                                 hdu['DesiSlits'].data['slitLPA'][indx]]).T,
+        self.slitmask = SlitMask(corners, slitid=bluslits['dSlitId'],
+                                 align=desislits['slitTyp'][indx] == 'A',
+                                 science=desislits['slitTyp'][indx] == 'P',
+                                 onsky=onsky,
                                  objects=objects,
-                                 #object_names=hdu['ObjectCat'].data['OBJECT'],
+                                 #object_names=objcat['OBJECT'],
                                  posx_pa=posx_pa)
         return self.slitmask
 
@@ -857,15 +870,16 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         xidl/DEEP2/spec2d/pro/deimos_grating.pro
 
         Args:
-            filename (:obj:`str`):
-                Name of the file with the grating metadata.
+            filename (:obj:`str`, `astropy.io.fits.HDUList`_):
+                Name of the file with the grating metadata, or the already
+                opened file.
 
         Returns:
             :class:`~pypeit.spectrographs.opticalmodel.ReflectionGrating`:
             The grating instance relevant to the data in ``filename``. The
             returned object is the same as :attr:`grating`.
         """
-        hdu = io.fits_open(filename)
+        hdu = _open_maskdef(filename)
 
         # Grating slider
         slider = hdu[0].header['GRATEPOS']
@@ -890,6 +904,8 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         name = hdu[0].header['GRATENAM']
         if 'Mirror' in name:
             ruling = 0
+        elif name in self._grating_ruling:
+            ruling = self._grating_ruling[name]
         else:
             # Remove all non-numeric characters from the name and
             # convert to a floating point number
@@ -918,7 +934,7 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
             method is called, this method also instantiates it.
         """
         if self.detector_map is None:
-            self.detector_map = DEIMOSDetectorMap()
+            self.detector_map = _detector_map()
         return self.detector_map
 
     @staticmethod
@@ -952,39 +968,12 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
             raise ValueError('Ruling should be 0 if slider in position 2.')
 
         # Use the calibrated coefficients
-        # These orientation coefficients are the newest ones and are meant for
-        # observations obtained Post-2016 Servicing.
         # TODO: Figure out the impact of these coefficients on the slits identification.
         # We may not need to change them according to when the observations were taken
         _ruling = int(ruling) if int(ruling) in [600, 831, 900, 1200] else 'other'
-        orientation_coeffs = {3: {    600: [ 0.145, -0.008, 5.6e-4, -0.146],
-                                      831: [ 0.143,  0.000, 5.6e-4, -0.018],
-                                      900: [ 0.141,  0.000, 5.6e-4, -0.118],
-                                     1200: [ 0.145,  0.055, 5.6e-4, -0.141],
-                                  'other': [ 0.145,  0.000, 5.6e-4, -0.141] },
-                              4: {    600: [-0.065,  0.063, 6.9e-4, -0.108],
-                                      831: [-0.034,  0.060, 6.9e-4, -0.038],
-                                      900: [-0.064,  0.083, 6.9e-4, -0.060],
-                                     1200: [-0.052,  0.122, 6.9e-4, -0.110],
-                                  'other': [-0.050,  0.080, 6.9e-4, -0.110] } }
-
-        # Orientation coefficients meant for observations taken Pre-2016 Servicing
-        # orientation_coeffs = {3: {    600: [ 0.145, -0.008, 5.6e-4, -0.182],
-        #                               831: [ 0.143,  0.000, 5.6e-4, -0.182],
-        #                               900: [ 0.141,  0.000, 5.6e-4, -0.134],
-        #                              1200: [ 0.145,  0.055, 5.6e-4, -0.181],
-        #                           'other': [ 0.145,  0.000, 5.6e-4, -0.182] },
-        #                       4: {    600: [-0.065,  0.063, 6.9e-4, -0.298],
-        #                               831: [-0.034,  0.060, 6.9e-4, -0.196],
-        #                               900: [-0.064,  0.083, 6.9e-4, -0.277],
-        #                              1200: [-0.052,  0.122, 6.9e-4, -0.294],
-        #                           'other': [-0.050,  0.080, 6.9e-4, -0.250] } }
-
+        c = _orientation_coeffs[slider][_ruling]
         # Return calbirated roll, yaw, and tilt
-        return orientation_coeffs[slider][_ruling][0], \
-                orientation_coeffs[slider][_ruling][1], \
-                tilt*(1-orientation_coeffs[slider][_ruling][2]) \
-                    + orientation_coeffs[slider][_ruling][3]
+        return c[0], c[1], tilt*(1-c[2]) + c[3]
 
     def get_amapbmap(self, filename):
         """
@@ -992,23 +981,21 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         to the slider.
 
         Args:
-            filename (:obj:`str`):
-                The filename to read the slider information from the header.
+            filename (:obj:`str`, `astropy.io.fits.HDUList`_):
+                The filename, or the already opened file, to read the
+                slider information from the header.
 
         Returns:
             :obj:`tuple`: The two attributes :attr:`amap` and :attr:`bmap`,
             used by the DEIMOS optical model.
         """
-        hdu = io.fits_open(filename)
+        hdu = _open_maskdef(filename)
 
         # Grating slider
         slider = hdu[0].header['GRATEPOS']
 
-        mp_dir = resource_filename('pypeit', 'data/static_calibs/keck_deimos/')
-
         if slider in [3,4]:
-            self.amap = fits.getdata(mp_dir+'amap.s{}.2003mar04.fits'.format(slider))
-            self.bmap = fits.getdata(mp_dir+'bmap.s{}.2003mar04.fits'.format(slider))
+            self.amap, self.bmap = _read_amapbmap(slider)
         else:
             msgs.error('No amap/bmap available for slider {0}. Set `use_maskdesign = False`'.format(slider))
         #TODO: Figure out which amap and bmap to use for slider 2
@@ -1053,8 +1040,8 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
                 covering the full DEIMOS wavelength range will be used.
             order (:obj:`int`, optional):
                 The grating order.  Default is 1.
-            filename (:obj:`str`, optional):
-                The filename to use to (re)instantiate the
+            filename (:obj:`str`, `astropy.io.fits.HDUList`_, optional):
+                The filename (or opened file) to use to (re)instantiate the
                 :attr:`slitmask` and :attr:`grating`.  Default is to use
                 previously instantiated attributes.
             corners (:obj:`bool`, optional):
@@ -1084,13 +1071,15 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         # Use the file to update the slitmask (if no x coordinates are
         # provided) and the grating
         if filename is not None:
+            # Only open the file once
+            hdu = _open_maskdef(filename)
             if x is None and y is None:
                 # Reset the slit mask
-                self.get_slitmask(filename)
+                self.get_slitmask(hdu)
             # Reset the grating
-            self.get_grating(filename)
+            self.get_grating(hdu)
             # Load pre- and post-grating maps
-            self.get_amapbmap(filename)
+            self.get_amapbmap(hdu)
 
         if self.amap is None and self.bmap is None:
             raise ValueError('Must select amap and bmap; provide a file or use get_amapbmap()')
@@ -1122,12 +1111,11 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
 
         # hard-coded for DEIMOS: wavelength array if wave is None
         if wave is None:
-            npoints = 250
-            wave = np.arange(npoints) * 24. + 4000.
+            wave = self._default_wave
 
         # Compute the detector image plane coordinates (in pixels)
         x_img, y_img = self.optical_model.mask_to_imaging_coordinates(_x, _y, self.amap, self.bmap,
-                                                                      nslits=self.slitmask.nslits,
+                                                                      nslits=_x.size,
                                                                       wave=wave, order=order)
         # Reshape if computing the corner positions
         if corners:
@@ -1149,9 +1137,10 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         Args:
             ccdnum (:obj:`int`):
                 Detector number
-            filename (:obj:`str`, optional):
-                The filename to use to (re)instantiate the :attr:`slitmask` and :attr:`grating`.
-                Default is None, i.e., to use previously instantiated attributes.
+            filename (:obj:`str`, `astropy.io.fits.HDUList`_, optional):
+                The filename (or opened file) to use to (re)instantiate the :attr:`slitmask`
+                and :attr:`grating`. Default is None, i.e., to use previously instantiated
+                attributes.
             debug (:obj:`bool`, optional):
                 Run in debug mode.
 
@@ -1163,12 +1152,14 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         """
         # Re-initiate slitmask and amap and bmap
         if filename is not None:
+            # Only open the file once
+            hdu = _open_maskdef(filename)
             # Reset the slitmask
-            self.get_slitmask(filename)
+            self.get_slitmask(hdu)
             # Reset the grating
-            self.get_grating(filename)
+            self.get_grating(hdu)
             # Load pre- and post-grating maps
-            self.get_amapbmap(filename)
+            self.get_amapbmap(hdu)
 
         if self.amap is None and self.bmap is None:
             msgs.error('Must select amap and bmap; provide a file or use get_amapbmap()')
@@ -1183,55 +1174,61 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         # Sort slits in mm from the slit-mask design
         sortindx = np.argsort(self.slitmask.center[:, 0])
 
-        # Left (bottom) and right (top) traces in pixels from optical model (image plane and detector)
-        # bottom
-        omodel_bcoo = self.mask_to_pixel_coordinates(x=self.slitmask.bottom[:, 0], y=self.slitmask.bottom[:, 1])
-        bedge_img, ccd_b, bedge_pix = omodel_bcoo[0], omodel_bcoo[2], omodel_bcoo[3]
-
-        # top
-        omodel_tcoo = self.mask_to_pixel_coordinates(x=self.slitmask.top[:, 0], y=self.slitmask.top[:, 1])
-        tedge_img, ccd_t, tedge_pix = omodel_tcoo[0], omodel_tcoo[2], omodel_tcoo[3]
+        # Left (bottom) and right (top) traces in pixels from optical model (image plane and detector).
+        # Both edges are propagated through the optical model at once, bottom first.
+        edges = np.concatenate((self.slitmask.bottom, self.slitmask.top), axis=0)
+        omodel_coo = self.mask_to_pixel_coordinates(x=edges[:, 0], y=edges[:, 1])
+        bedge_img, tedge_img = np.split(omodel_coo[0], 2)
+        ccd_b, ccd_t = np.split(omodel_coo[2], 2)
+        bedge_pix, tedge_pix = np.split(omodel_coo[3], 2)
 
         # Per each slit we take the median value of the traces over the wavelength direction. These medians will be used
-        # for the cross-correlation with the traces found in the images.
-        omodel_bspat = np.zeros(self.slitmask.nslits)
-        omodel_tspat = np.zeros(self.slitmask.nslits)
-
-        for i in range(omodel_bspat.size):
-            # We "flag" the left and right traces predicted by the optical model that are outside of the
-            # current detector, by giving a value of -1.
+        # for the cross-correlation with the traces found in the images.  All slits are treated at once, by
+        # replacing the pixels that are not on the current detector with NaNs.
+        # We "flag" the left and right traces predicted by the optical model that are outside of the
+        # current detector, by giving a value of -1.
+        on_det_b = ccd_b == ccdnum
+        on_det_t = ccd_t == ccdnum
+        with warnings.catch_warnings():
+            # Ignore warnings about slits that are not on the detector
+            warnings.simplefilter('ignore', category=RuntimeWarning)
             # bottom
-            omodel_bspat[i] = -1 if bedge_pix[i, ccd_b[i, :] == ccdnum].shape[0] < 10 else \
-                              np.median(bedge_pix[i, ccd_b[i, :] == ccdnum])
+            omodel_bspat = np.where(np.sum(on_det_b, axis=1) < 10, -1.,
+                                    np.nanmedian(np.where(on_det_b, bedge_pix, np.nan), axis=1))
             # top
-            omodel_tspat[i] = -1 if tedge_pix[i, ccd_t[i, :] == ccdnum].shape[0] < 10 else \
-                              np.median(tedge_pix[i, ccd_t[i, :] == ccdnum])
+            omodel_tspat = np.where(np.sum(on_det_t, axis=1) < 10, -1.,
+                                    np.nanmedian(np.where(on_det_t, tedge_pix, np.nan), axis=1))
 
             # If a left (or right) trace is outside of the detector, the corresponding right (or left) trace
             # is determined using the pixel position from the image plane.
-            whgood = np.where(tedge_img[i, :] > -1e4)[0]
-            npt_img = whgood.shape[0] // 2
-            # This is hard-coded for DEIMOS, since it refers to the detectors configuration
-            whgood = whgood[:npt_img] if ccdnum <= 4 else whgood[npt_img:]
-            if omodel_bspat[i] == -1 and omodel_tspat[i] >= 0:
-                omodel_bspat[i] = omodel_tspat[i] - np.median((tedge_img - bedge_img)[i, whgood])
-            if omodel_tspat[i] == -1 and omodel_bspat[i] >= 0:
-                omodel_tspat[i] = omodel_bspat[i] + np.median((tedge_img - bedge_img)[i, whgood])
-
-            # If the `omodel_bspat` is greater than `omodel_tspat` we switch the order
-            if omodel_bspat[i] > omodel_tspat[i]:
-                invert_order = omodel_bspat[i]
-                omodel_bspat[i] = omodel_tspat[i]
-                omodel_tspat[i] = invert_order
+            good_img = tedge_img > -1e4
+            # This is hard-coded for DEIMOS, since it refers to the detectors configuration: use the first
+            # (second) half of the valid image-plane positions for the blue (red) detectors.
+            nhalf = np.sum(good_img, axis=1, keepdims=True) // 2
+            cumgood = np.cumsum(good_img, axis=1)
+            good_img &= cumgood <= nhalf if ccdnum <= 4 else cumgood > nhalf
+            img_width = np.nanmedian(np.where(good_img, tedge_img - bedge_img, np.nan), axis=1)
+
+        indx = (omodel_bspat == -1) & (omodel_tspat >= 0)
+        omodel_bspat[indx] = omodel_tspat[indx] - img_width[indx]
+        indx = (omodel_tspat == -1) & (omodel_bspat >= 0)
+        omodel_tspat[indx] = omodel_bspat[indx] + img_width[indx]
+
+        # If the `omodel_bspat` is greater than `omodel_tspat` we switch the order
+        indx = omodel_bspat > omodel_tspat
+        omodel_bspat[indx], omodel_tspat[indx] = omodel_tspat[indx], omodel_bspat[indx]
 
         # If there are overlapping slits, i.e., omodel_tspat[sortindx][i] > omodel_bspat[sortindx][i+1],
-        # move the overlapping edges to be adjacent instead
-        for i in range(sortindx.size -1):
-            if omodel_tspat[sortindx][i] != -1 and omodel_bspat[sortindx][i+1] != -1 and \
-                    omodel_tspat[sortindx][i] > omodel_bspat[sortindx][i+1]:
-                diff = omodel_tspat[sortindx][i] - omodel_bspat[sortindx][i+1]
-                omodel_tspat[sortindx[i]] -= diff/2.
-                omodel_bspat[sortindx[i+1]] += diff/2. + 0.1
+        # move the overlapping edges to be adjacent instead.  Each edge is
+        # moved at most once, so all the overlaps can be fixed at once.
+        tspat_sorted = omodel_tspat[sortindx]
+        bspat_sorted = omodel_bspat[sortindx]
+        overlap = (tspat_sorted[:-1] != -1) & (bspat_sorted[1:] != -1) \
+                    & (tspat_sorted[:-1] > bspat_sorted[1:])
+        if np.any(overlap):
+            diff = tspat_sorted[:-1][overlap] - bspat_sorted[1:][overlap]
+            omodel_tspat[sortindx[:-1][overlap]] -= diff/2.
+            omodel_bspat[sortindx[1:][overlap]] += diff/2. + 0.1
                 # # Re-check If the `omodel_bspat` is greater than `omodel_tspat` and switch the order.
                 # # It may happens if 3 slits are overlapping (true story!)
                 # if omodel_bspat[sortindx[i]] > omodel_tspat[sortindx[i]]:
@@ -1248,9 +1245,9 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
             msgs.info('*' * 18)
             msgs.info('{0:^6s} {1:^12s}'.format('N.', 'dSlitId'))
             msgs.info('{0:^6s} {1:^12s}'.format('-' * 5, '-' * 9))
-            for i in range(sortindx.shape[0]):
-                if omodel_bspat[sortindx][i] != -1 or omodel_tspat[sortindx][i] != -1:
-                    msgs.info('{0:^6d} {1:^12d}'.format(num, self.slitmask.slitid[sortindx][i]))
+            for i in sortindx:
+                if omodel_bspat[i] != -1 or omodel_tspat[i] != -1:
+                    msgs.info('{0:^6d} {1:^12d}'.format(num, self.slitmask.slitid[i]))
                     num += 1
             msgs.info('*' * 18)
 
@@ -1269,14 +1266,12 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
             msgs.info('{0:^5s} {1:^10s} {2:^12s} {3:^12s} {4:^14s} {5:^16s} {6:^14s}'.format('-' * 4, '-' * 9, '-' * 11,
                                                                                              '-' * 11, '-' * 13,
                                                                                              '-' * 18, '-' * 15))
-            for i in range(sortindx.size):
-                if omodel_bspat[sortindx][i] != -1 or omodel_tspat[sortindx][i] != -1:
+            for i in sortindx:
+                if omodel_bspat[i] != -1 or omodel_tspat[i] != -1:
                     msgs.info('{0:^5d}{1:^14d} {2:^9.3f} {3:^12.3f} {4:^14.3f}    {5:^16.2f} {6:^14.2f}'
-                              .format(num, self.slitmask.slitid[sortindx][i],
-                                         self.slitmask.length[sortindx][i],
-                                         self.slitmask.width[sortindx][i],
-                                         self.slitmask.center[:, 0][sortindx][i],
-                                         omodel_bspat[sortindx][i], omodel_tspat[sortindx][i]))
+                              .format(num, self.slitmask.slitid[i], self.slitmask.length[i],
+                                      self.slitmask.width[i], self.slitmask.center[i, 0],
+                                      omodel_bspat[i], omodel_tspat[i]))
                     num += 1
             msgs.info('*' * 92)
 
@@ -1312,57 +1307,53 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
         good_obj = sobjs.MASKDEF_OBJNAME != 'SERENDIP'
         
         # MATCH RED TO BLUE VIA RA/DEC
-        mb = sobjs['DET'] <=4
-        mr = sobjs['DET'] >4
+        # Each attribute of sobjs is collected from all the objects, so only
+        # access them once
+        det = sobjs.DET
+        mb = det <=4
+        mr = det >4
 
+        bidx = np.where(mb & good_obj)[0]
         ridx = np.where(mr & good_obj)[0]
-        robjs = sobjs[ridx]
+        # Pull out the coordinates once; missing coordinates become NaN and
+        # never match
+        ra = np.asarray(sobjs.RA, dtype=float)
+        dec = np.asarray(sobjs.DEC, dtype=float)
 
         #rslits = slits[mr]
         #bslits = slits[mb]
 
-        n=0
-
         # SEARCH ON BLUE FIRST
-        bmt = []
-        rmt = []
-        for ibobj in np.where(mb & good_obj)[0]:
-
-            sobj = sobjs[ibobj]
-            mtc = sobj.RA == robjs.RA
-            if np.sum(mtc) == 1:
-                irobj = int(ridx[mtc])
-                if not np.isclose(sobj.DEC, sobjs[irobj].DEC):
-                    msgs.error('DEC does not match RA!')
-                bmt.append(ibobj)
-                rmt.append(irobj)
-                # START ARRAY
-                #if (n==0):
-                #    matches = Table([[obj['name']],[robj['name']],[obj['det']],[robj['det']],\
-                #                [obj['objra']],[obj['objdec']],[obj['objname']],[obj['maskdef_id']],[obj['slit']]], \
-                #                names=('bname', 'rname','bdet','rdet', 'objra','objdec','objname','maskdef_id','xpos'))
-                #if (n > 0):
-                #    matches.add_row((obj['name'],robj['name'],obj['det'],robj['det'],\
-                #                     obj['objra'],obj['objdec'],obj['objname'],obj['maskdef_id'],obj['slit']))
-                #n=n+1
-            elif np.sum(mtc)>1:
-                msgs.error("Multiple RA matches?!  No good..")
-
-            # TODO - confirm with Marla this block is NG
-            '''
-            # NO RED MATCH
-            if (np.sum(mtc)==-11): 
-            #if (np.sum(mtc)==0):        
-
-                if (n==0):
-                    matches = Table([[obj['name']],['-1'],[obj['det']],[-1],\
-                                [obj['objra']],[obj['objdec']],[obj['objname']],[obj['maskdef_id']],[obj['slit']]], \
-                                names=('bname', 'rname','bdet','rdet', 'objra','objdec','objname','maskdef_id','xpos'))
-                if (n > 0):
-                    matches.add_row((obj['name'],'-1',obj['det'],-1,\
-                                    obj['objra'],obj['objdec'],obj['objname'],obj['maskdef_id'],obj['slit']))
-                n=n+1
-            '''
+        # Find the red objects with exactly the same RA as each blue object
+        # using a sorted search
+        srt = np.argsort(ra[ridx], kind='stable')
+        red_ra = ra[ridx][srt]
+        left = np.searchsorted(red_ra, ra[bidx], side='left')
+        nmatch = np.searchsorted(red_ra, ra[bidx], side='right') - left
+        nmatch[np.isnan(ra[bidx])] = 0
+        if np.any(nmatch > 1):
+            msgs.error("Multiple RA matches?!  No good..")
+        matched = nmatch == 1
+        bmt = bidx[matched]
+        rmt = ridx[srt[left[matched]]]
+        if not np.all(np.isclose(dec[bmt], dec[rmt])):
+            msgs.error('DEC does not match RA!')
+
+        # TODO - confirm with Marla this block is NG
+        '''
+        # NO RED MATCH
+        if (np.sum(mtc)==-11): 
+        #if (np.sum(mtc)==0):        
+
+            if (n==0):
+                matches = Table([[obj['name']],['-1'],[obj['det']],[-1],\
+                            [obj['objra']],[obj['objdec']],[obj['objname']],[obj['maskdef_id']],[obj['slit']]], \
+                            names=('bname', 'rname','bdet','rdet', 'objra','objdec','objname','maskdef_id','xpos'))
+            if (n > 0):
+                matches.add_row((obj['name'],'-1',obj['det'],-1,\
+                                obj['objra'],obj['objdec'],obj['objname'],obj['maskdef_id'],obj['slit']))
+            n=n+1
+        '''
 
 
         # TODO -- Confirm with Marla that this is not used
@@ -1378,7 +1369,7 @@ class KeckDEIMOSSpectrograph(spectrograph.Spectrograph):
             #   n=n+1
         '''
 
-        return np.array(bmt), np.array(rmt)
+        return bmt, rmt
 
 class DEIMOSOpticalModel(OpticalModel):
     """
@@ -1405,7 +1396,7 @@ class DEIMOSOpticalModel(OpticalModel):
                     np.radians(2.752),      # Camera angle in radians (sys.CAM_ANG)
                     np.pi/2,                # Camera tilt phi angle in radians (sys.CAM_PHI)
                     382.0,                  # Camera focal length in mm (sys.CAM_FOC)
-                    DEIMOSCameraDistortion(),   # Object used to apply/remove camera distortions
+                    _camera_distortion(),   # Object used to apply/remove camera distortions
                     np.radians(0.021),      # ICS rotation in radians (sys.MOS_ROT)
                     [-0.234, -3.822])       # Camera optical axis center in mm (sys.X_OPT,sys.Y_OPT)
 
@@ -1438,26 +1429,26 @@ class DEIMOSOpticalModel(OpticalModel):
 
 class DEIMOSCameraDistortion:
     """Class to remove or apply DEIMOS camera distortion."""
+    # Coefficients of the distortion polynomial in increasing (even) powers
+    # of the angle: x^0, x^2, x^4, x^6
+    _coeffs = np.array([1., 0.0457563, -0.3088123, -14.917])
+
     def __init__(self):
-        self.c0 = 1.
-        self.c2 = 0.0457563
-        self.c4 = -0.3088123
-        self.c6 = -14.917
-    
-        x = np.linspace(-0.6, 0.6, 1000)
-        y = self.remove_distortion(x)
-        self.interpolator = interpolate.interp1d(y, x)
+        # Tabulate the distortion for interpolating its inverse; y is
+        # monotonically increasing over this interval
+        self.x = np.linspace(-0.6, 0.6, 1000)
+        self.y = self.remove_distortion(self.x)
 
     def remove_distortion(self, x):
-        x2 = np.square(x)
-        return x / (self.c0 + x2 * (self.c2 + x2 * (self.c4 + x2 * self.c6)))
+        x = np.asarray(x, dtype=float)
+        return x / np.polynomial.polynomial.polyval(x*x, self._coeffs)
 
     def apply_distortion(self, y):
-        indx = (y > self.interpolator.x[0]) & (y < self.interpolator.x[-1])
+        indx = (y > self.y[0]) & (y < self.y[-1])
         if not np.all(indx):
             warnings.warn('Some input angles outside of valid distortion interval!')
         x = np.zeros_like(y)
-        x[indx] = self.interpolator(y[indx])
+        x[indx] = np.interp(y[indx], self.y, self.x)
         return x
 
 
@@ -1497,7 +1488,11 @@ class DEIMOSDetectorMap(DetectorMap):
         self.rotation = np.radians([-0.082, 0.030, 0.0, -0.1206, 0.136, -0.06, -0.019, -0.082])
         cosa = np.cos(self.rotation)
         sina = np.sin(self.rotation)
-        self.rot_matrix = np.array([cosa, -sina, sina, cosa]).T.reshape(self.nccd,2,2)
+        self.rot_matrix = np.empty((self.nccd,2,2), dtype=float)
+        self.rot_matrix[:,0,0] = cosa
+        self.rot_matrix[:,0,1] = -sina
+        self.rot_matrix[:,1,0] = sina
+        self.rot_matrix[:,1,1] = cosa
 
         # ccd_geom.pro has offsets by sys.CN_XERR, but these are all 0.
 
@@ -1580,6 +1575,90 @@ class DEIMOSDetectorMap(DetectorMap):
 #    # Return
 #    return shape, dsec, osec, ext_items
 
+@functools.lru_cache(maxsize=4096)
+def _iso_to_mjd(date, utc):
+    """
+    Convert the observation date and UT time to an MJD.
+
+    Constructing the `astropy.time.Time`_ object is relatively expensive, so
+    the result is cached for repeated queries of the same header.
+
+    Args:
+        date (:obj:`str`):
+            Date of the observation (e.g., the DATE-OBS header card).
+        utc (:obj:`str`):
+            UT time of the observation (e.g., the UTC header card).
+
+    Returns:
+        :obj:`float`: The modified Julian date.
+    """
+    return time.Time('{}T{}'.format(date, utc)).mjd
+
+
+def _open_maskdef(filename):
+    """
+    Open the file with the slit-mask design and grating data, unless it is
+    already open.
+
+    Args:
+        filename (:obj:`str`, `astropy.io.fits.HDUList`_):
+            Name of the file, or the already opened file.  Anything that is
+            not an `astropy.io.fits.HDUList`_ is passed to
+            :func:`~pypeit.io.fits_open`.
+
+    Returns:
+        `astropy.io.fits.HDUList`_: The opened file.
+    """
+    return filename if isinstance(filename, fits.HDUList) else io.fits_open(filename)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_amapbmap(slider):
+    """
+    Read the pre-grating (amap) and post-grating (bmap) maps for the provided
+    slider.
+
+    The maps are static calibration files, so they are only read once per
+    slider; the returned arrays are shared and must not be modified.
+
+    Args:
+        slider (:obj:`int`):
+            The grating slider position.  Must be 3 or 4.
+
+    Returns:
+        :obj:`tuple`: The amap and bmap data.
+    """
+    mp_dir = resource_filename('pypeit', 'data/static_calibs/keck_deimos/')
+    return fits.getdata(mp_dir+'amap.s{}.2003mar04.fits'.format(slider)), \
+                fits.getdata(mp_dir+'bmap.s{}.2003mar04.fits'.format(slider))
+
+
+@functools.lru_cache(maxsize=1)
+def _camera_distortion():
+    """
+    Return the (shared) DEIMOS camera-distortion model.
+
+    The model has no free parameters, so it is only built once.
+
+    Returns:
+        :class:`DEIMOSCameraDistortion`: The camera-distortion model.
+    """
+    return DEIMOSCameraDistortion()
+
+
+@functools.lru_cache(maxsize=1)
+def _detector_map():
+    """
+    Return the (shared) DEIMOS detector map.
+
+    The map has no free parameters, so it is only built once.
+
+    Returns:
+        :class:`DEIMOSDetectorMap`: The detector map.
+    """
+    return DEIMOSDetectorMap()
+
+
 def indexing(itt, postpix, det=None):
     """
     Some annoying book-keeping for instrument placement.
@@ -1638,8 +1717,8 @@ def deimos_read_1chip(hdu,chipno):
     postpix = hdu[0].header['POSTPIX']
     precol = hdu[0].header['PRECOL']
 
-    x1_dat, x2_dat, y1_dat, y2_dat = np.array(parse.load_sections(datsec)).flatten()
-    x1_det, x2_det, y1_det, y2_det = np.array(parse.load_sections(detsec)).flatten()
+    (x1_dat, x2_dat), (y1_dat, y2_dat) = parse.load_sections(datsec)
+    (x1_det, x2_det), (y1_det, y2_det) = parse.load_sections(detsec)
 
     # This rotates the image to be increasing wavelength to the top
     #data = np.rot90((hdu[chipno].data).T, k=2)
@@ -1682,8 +1761,10 @@ def load_wmko_std_spectrum(fits_file:str, outfile=None):
 
     # Open up
     hdul = fits.open(fits_file)
-    meta = Table(hdul[1].data)
-    idl_spec = Table(hdul[2].data)
+    # Use the binary tables directly; there's no need to copy them into
+    # Tables just to access a few columns
+    meta = hdul[1].data
+    idl_spec = hdul[2].data
 
     # Hope this always works..
     npix = int(len(idl_spec)/2)
@@ -1691,15 +1772,14 @@ def load_wmko_std_spectrum(fits_file:str, outfile=None):
     # Generate vacuum wavelengths
     idl_vac = wave.airtovac(idl_spec['WAVELENGTH']*units.AA)
 
+    # Counts for the blue and red detectors
+    counts_b, counts_r = idl_spec['COUNTS'][:npix], idl_spec['COUNTS'][npix:]
+
     # Generate SpecObj
-    sobj1 = specobj.SpecObj.from_arrays('MultiSlit', idl_vac.value[0:npix],
-                                  idl_spec['COUNTS'].data[0:npix], 
-                                   1./(idl_spec['COUNTS'].data[0:npix]),
-                                   DET=3)
-    sobj2 = specobj.SpecObj.from_arrays('MultiSlit', idl_vac.value[npix:],
-                                  idl_spec['COUNTS'].data[npix:], 
-                                   1./(idl_spec['COUNTS'].data[npix:]), 
-                                   DET=7)
+    sobj1 = specobj.SpecObj.from_arrays('MultiSlit', idl_vac.value[0:npix], counts_b,
+                                        1./counts_b, DET=3)
+    sobj2 = specobj.SpecObj.from_arrays('MultiSlit', idl_vac.value[npix:], counts_r,
+                                        1./counts_r, DET=7)
 
     # SpecObjs
     sobjs = specobjs.SpecObjs()
@@ -1709,7 +1789,7 @@ def load_wmko_std_spectrum(fits_file:str, outfile=None):
     # Fill in header
     coord = linetools.utils.radec_to_coord((meta['RA'][0], meta['DEC'][0]))
     sobjs.header = dict(EXPTIME=1., 
-                        AIRMASS=float(meta['AIRMASS']), 
+                        AIRMASS=float(meta['AIRMASS'][0]), 
                         DISPNAME=str(meta['GRATING'][0]), 
                         PYP_SPEC='keck_deimos', 
                         RA=coord.ra.deg, 
@@ -905,9 +905,9 @@ class DetectorMap:
         # Offset by the chip center
         coo = numpy.array([_x, _y]).T - self.npix[None,:]/2
 
-        # Rotatate and offset by the CCD center
-        coo = numpy.array([numpy.matmul(self.rot_matrix[d], c) for d,c in zip(_d,coo)]) \
-                    + self.ccd_center[_d,:]
+        # Rotatate and offset by the CCD center; all coordinates are
+        # rotated at once by their detector's rotation matrix
+        coo = numpy.matmul(self.rot_matrix[_d], coo[...,None])[...,0] + self.ccd_center[_d,:]
 
         x_img = coo[0,0] if inp_shape is None else coo[:,0].reshape(inp_shape)
         y_img = coo[0,1] if inp_shape is None else coo[:,1].reshape(inp_shape)
@@ -957,9 +957,10 @@ class DetectorMap:
         # Offset by the CCD center for each chip
         coo = numpy.array([_x, _y]).T[None,:,:] - self.ccd_center[:,None,:]
 
-        # Apply the rotation matrix and offset by the chip center
-        coo = numpy.array([[numpy.matmul(r.T, _c) for _c in c] \
-                                for r,c in zip(self.rot_matrix, coo)]) + self.npix[None,None,:]/2
+        # Apply the rotation matrix and offset by the chip center.  For
+        # each chip, multiplying the row vectors by the rotation matrix is
+        # the same as applying its transpose to each coordinate.
+        coo = numpy.matmul(coo, self.rot_matrix) + self.npix[None,None,:]/2
 
         # Determine the associated detector (1-indexed)
         indx = numpy.all((coo > 0) & (coo <= self.npix[None,None,:]), axis=2)
@@ -972,8 +973,10 @@ class DetectorMap:
         d[numpy.sum(indx, axis=0) == 0] = -1
 
         # Pull out the coordinates for the correct detector
-        coo = numpy.array([coo[_d-1,i,:] if _d > 0 else numpy.full(coo.shape[2:],-1.) 
-                                for i,_d in enumerate(d)])
+        on_det = d > 0
+        _coo = numpy.full(coo.shape[1:], -1.)
+        _coo[on_det] = coo[d[on_det]-1,on_det]
+        coo = _coo
 
         # Return the coordinates
         return d if inp_shape is None else d.reshape(inp_shape), \
@@ -86,8 +86,9 @@ class SlitMask:
             the slit length and width in arcseconds, and (5) the
             position angle of the slit from N through E in degrees.
         objects (`numpy.ndarray`_, optional):
-            List of objects observed as a 1D or 2D array with shape
-            :math:`(9,)` or :math:`(N_{\rm obj},9)`. The nine
+            List of objects observed, either as a structured array with
+            the fields in :attr:`object_fields` or as a 1D or 2D array
+            with shape :math:`(9,)` or :math:`(N_{\rm obj},9)`. The nine
             elements for each object is the slit id, the object ID,
             the right ascension and declination of the target, the
             object name, the object magnitude and band, and the
@@ -107,8 +108,9 @@ class SlitMask:
             Mask bits selecting the type of slit.
         onsky (`numpy.ndarray`_):
             See above.
-        objects (`numpy.ndarray`_):
-            See above.
+        objects (`numpy.recarray`_):
+            Structured array with the object data; see
+            :attr:`object_fields`.
         slitindx (`numpy.ndarray`_):
             The index that maps from the slit data to the object
             data. For example::
@@ -144,6 +146,15 @@ class SlitMask:
             slits provided.
     """
     bitmask = SlitMaskBitMask()
+
+    object_fields = [('slitid', int), ('objid', int), ('ra', float), ('dec', float),
+                     ('name', str), ('mag', float), ('band', str), ('topdist', float),
+                     ('botdist', float)]
+    """
+    Names and types of the fields in :attr:`objects`, in the order of the
+    columns of a 2D ``objects`` array.
+    """
+
     def __init__(self, corners, slitid=None, align=None, science=None, onsky=None, objects=None,
                  posx_pa=None, object_names=None):
 
@@ -207,13 +218,9 @@ class SlitMask:
         self.objects = None
         self.slitindx = None
         if objects is not None:
-            self.objects = numpy.atleast_2d(objects)
-            if self.objects.shape[1] != 9:
-                raise ValueError('Must provide the slit ID, object ID, sky coordinates, object name, '
-                                 'object magnitude and band, top and bottom distance for each object.')
+            self.objects = self._parse_objects(objects)
             try:
-                self.slitindx = index_of_x_eq_y(self.slitid, self.objects[:,0].astype(int),
-                                                strict=True)
+                self.slitindx = index_of_x_eq_y(self.slitid, self.objects['slitid'], strict=True)
             except:
                 # Should only fault if there are slit IDs in `objects`
                 # that are not in `slitid`. In that case, return a more
@@ -238,6 +245,36 @@ class SlitMask:
         self.pa[self.pa < -90] += 180
         self.pa[self.pa > 90] -= 180
 
+    @classmethod
+    def _parse_objects(cls, objects):
+        """
+        Convert the provided object data into a structured array with the
+        fields in :attr:`object_fields`.
+
+        Args:
+            objects (`numpy.ndarray`_):
+                Structured array with the object data or an array with
+                shape :math:`(9,)` or :math:`(N_{\rm obj},9)`; see the
+                class description.
+
+        Returns:
+            `numpy.recarray`_: Structured array with the object data.
+
+        Raises:
+            ValueError:
+                Raised if the fields or shape of ``objects`` are incorrect.
+        """
+        names = [name for name, _ in cls.object_fields]
+        if isinstance(objects, numpy.ndarray) and objects.dtype.names is not None:
+            if list(objects.dtype.names) != names:
+                raise ValueError('Object array must have fields: {0}'.format(', '.join(names)))
+            return numpy.atleast_1d(objects).view(numpy.recarray)
+        _objects = numpy.atleast_2d(objects)
+        if _objects.shape[1] != 9:
+            raise ValueError('Must provide the slit ID, object ID, sky coordinates, object name, '
+                             'object magnitude and band, top and bottom distance for each object.')
+        return numpy.rec.fromarrays([_objects[:,i].astype(t)
+                                     for i, (_, t) in enumerate(cls.object_fields)], names=names)
 
     def __repr__(self):
         return '<{0}: nslits={1}>'.format(self.__class__.__name__, self.nslits)
@@ -257,7 +257,7 @@ class Spectrograph:
         core_meta_keys = list(meta.define_core_meta().keys())
         core_meta_keys += ['filename']
         for key in core_meta_keys:
-            if key.upper() in header.keys():
+            if key.upper() in header:
                 spec_dict[key.upper()] = header[key.upper()]
         # Return
         return spec_dict
@@ -309,7 +309,7 @@ class Spectrograph:
         if extra_header_cards is not None:
             header_cards += extra_header_cards  # For specDB and more
         for card in header_cards:
-             if card in raw_header.keys():
+             if card in raw_header:
                  subheader[card] = raw_header[card]  # Self-assigned instrument name
 
         # Specify which pipeline created this file
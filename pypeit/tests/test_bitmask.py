@@ -28,6 +28,22 @@ def test_new():
     assert list(image_bm.bits.values()) == [0, 1, 2]
 
 
+def test_minimum_dtype():
+    assert ImageBitMask().minimum_dtype() == numpy.int16
+    assert ImageBitMask().minimum_dtype(asuint=True) == numpy.uint8
+    bm = BitMask(['BIT{0}'.format(i) for i in range(20)])
+    assert bm.minimum_dtype() == numpy.int32
+    assert bm.minimum_dtype(asuint=True) == numpy.uint32
+
+
+def test_bit_values():
+    bm = BitMask(['BIT{0}'.format(i) for i in range(20)])
+    mask = numpy.zeros(5, dtype=bm.minimum_dtype(asuint=True))
+    for flag, value in bm.bit_values.items():
+        assert value.dtype == mask.dtype
+        assert value == bm.turn_on(mask, flag)[0]
+
+
 def test_flagging():
 
     n = 1024
@@ -0,0 +1,52 @@
+"""
+Module to run tests on image combination
+"""
+import warnings
+
+import pytest
+
+import numpy as np
+
+from astropy import stats
+
+from pypeit import utils
+from pypeit.core import combine
+
+
+def test_weighted_combine():
+    rng = np.random.default_rng(3)
+    shape = (5, 30, 20)
+    sci = rng.normal(size=shape)
+    var = rng.random(shape)
+    gpm = rng.random(shape) > 0.2
+    weights = rng.random(shape[0])
+
+    (sci_out,), (var_out,), gpm_out, nused \
+            = combine.weighted_combine(weights, [sci], [var], gpm)
+    wgt = weights[:,None,None]*gpm
+    wsum = np.sum(wgt, axis=0)
+    assert np.allclose(sci_out[wsum > 0], (np.sum(sci*wgt, axis=0)/wsum)[wsum > 0])
+    assert np.allclose(var_out[wsum > 0], (np.sum(var*wgt**2, axis=0)/wsum**2)[wsum > 0])
+    assert np.array_equal(gpm_out, np.any(gpm, axis=0))
+    assert np.array_equal(nused, np.sum(gpm, axis=0))
+
+
+@pytest.mark.skipif(combine._sigma_clip_stack is None, reason='numba is not installed')
+def test_sigma_clip_stack():
+    rng = np.random.default_rng(3)
+    shape = (7, 60, 50)
+    stack = rng.normal(size=shape)
+    stack[rng.random(shape) > 0.9] *= 20
+    stack[rng.random(shape) > 0.98] = np.nan
+    gpm = rng.random(shape) > 0.15
+
+    # Should match the astropy calculation exactly
+    data = np.ma.MaskedArray(stack, mask=np.logical_not(gpm))
+    sigclip = stats.SigmaClip(sigma=1.1, maxiters=5, cenfunc='median',
+                              stdfunc=utils.nan_mad_std)
+    with warnings.catch_warnings():
+        # Ignore the warning about the NaNs
+        warnings.simplefilter('ignore')
+        clipped = sigclip(data, axis=0, masked=True)
+    assert np.array_equal(combine._sigma_clip_stack(stack, gpm, 1.1, 5),
+                          np.logical_not(clipped.mask))
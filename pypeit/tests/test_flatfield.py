@@ -93,6 +93,21 @@ def test_flatimages():
 
     os.remove(outfile)
 
+    # The illumination flat is cached
+    slits = slittrace.SlitTraceSet(left_init=np.array([[10., 50.]]*1000),
+                                   right_init=np.array([[40., 80.]]*1000), pypeline='MultiSlit',
+                                   nspat=100, PYP_SPEC='dummy')
+    illumflat = flatImages.fit2illumflat(slits)
+    assert illumflat.shape == (1000, 100)
+    assert not illumflat.flags.writeable
+    assert flatImages.fit2illumflat(slits) is illumflat
+    assert flatImages.fit2illumflat(slits, flexure_shift=1.) is not illumflat
+    assert flatImages.fit2illumflat(slits, flexure_shift=1.) is not \
+            flatImages.fit2illumflat(slits, flexure_shift=1.)
+    assert flatImages.fit2illumflat(slits) is illumflat
+    slits.mask[0] = slits.bitmask.turn_on(slits.mask[0], 'USERIGNORE')
+    assert flatImages.fit2illumflat(slits) is not illumflat
+
     # Illumflat
 #    left = np.full((1000,2), 90, dtype=float)
 #    left[:,1] = 190.
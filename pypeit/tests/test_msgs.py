@@ -6,9 +6,9 @@ import pytest
 
 from pypeit import pypmsgs
 
-def test_log_write():
+def test_log_write(tmp_path):
 
-    outfil = 'tst.log'
+    outfil = str(tmp_path / 'tst.log')
     msgs = pypmsgs.Messages(outfil, verbosity=1)
     msgs.close()
     # Insure scipy, numpy, astropy are being version
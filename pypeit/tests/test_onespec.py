@@ -0,0 +1,119 @@
+"""
+Module to run tests on OneSpec
+"""
+import os
+
+import pytest
+
+import numpy as np
+
+from astropy.io import fits
+
+from pypeit import onespec
+
+
+def data_path(filename):
+    data_dir = os.path.join(os.path.dirname(__file__), 'files')
+    return os.path.join(data_dir, filename)
+
+
+def simple_spec():
+    wave = np.linspace(4000., 5000., 100)
+    flux = np.ones_like(wave)
+    ivar = np.full_like(wave, 4.)
+    mask = np.ones(wave.size, dtype=int)
+    return onespec.OneSpec(wave, flux, PYP_SPEC='shane_kast_blue', ivar=ivar, mask=mask,
+                           ext_mode='OPT', fluxed=False)
+
+
+@pytest.mark.parametrize('ofile', ['tmp_onespec.fits', 'tmp_onespec.fits.gz'])
+def test_io(ofile):
+    spec = simple_spec()
+    ofile = data_path(ofile)
+    spec.to_file(ofile, overwrite=True)
+
+    # All the arrays should be in a single binary table
+    with fits.open(ofile) as hdu:
+        assert len(hdu) == 2
+        assert isinstance(hdu[1], fits.BinTableHDU)
+        assert hdu[1].header['DMODCLS'] == 'OneSpec'
+        assert hdu[1].columns.names == ['wave', 'flux', 'ivar', 'mask']
+
+    _spec = onespec.OneSpec.from_file(ofile)
+    assert np.array_equal(spec.wave, _spec.wave)
+    assert np.array_equal(spec.flux, _spec.flux)
+    assert np.array_equal(spec.ivar, _spec.ivar)
+    assert np.array_equal(spec.mask, _spec.mask)
+    assert _spec.mask.dtype == np.uint8
+    assert _spec.PYP_SPEC == 'shane_kast_blue'
+    assert _spec.ext_mode == 'OPT'
+    assert _spec.__dict__['spect_meta'] is None
+    assert isinstance(_spec.spect_meta, dict)
+    # Spectrograph is shared
+    assert onespec.OneSpec._load_spectrograph('shane_kast_blue') is _spec.spectrograph
+    # The single-byte mask is a view of the memory-mapped table, not a copy
+    assert _spec.mask.base is not None
+
+    # The spectrograph is loaded once, even if no object holds on to it
+    spectrograph = onespec.OneSpec._load_spectrograph('keck_deimos')
+    del spectrograph
+    assert 'keck_deimos' in onespec.OneSpec._spectrograph_cache
+
+    # Overwrite protection
+    with pytest.raises(FileExistsError):
+        spec.to_file(ofile)
+
+    # Same file as the unbuffered write
+    if not ofile.endswith('.gz'):
+        primary_hdr = fits.Header({'DATE': '2021-11-19'})
+        # NOTE: The checksum comments include the time the file was written
+        spec.to_file(ofile, primary_hdr=primary_hdr.copy(), overwrite=True, checksum=False)
+        _ofile = data_path('tmp_onespec_unbuffered.fits')
+        spec.to_file(_ofile, primary_hdr=primary_hdr.copy(), overwrite=True, checksum=False,
+                     buffered=False)
+        with open(ofile, 'rb') as f, open(_ofile, 'rb') as _f:
+            assert f.read() == _f.read()
+        os.remove(_ofile)
+
+    # Cleanup
+    os.remove(ofile)
+
+
+def test_block():
+    spec = simple_spec()
+    # Iterate over the packed floating-point arrays in blocks
+    blocks = list(spec.blocks(size=32))
+    assert len(blocks) == 4
+    assert blocks[-1].shape == (3, 4)
+    block = np.concatenate(blocks, axis=1)
+    assert np.array_equal(block, np.array([spec.wave, spec.flux, spec.ivar]))
+    # The arrays are not replaced by views of the packed array
+    assert not np.shares_memory(spec.flux, blocks[0])
+    # Reassigned arrays are picked up
+    spec.flux = np.zeros(spec.wave.size)
+    assert not np.any(np.concatenate(list(spec.blocks(size=32)), axis=1)[1])
+
+
+def test_weighted_mean():
+    spec = simple_spec()
+    spec.flux[:10] = 10.
+    spec.mask[:10] = 0
+    assert np.isclose(spec.weighted_mean(), 1.)
+    spec.telluric = np.linspace(0.5, 1., spec.wave.size)
+    spec.flux = np.arange(spec.wave.size, dtype=float)
+    gpm = spec.mask > 0
+    wgt = spec.ivar[gpm]*spec.telluric[gpm]
+    assert np.isclose(spec.weighted_mean(), np.sum(spec.flux[gpm]*wgt)/np.sum(wgt))
+    assert np.isclose(spec.weighted_mean(use_telluric=False), np.mean(spec.flux[gpm]))
+
+
+def test_soa():
+    spec = simple_spec()
+    soa = spec.to_numpy_soa()
+    assert list(soa.keys()) == ['wave', 'flux', 'ivar', 'mask']
+    assert all(arr.flags['C_CONTIGUOUS'] for arr in soa.values())
+    # No copies
+    assert np.shares_memory(soa['flux'], spec.flux)
+    _spec = onespec.OneSpec.from_numpy_soa(**soa)
+    assert np.array_equal(_spec.ivar, spec.ivar)
+    assert _spec.flux is soa['flux']
@@ -120,3 +120,19 @@ def test_var_model():
 
 
 
+
+
+def test_grow_masked():
+    img = np.zeros((20,20), dtype=float)
+    img[0,0] = 1.
+    img[10,10] = 1.
+    grown = procimg.grow_masked(img, 1.5, 1.)
+    # Corner pixel only grows into the image
+    assert np.array_equal(np.where(grown[:3,:3] == 1.), np.where(np.array([[1,1,0],
+                                                                            [1,1,0],
+                                                                            [0,0,0]]) == 1))
+    # 3x3 box within a radius of 1.5 pixels
+    assert np.sum(grown[8:13,8:13] == 1.) == 9
+    assert np.all(grown[9:12,9:12] == 1.)
+    # No pixels to grow
+    assert procimg.grow_masked(img, 1.5, 2.) is img
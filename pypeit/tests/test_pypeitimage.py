@@ -5,10 +5,13 @@ import os
 
 from IPython import embed
 
+import pytest
+
 import numpy as np
 
 from pypeit.images import pypeitimage
 from pypeit.images import imagebitmask
+from pypeit.images.detector_container import DetectorContainer
 
 def data_path(filename):
     data_dir = os.path.join(os.path.dirname(__file__), 'files')
@@ -46,4 +49,45 @@ def test_bitmask():
     assert bm.bits['EXTRACT'] == 8, 'EXTRACT bit number changed'
 
 
+@pytest.mark.parametrize('compiled', [True, False])
+def test_build_mask(monkeypatch, compiled):
+    if not compiled:
+        # Force the use of the numpy calculation
+        monkeypatch.setattr(pypeitimage, '_flag_pixels', None)
+    rng = np.random.default_rng(3)
+    img = rng.normal(100., 100., size=(200,150))
+    img[rng.random(img.shape) < 0.01] = np.nan
+    img[rng.random(img.shape) < 0.01] = np.inf
+    ivar = rng.normal(1., 1., size=img.shape)
+    ivar[rng.random(img.shape) < 0.01] = np.nan
+    bpm = (rng.random(img.shape) < 0.05).astype(np.int16)
+    crmask = rng.random(img.shape) < 0.05
+    slitmask = rng.integers(-1, 3, size=img.shape)
+    detector = DetectorContainer(dataext=0, specaxis=0, specflip=False, spatflip=False,
+                                 platescale=0.1, saturation=250., mincounts=-50., nonlinear=1.,
+                                 numamplifiers=1, gain=np.array([1.]), ronoise=np.array([1.]),
+                                 det=1, binning='1,1')
+    pypeitImage = pypeitimage.PypeItImage(image=img, ivar=ivar, bpm=bpm, crmask=crmask,
+                                          detector=detector)
+    pypeitImage.build_mask(slitmask=slitmask)
+
+    # Build the mask one flag at a time
+    bm = pypeitImage.bitmask
+    mask = np.zeros(img.shape, dtype=bm.minimum_dtype(asuint=True))
+    for flag, indx in [('BPM', bpm > 0), ('CR', crmask), ('SATURATION', img >= 250.),
+                       ('MINCOUNTS', img <= -50.), ('IS_NAN', np.logical_not(np.isfinite(img))),
+                       ('IVAR0', np.logical_not(ivar > 0)),
+                       ('IVAR_NAN', np.logical_not(np.isfinite(ivar))),
+                       ('OFFSLITS', slitmask == -1)]:
+        mask[indx] = bm.turn_on(mask[indx], flag)
+    assert pypeitImage.fullmask.dtype == mask.dtype
+    assert np.array_equal(pypeitImage.fullmask, mask)
 
+    # Without the optional images; the existing mask array is reused
+    fullmask = pypeitImage.fullmask
+    pypeitImage.ivar = None
+    pypeitImage.bpm = None
+    pypeitImage.build_mask(saturation=300.)
+    assert pypeitImage.fullmask is fullmask
+    assert np.array_equal(pypeitImage.select_flag(flag='SATURATION'), img >= 300.)
+    assert not np.any(pypeitImage.select_flag(flag=['BPM', 'IVAR0', 'IVAR_NAN', 'OFFSLITS']))
@@ -5,6 +5,8 @@ import os
 
 import pytest
 
+from configobj import ConfigObj
+
 from pypeit.par import pypeitpar
 from pypeit.par.util import parse_pypeit_file
 from pypeit.spectrographs.util import load_spectrograph
@@ -23,6 +25,12 @@ def test_framegroup_types():
 def test_processimages():
     pypeitpar.ProcessImagesPar()
 
+def test_processimages_nproc():
+    par = pypeitpar.ProcessImagesPar.from_dict({'nproc': 4})
+    assert par['nproc'] == 4, 'Bad number of processes'
+    with pytest.raises(ValueError):
+        pypeitpar.ProcessImagesPar(nproc=0)
+
 def test_flatfield():
     pypeitpar.FlatFieldPar()
 
@@ -92,26 +100,19 @@ def test_pypeit():
 def test_fromcfgfile():
     pypeitpar.PypeItPar.from_cfg_file()
 
-def test_writecfg():
-    default_file = 'default.cfg'
-    if os.path.isfile(default_file):
-        os.remove(default_file)
+def test_writecfg(tmp_path):
+    default_file = str(tmp_path / 'default.cfg')
     pypeitpar.PypeItPar.from_cfg_file().to_config(cfg_file=default_file)
     assert os.path.isfile(default_file), 'No file written!'
-    os.remove(default_file)
 
-def test_readcfg():
-    default_file = 'default.cfg'
-    if not os.path.isfile(default_file):
-        pypeitpar.PypeItPar.from_cfg_file().to_config(cfg_file=default_file)
-    pypeitpar.PypeItPar.from_cfg_file('default.cfg')
-    os.remove(default_file)
+def test_readcfg(tmp_path):
+    default_file = str(tmp_path / 'default.cfg')
+    pypeitpar.PypeItPar.from_cfg_file().to_config(cfg_file=default_file)
+    pypeitpar.PypeItPar.from_cfg_file(default_file)
 
-def test_mergecfg():
+def test_mergecfg(tmp_path):
     # Create a file with the defaults
-    user_file = 'user_adjust.cfg'
-    if os.path.isfile(user_file):
-        os.remove(user_file)
+    user_file = str(tmp_path / 'user_adjust.cfg')
     p = pypeitpar.PypeItPar.from_cfg_file()
 
     # Make some modifications
@@ -130,9 +131,6 @@ def test_mergecfg():
     assert p['calibrations']['biasframe']['useframe'] == 'overscan', \
                 'Test biasframe:useframe is incorrect!'
 
-    # Clean-up
-    os.remove(user_file)
-
 def test_sync():
     p = pypeitpar.PypeItPar()
     proc = pypeitpar.ProcessImagesPar()
@@ -146,12 +144,29 @@ def test_sync():
 #    assert p['calibrations']['arcframe']['process']['cr_sigrej'] < 0
 #    assert p['calibrations']['traceframe']['process']['cr_sigrej'] == 20.5
 
+def test_update():
+    p = pypeitpar.PypeItPar()
+    lamps = ['ArI', 'NeI']
+    p.update({'flexure': {'spec_method': 'boxcar'},
+              'calibrations': {'wavelengths': {'lamps': lamps, 'n_first': 3},
+                               'arcframe': {'process': {'clip': False}}}})
+    assert p['flexure']['spec_method'] == 'boxcar'
+    assert p['calibrations']['wavelengths']['lamps'] == lamps
+    assert p['calibrations']['wavelengths']['lamps'] is not lamps, 'List should be copied'
+    assert p['calibrations']['wavelengths']['n_first'] == 3
+    assert not p['calibrations']['arcframe']['process']['clip']
+    # Other parameters are unchanged
+    assert p['calibrations']['tiltframe']['process']['clip']
+    # Values are validated
+    with pytest.raises(ValueError):
+        p.update({'flexure': {'spec_method': 'junk'}})
+
 def test_pypeit_file():
     # Read the PypeIt file
     cfg, data, frametype, usrdata, setups \
             = parse_pypeit_file(data_path('example_pypeit_file.pypeit'), file_check=False)
-    # Long-winded way of getting the spectrograph name
-    name = pypeitpar.PypeItPar.from_cfg_lines(merge_with=cfg)['rdx']['spectrograph']
+    # Get the spectrograph name directly from the user configuration
+    name = ConfigObj(cfg)['rdx']['spectrograph']
     # Instantiate the spectrograph
     spectrograph = load_spectrograph(name)
     # Get the spectrograph specific configuration
@@ -171,21 +186,22 @@ def test_pypeit_file():
 def test_telescope():
     pypeitpar.TelescopePar()
 
-def test_fail_badpar():
-    p = load_spectrograph('gemini_gnirs').default_pypeit_par()
+@pytest.fixture(scope='module')
+def gnirs_cfg():
+    # Default configuration for a spectrograph, shared by the tests below
+    return load_spectrograph('gemini_gnirs').default_pypeit_par().to_config()
 
+def test_fail_badpar(gnirs_cfg):
     # Faults because there's no junk parameter
     cfg_lines = ['[calibrations]', '[[biasframe]]', '[[[process]]]', 'junk = True']
     with pytest.raises(ValueError):
-        _p = pypeitpar.PypeItPar.from_cfg_lines(cfg_lines=p.to_config(), merge_with=cfg_lines)
+        _p = pypeitpar.PypeItPar.from_cfg_lines(cfg_lines=gnirs_cfg, merge_with=cfg_lines)
     
-def test_fail_badlevel():
-    p = load_spectrograph('gemini_gnirs').default_pypeit_par()
-
+def test_fail_badlevel(gnirs_cfg):
     # Faults because process isn't at the right level (i.e., there's no
     # process parameter for CalibrationsPar)
     cfg_lines = ['[calibrations]', '[[biasframe]]', '[[process]]', 'cr_reject = True']
     with pytest.raises(ValueError):
-        _p = pypeitpar.PypeItPar.from_cfg_lines(cfg_lines=p.to_config(), merge_with=cfg_lines)
+        _p = pypeitpar.PypeItPar.from_cfg_lines(cfg_lines=gnirs_cfg, merge_with=cfg_lines)
 
 
@@ -0,0 +1,112 @@
+"""
+Module to run tests on the reduce helper functions
+"""
+import numpy as np
+
+from pypeit import reduce
+from pypeit.core import skysub
+from pypeit.slittrace import SlitTraceSet
+
+
+def test_slit_pixel_index():
+    rng = np.random.default_rng(1)
+    slitmask = rng.choice([-1, 5, 100, 300], size=(50, 40))
+    spat_id = np.array([5, 100, 300, 7])
+    img = rng.normal(size=slitmask.shape)
+
+    order, bounds = reduce.slit_pixel_index(slitmask, spat_id)
+    assert bounds.shape == (spat_id.size, 2)
+    for i, slit_spat in enumerate(spat_id):
+        indx = order[slice(*bounds[i])]
+        thismask = slitmask == slit_spat
+        assert np.array_equal(reduce.index_to_mask(indx, slitmask.shape), thismask)
+        # Same ordering as boolean indexing
+        assert np.array_equal(img.flat[indx], img[thismask])
+    # Slit with no pixels
+    assert bounds[-1,0] == bounds[-1,1]
+
+
+def test_get_slitmask():
+    slits = SlitTraceSet(left_init=np.array([[2., 12.]]*100), right_init=np.array([[8., 18.]]*100),
+                         pypeline='MultiSlit', nspat=20, PYP_SPEC='dummy')
+    # Only the attributes needed by get_slitmask
+    red = reduce.Reduce.__new__(reduce.Reduce)
+    red.slits = slits
+    red._slitmask_cache = {}
+
+    slitmask = red.get_slitmask(flexure=None, exclude_flag=['BOXSLIT'])
+    assert np.array_equal(slitmask, slits.slit_img(flexure=None, exclude_flag=['BOXSLIT']))
+    # Cached
+    assert red.get_slitmask(flexure=None, exclude_flag=['BOXSLIT']) is slitmask
+    assert red.get_slitmask(pad=0) is not slitmask
+    # Changing the slit mask invalidates the cached image
+    slits.mask[0] = slits.bitmask.turn_on(slits.mask[0], 'USERIGNORE')
+    _slitmask = red.get_slitmask(flexure=None, exclude_flag=['BOXSLIT'])
+    assert _slitmask is not slitmask
+    assert not np.any(_slitmask == slits.spat_id[0])
+    # A new slit object is not matched to images of the old one
+    red.slits = SlitTraceSet(left_init=np.array([[2., 12.]]*100),
+                             right_init=np.array([[8., 18.]]*100),
+                             pypeline='MultiSlit', nspat=20, PYP_SPEC='dummy')
+    red.slits.mask[0] = slits.mask[0]
+    assert red.get_slitmask(flexure=None, exclude_flag=['BOXSLIT']) is not _slitmask
+
+
+def test_get_slit_pixel_index():
+    slits = SlitTraceSet(left_init=np.array([[2., 12.]]*100), right_init=np.array([[8., 18.]]*100),
+                         pypeline='MultiSlit', nspat=20, PYP_SPEC='dummy')
+    red = reduce.Reduce.__new__(reduce.Reduce)
+    red.slits = slits
+    red._slit_index_cache = None
+    red.slitmask = slits.slit_img()
+
+    order, bounds = red.get_slit_pixel_index()
+    _order, _bounds = reduce.slit_pixel_index(red.slitmask, slits.spat_id)
+    assert np.array_equal(order, _order) and np.array_equal(bounds, _bounds)
+    # Cached
+    assert red.get_slit_pixel_index()[0] is order
+    # Reassigning the slit image invalidates the cache
+    red.slitmask = red.slitmask.copy()
+    assert red.get_slit_pixel_index()[0] is not order
+
+
+def test_map_slits():
+    # Two slits with a sky spectrum that only depends on the spectral
+    # position
+    nspec, nspat = 100, 40
+    spec = np.arange(nspec, dtype=float)
+    sciimg = np.tile(10. + 5.*np.sin(spec/10.), (nspat, 1)).T
+    sciivar = np.ones_like(sciimg)
+    tilts = np.tile(spec/(nspec-1), (nspat, 1)).T
+    slitmask = np.full(sciimg.shape, -1, dtype=int)
+    slitmask[:,2:18] = 10
+    slitmask[:,22:38] = 30
+    spat_id = np.array([10, 30])
+    left = np.array([[2., 22.]]*nspec)
+    righ = np.array([[17., 37.]]*nspec)
+
+    order, bounds = reduce.slit_pixel_index(slitmask, spat_id)
+    indx = [order[slice(*b)] for b in bounds]
+    gpm = [np.ones(i.size, dtype=bool) for i in indx]
+    args = (indx, gpm, list(left.T), list(righ.T))
+    sky = reduce.map_slits(reduce._global_skysub_slit, (sciimg, sciivar, tilts), *args,
+                           nproc=1, no_poly=True)
+    assert len(sky) == 2
+    for i, s in zip(indx, sky):
+        assert np.allclose(s, sciimg.flat[i], atol=1e-3)
+    # The fit to the columns spanned by each slit is identical to the fit to
+    # the full image
+    rng = np.random.default_rng(2)
+    noisy = sciimg + rng.normal(scale=0.1, size=sciimg.shape)
+    left = left + 0.3
+    for i, _left, _righ, s in zip(indx, left.T, righ.T,
+                                  reduce.map_slits(reduce._global_skysub_slit,
+                                                   (noisy, sciivar, tilts), *args[:2],
+                                                   list(left.T), list(righ.T))):
+        thismask = reduce.index_to_mask(i, slitmask.shape)
+        assert np.array_equal(s, skysub.global_skysub(noisy, sciivar, tilts, thismask, _left,
+                                                      _righ, inmask=thismask))
+    # Same result using worker processes
+    _sky = reduce.map_slits(reduce._global_skysub_slit, (sciimg, sciivar, tilts), *args,
+                            nproc=2, no_poly=True)
+    assert all(np.array_equal(s, _s) for s, _s in zip(sky, _sky))
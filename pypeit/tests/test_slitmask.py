@@ -10,7 +10,7 @@ from IPython import embed
 from astropy.io import fits
 
 from pypeit.images import buildimage
-from pypeit import edgetrace, slittrace, specobjs
+from pypeit import edgetrace, slittrace, specobj, specobjs
 from pypeit.spectrographs.keck_deimos import KeckDEIMOSSpectrograph
 from pypeit.spectrographs.util import load_spectrograph
 from pypeit.tests.tstutils import dev_suite_required, cooked_required
@@ -209,3 +209,206 @@ def test_deimosslitmask():
     spec.get_slitmask(f)
     assert spec.slitmask.nslits == 106, 'Incorrect number of slits read!'
 
+
+
+def test_objects():
+    from pypeit.spectrographs.slitmask import SlitMask
+    corners = numpy.zeros((2,4,2))
+    objects = numpy.array([[11, 1, 10.1, -1.2, 'a', 20.5, 'R', 1.5, 2.5],
+                           [10, 2, 10.2, -1.3, 'bb', 21.5, 'I', 1.0, 3.0],
+                           [11, 3, 10.3, -1.4, 'c', 22.5, 'R', 2.0, 2.0]])
+    slitmask = SlitMask(corners, slitid=[10, 11], objects=objects)
+    # The 2D array is converted to a structured array with native types
+    assert slitmask.objects.dtype.names == tuple(n for n, _ in SlitMask.object_fields)
+    assert numpy.array_equal(slitmask.objects['slitid'], [11, 10, 11])
+    assert numpy.allclose(slitmask.objects['mag'], [20.5, 21.5, 22.5])
+    assert slitmask.objects['name'][1] == 'bb'
+    assert numpy.array_equal(slitmask.slitindx, [1, 0, 1])
+    # Structured arrays are used directly
+    _slitmask = SlitMask(corners, slitid=[10, 11], objects=slitmask.objects)
+    assert numpy.array_equal(_slitmask.objects, slitmask.objects)
+    with pytest.raises(ValueError):
+        SlitMask(corners, slitid=[10, 11], objects=objects[:,:8])
+
+
+def _loop_maskdef_slitedges(bedge_img, tedge_img, ccd_b, ccd_t, bedge_pix, tedge_pix,
+                            sortindx, ccdnum):
+    """
+    Slit-by-slit construction of the mask-design edges, used to check
+    :func:`~pypeit.spectrographs.keck_deimos.KeckDEIMOSSpectrograph.get_maskdef_slitedges`.
+    """
+    omodel_bspat = numpy.zeros(bedge_pix.shape[0])
+    omodel_tspat = numpy.zeros(bedge_pix.shape[0])
+    for i in range(omodel_bspat.size):
+        omodel_bspat[i] = -1 if bedge_pix[i, ccd_b[i, :] == ccdnum].shape[0] < 10 else \
+                          numpy.median(bedge_pix[i, ccd_b[i, :] == ccdnum])
+        omodel_tspat[i] = -1 if tedge_pix[i, ccd_t[i, :] == ccdnum].shape[0] < 10 else \
+                          numpy.median(tedge_pix[i, ccd_t[i, :] == ccdnum])
+        whgood = numpy.where(tedge_img[i, :] > -1e4)[0]
+        npt_img = whgood.shape[0] // 2
+        whgood = whgood[:npt_img] if ccdnum <= 4 else whgood[npt_img:]
+        if omodel_bspat[i] == -1 and omodel_tspat[i] >= 0:
+            omodel_bspat[i] = omodel_tspat[i] - numpy.median((tedge_img - bedge_img)[i, whgood])
+        if omodel_tspat[i] == -1 and omodel_bspat[i] >= 0:
+            omodel_tspat[i] = omodel_bspat[i] + numpy.median((tedge_img - bedge_img)[i, whgood])
+        if omodel_bspat[i] > omodel_tspat[i]:
+            omodel_bspat[i], omodel_tspat[i] = omodel_tspat[i], omodel_bspat[i]
+    for i in range(sortindx.size - 1):
+        if omodel_tspat[sortindx][i] != -1 and omodel_bspat[sortindx][i+1] != -1 and \
+                omodel_tspat[sortindx][i] > omodel_bspat[sortindx][i+1]:
+            diff = omodel_tspat[sortindx][i] - omodel_bspat[sortindx][i+1]
+            omodel_tspat[sortindx[i]] -= diff/2.
+            omodel_bspat[sortindx[i+1]] += diff/2. + 0.1
+    return omodel_bspat, omodel_tspat
+
+
+def test_maskdef_slitedges():
+    from pypeit.spectrographs.slitmask import SlitMask
+    rng = numpy.random.default_rng(1)
+    nslits, nwave = 7, 40
+
+    # Slit number k from left to right in the mask is slit order[k]
+    order = numpy.array([3, 0, 5, 1, 6, 2, 4])
+    xc = numpy.empty(nslits, dtype=float)
+    xc[order] = numpy.arange(nslits) * 10.
+    corners = numpy.zeros((nslits, 4, 2), dtype=float)
+    corners[:,:,0] = xc[:,None] + numpy.array([-2., 2., 2., -2.])[None,:]
+    corners[:,:,1] = numpy.array([1., 1., -1., -1.])[None,:]
+
+    # Predicted edges, in order from left to right
+    bpix = 100. * (numpy.arange(nslits) + 1)[:,None] + rng.normal(scale=0.5, size=(nslits, nwave))
+    tpix = bpix + 50. + rng.normal(scale=0.5, size=(nslits, nwave))
+    ccd_b = numpy.full((nslits, nwave), 3, dtype=int)
+    ccd_t = numpy.full((nslits, nwave), 3, dtype=int)
+    # Bottom edge is off the detector, except for too few points
+    ccd_b[1] = 2
+    ccd_b[1,:5] = 3
+    # Top edge is on one of the red detectors
+    ccd_t[2] = 7
+    # Bottom and top edges are swapped
+    bpix[3], tpix[3] = tpix[3].copy(), bpix[3].copy()
+    # Overlapping slits
+    bpix[5] -= 70.
+    # Slit off the detectors
+    ccd_b[6] = -1
+    ccd_t[6] = -1
+    # Image-plane positions, with some invalid values
+    bimg = bpix + 1000.
+    timg = bimg + numpy.linspace(40., 60., nwave)[None,:]
+    timg[:,:4] = -1e5
+
+    # Reorder by slit
+    bedge_pix, tedge_pix = numpy.empty_like(bpix), numpy.empty_like(tpix)
+    bedge_pix[order], tedge_pix[order] = bpix, tpix
+    _ccd_b, _ccd_t = numpy.empty_like(ccd_b), numpy.empty_like(ccd_t)
+    _ccd_b[order], _ccd_t[order] = ccd_b, ccd_t
+    bedge_img, tedge_img = numpy.empty_like(bimg), numpy.empty_like(timg)
+    bedge_img[order], tedge_img[order] = bimg, timg
+
+    def mask_to_pixel_coordinates(x=None, y=None, **kwargs):
+        # Both edges are propagated at once, bottom first
+        assert len(x) == 2*nslits
+        img = numpy.concatenate((bedge_img, tedge_img))
+        return img, numpy.zeros_like(img), numpy.concatenate((_ccd_b, _ccd_t)), \
+                    numpy.concatenate((bedge_pix, tedge_pix)), numpy.zeros_like(img)
+
+    spec = KeckDEIMOSSpectrograph()
+    spec.slitmask = SlitMask(corners, slitid=numpy.arange(nslits)+100)
+    spec.amap = spec.bmap = True
+    spec.mask_to_pixel_coordinates = mask_to_pixel_coordinates
+
+    for ccdnum in [3, 7]:
+        bspat, tspat, sortindx, _ = spec.get_maskdef_slitedges(ccdnum=ccdnum)
+        assert numpy.array_equal(sortindx, order), 'Bad slit order'
+        _bspat, _tspat = _loop_maskdef_slitedges(bedge_img, tedge_img, _ccd_b, _ccd_t,
+                                                 bedge_pix, tedge_pix, sortindx, ccdnum)
+        assert numpy.allclose(bspat, _bspat), 'Bad bottom edges'
+        assert numpy.allclose(tspat, _tspat), 'Bad top edges'
+
+    # Check the individual cases for the blue detector
+    bspat, tspat, sortindx, _ = spec.get_maskdef_slitedges(ccdnum=3)
+    bspat, tspat = bspat[order], tspat[order]
+    assert numpy.all(bspat[:6] < tspat[:6]), 'Edges should be ordered'
+    # Filled in from the image-plane width
+    assert numpy.isclose(tspat[1] - bspat[1], numpy.median(numpy.linspace(40., 60., nwave)[4:22]))
+    assert numpy.isclose(tspat[2] - bspat[2], numpy.median(numpy.linspace(40., 60., nwave)[4:22]))
+    # Swapped
+    assert numpy.isclose(bspat[3], numpy.median(tpix[3]))
+    # Overlap removed
+    assert numpy.isclose(bspat[5] - tspat[4], 0.1)
+    # Off the detector
+    assert bspat[6] == -1 and tspat[6] == -1
+
+
+def test_spec1d_match_spectra():
+    from pypeit.pypmsgs import PypeItError
+
+    def _sobjs(det, ra, dec, name):
+        sobjs = specobjs.SpecObjs()
+        for i in range(len(det)):
+            sobj = specobj.SpecObj('MultiSlit', det[i], SLITID=i)
+            sobj.RA = ra[i]
+            sobj.DEC = dec[i]
+            sobj.MASKDEF_OBJNAME = name[i]
+            sobjs.add_sobj(sobj)
+        return sobjs
+
+    def _loop_match(sobjs):
+        # Object-by-object matching of the blue and red spectra
+        good_obj = sobjs.MASKDEF_OBJNAME != 'SERENDIP'
+        ridx = numpy.where((sobjs.DET > 4) & good_obj)[0]
+        bmt, rmt = [], []
+        for ibobj in numpy.where((sobjs.DET <= 4) & good_obj)[0]:
+            mtc = sobjs[ibobj].RA == sobjs[ridx].RA
+            if numpy.sum(mtc) == 1:
+                bmt.append(ibobj)
+                rmt.append(ridx[mtc][0])
+        return numpy.array(bmt, dtype=int), numpy.array(rmt, dtype=int)
+
+    spec = KeckDEIMOSSpectrograph()
+    det = [1, 5, 2, 6, 3, 7, 3, 8, 4]
+    ra = [10.1, 10.3, 10.2, 10.1, 10.4, 10.4, 10.5, 10.6, 10.2]
+    dec = [1.1, 1.3, 1.2, 1.1, 1.4, 1.4, 1.5, 1.6, 1.2]
+    #   - Objects 4 and 5 are serendips, and objects 2, 6, and 8 have no red match
+    name = ['a', 'c', 'b', 'a', 'SERENDIP', 'SERENDIP', 'd', 'e', 'b']
+    sobjs = _sobjs(det, ra, dec, name)
+    bmt, rmt = spec.spec1d_match_spectra(sobjs)
+    _bmt, _rmt = _loop_match(sobjs)
+    assert numpy.array_equal(bmt, _bmt) and numpy.array_equal(rmt, _rmt), \
+        'Different matches from object-by-object search'
+    assert numpy.array_equal(bmt, [0]) and numpy.array_equal(rmt, [3]), 'Bad match'
+
+    # Matches blue objects to the red objects with the same RA
+    det = [1, 5, 2, 6, 3]
+    ra = [10.1, 10.2, 10.2, 10.1, 10.3]
+    dec = [1.1, 1.2, 1.2, 1.1, 1.3]
+    sobjs = _sobjs(det, ra, dec, ['a', 'b', 'b', 'a', 'c'])
+    bmt, rmt = spec.spec1d_match_spectra(sobjs)
+    _bmt, _rmt = _loop_match(sobjs)
+    assert numpy.array_equal(bmt, _bmt) and numpy.array_equal(rmt, _rmt), \
+        'Different matches from object-by-object search'
+    assert numpy.array_equal(bmt, [0, 2]) and numpy.array_equal(rmt, [3, 1]), 'Bad match'
+
+    # Multiple red matches
+    sobjs = _sobjs([1, 5, 6], [10.1, 10.1, 10.1], [1.1, 1.1, 1.1], ['a', 'a', 'b'])
+    with pytest.raises(PypeItError):
+        spec.spec1d_match_spectra(sobjs)
+
+    # Declination does not match
+    sobjs = _sobjs([1, 5], [10.1, 10.1], [1.1, 1.2], ['a', 'a'])
+    with pytest.raises(PypeItError):
+        spec.spec1d_match_spectra(sobjs)
+
+
+def test_open_maskdef(tmp_path):
+    from pypeit.spectrographs.keck_deimos import _open_maskdef
+    ofile = tmp_path / 'tst_maskdef.fits'
+    hdu = fits.HDUList([fits.PrimaryHDU()])
+    hdu.writeto(str(ofile))
+    # Open files are used directly
+    assert _open_maskdef(hdu) is hdu
+    # File names can be strings or paths
+    for f in [str(ofile), ofile]:
+        _hdu = _open_maskdef(f)
+        assert isinstance(_hdu, fits.HDUList)
+        _hdu.close()
@@ -2,6 +2,7 @@
 Module to run tests on SpecObjs
 """
 import os
+import pickle
 
 import numpy as np
 import pytest
@@ -82,6 +83,16 @@ def test_set(sobj1, sobj2, sobj3):
     assert sobjs.PYPELINE[0] == 'MultiSlit'
 
 
+def test_pickle(sobj1, sobj2):
+    # Needed to send the objects to worker processes
+    sobjs = specobjs.SpecObjs([sobj1,sobj2])
+    sobjs[0]['BOX_WAVE'] = np.arange(10).astype(float)
+    _sobjs = pickle.loads(pickle.dumps(sobjs))
+    assert _sobjs.nobj == 2
+    assert np.array_equal(_sobjs.SLITID, sobjs.SLITID)
+    assert np.array_equal(_sobjs[0].BOX_WAVE, sobjs[0].BOX_WAVE)
+
+
 def test_io(sobj1, sobj2, sobj3, sobj4):
     sobjs = specobjs.SpecObjs([sobj1,sobj2,sobj3,sobj4])
     sobjs[0]['BOX_WAVE'] = np.arange(1000).astype(float)
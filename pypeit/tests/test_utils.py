@@ -23,6 +23,12 @@ def test_calc_ivar():
     res = utils.inverse(x)
     assert np.array_equal(res, np.array([0.0, 0.0, 0.0, 10.0, 1.0]))
     assert np.array_equal(utils.calc_ivar(res), np.array([0.0, 0.0, 0.0, 0.1, 1.0]))
+    # In place
+    _x = x.copy()
+    assert utils.inverse(_x, out=_x) is _x
+    assert np.array_equal(_x, res)
+    # NaNs propagate
+    assert np.isnan(utils.inverse(np.array([np.nan]))[0])
 
 
 def test_nearest_unmasked():
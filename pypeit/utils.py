@@ -729,7 +729,7 @@ def clip_ivar(flux, ivar, sn_clip, gpm=None, verbose=False):
     return np.minimum(ivar, ivar_cap)
 
 
-def inverse(array):
+def inverse(array, out=None):
     """
     Calculate and return the inverse of the input array, enforcing
     positivity and setting values <= 0 to zero.  The input array should
@@ -740,14 +740,31 @@ def inverse(array):
 
     is returned.
 
+    For arrays, the calculation is done with a single masked division that
+    avoids the full-size temporary arrays created by the expression above.
+
     Args:
         array (`numpy.ndarray`_):
             Array to invert
+        out (`numpy.ndarray`_, optional):
+            Array used to hold the result, which must have the same shape
+            as ``array``.  This can be ``array`` itself, in which case the
+            calculation is done in place.  If None, a new array is
+            allocated.
 
     Returns:
         `numpy.ndarray`_: Result of controlled ``1/array`` calculation.
     """
-    return (array > 0.0)/(np.abs(array) + (array == 0.0))
+    if np.ndim(array) == 0 or isinstance(array, np.ma.MaskedArray):
+        return (array > 0.0)/(np.abs(array) + (array == 0.0))
+    array = np.asarray(array)
+    # NOTE: NaNs are *not* flagged and propagate to the output, as above
+    bpm = array <= 0.0
+    if out is None:
+        out = np.zeros(array.shape, dtype=np.result_type(1., array))
+    else:
+        out[bpm] = 0.
+    return np.divide(1., array, out=out, where=np.logical_not(bpm))
 
 
 def calc_ivar(varframe):